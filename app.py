@@ -1,61 +1,13 @@
 #!/usr/bin/env python3
-import os
-
 import aws_cdk as cdk
 
-from domains.domains_4n6ircom import Domains4n6irCom
-from domains.domains_lukachio import DomainsLukachIo
-from domains.domains_lukachnet import DomainsLukachNet
-from domains.domains_stack import DomainsStack
+from domains.domains_app import selected, tags
 
 app = cdk.App()
 
-Domains4n6irCom(
-    app, 'Domains4n6irCom',
-    env = cdk.Environment(
-        account = os.getenv('CDK_DEFAULT_ACCOUNT'),
-        region = 'us-east-1'
-    ),
-    synthesizer = cdk.DefaultStackSynthesizer(
-        qualifier = 'lukach'
-    )
-)
-
-DomainsLukachIo(
-    app, 'DomainsLukachIo',
-    env = cdk.Environment(
-        account = os.getenv('CDK_DEFAULT_ACCOUNT'),
-        region = 'us-east-1'
-    ),
-    synthesizer = cdk.DefaultStackSynthesizer(
-        qualifier = 'lukach'
-    )
-)
-
-DomainsLukachNet(
-    app, 'DomainsLukachNet',
-    env = cdk.Environment(
-        account = os.getenv('CDK_DEFAULT_ACCOUNT'),
-        region = 'us-east-1'
-    ),
-    synthesizer = cdk.DefaultStackSynthesizer(
-        qualifier = 'lukach'
-    )
-)
-
-DomainsStack(
-    app, 'DomainsStack',
-    env = cdk.Environment(
-        account = os.getenv('CDK_DEFAULT_ACCOUNT'),
-        region = 'us-east-1'
-    ),
-    synthesizer = cdk.DefaultStackSynthesizer(
-        qualifier = 'lukach'
-    )
-)
+for factory in selected(app).values():
+    factory(app)
 
-cdk.Tags.of(app).add('Alias','domains')
-cdk.Tags.of(app).add('GitHub','https://github.com/jblukach/domains')
-cdk.Tags.of(app).add('Org','lukach.io')
+tags(app)
 
 app.synth()
\ No newline at end of file
@@ -0,0 +1,110 @@
+import base64
+import gzip
+import json
+import os
+
+FIELDS = (
+    'timestamp',
+    'zone_id',
+    'qname',
+    'qtype',
+    'rcode',
+    'protocol',
+    'edge',
+    'resolver',
+    'subnet'
+)
+
+BATCH = 500
+
+ATTEMPTS = 3
+
+def parse(message):
+    fields = message.split()
+    if len(fields) < 9 or fields[0] != '1.0':
+        return None
+    row = dict(zip(FIELDS, fields[1:10]))
+    row.setdefault('subnet', '-')
+    row['qname'] = row['qname'].lower().rstrip('.')
+    return row
+
+def decode(data):
+    raw = base64.b64decode(data)
+    if raw[:2] != b'\x1f\x8b':
+        payload = json.loads(raw)
+        return payload['zone'], payload['rows']
+    payload = json.loads(gzip.decompress(raw))
+    if payload.get('messageType') != 'DATA_MESSAGE':
+        return None, []
+    rows = [row for row in (parse(item['message']) for item in payload['logEvents']) if row is not None]
+    return payload['logGroup'].rsplit('/', 1)[-1], rows
+
+def partition(rows):
+    dates = {}
+    for row in rows:
+        dates.setdefault(row['timestamp'][:10], []).append(row)
+    return dates
+
+def reingest(items, client = None):
+    if client is None:
+        import boto3
+        client = boto3.client('firehose')
+    for start in range(0, len(items), BATCH):
+        pending = items[start:start+BATCH]
+        for attempt in range(ATTEMPTS):
+            response = client.put_record_batch(
+                DeliveryStreamName = os.environ['STREAM'],
+                Records = pending
+            )
+            if response['FailedPutCount'] == 0:
+                break
+            pending = [item for item, result in zip(pending, response['RequestResponses']) if 'ErrorCode' in result]
+        else:
+            raise RuntimeError(str(len(pending))+' records could not be reingested')
+
+def handler(event, context):
+
+    output = []
+    others = []
+
+    for record in event['records']:
+
+        zone, rows = decode(record['data'])
+
+        if not rows:
+            output.append(
+                {
+                    'recordId': record['recordId'],
+                    'result': 'Dropped',
+                    'data': record['data']
+                }
+            )
+            continue
+
+        dates = partition(rows)
+        date = min(dates)
+
+        for other in sorted(dates):
+            if other != date:
+                others.append({'Data': json.dumps({'zone': zone, 'rows': dates[other]}, separators = (',', ':')).encode()})
+
+        data = ''.join(json.dumps(row, separators = (',', ':'))+'\n' for row in dates[date])
+
+        output.append(
+            {
+                'recordId': record['recordId'],
+                'result': 'Ok',
+                'data': base64.b64encode(data.encode()).decode(),
+                'metadata': {
+                    'partitionKeys': {
+                        'zone': zone,
+                        'date': date
+                    }
+                }
+            }
+        )
+
+    if others:
+        reingest(others)
+
+    return {'records': output}
@@ -0,0 +1,119 @@
+from aws_cdk import (
+    Duration,
+    RemovalPolicy,
+    Stack,
+    aws_cloudfront as _cloudfront,
+    aws_iam as _iam,
+    aws_logs as _logs,
+    aws_s3 as _s3,
+    aws_ssm as _ssm
+)
+
+from constructs import Construct
+
+PREFIX = 'cloudfront'
+
+SUFFIX = '{DistributionId}/{yyyy}/{MM}/{dd}/{HH}'
+
+class DomainsAccessLogs(Construct):
+
+    def __init__(self, scope: Construct, construct_id: str, slug: str, parameter_name: str, **kwargs) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        account = Stack.of(self).account
+        region = Stack.of(self).region
+
+        self.slug = slug
+        self.previous = None
+
+    ### S3 BUCKET ###
+
+        self.bucket = _s3.Bucket(
+            self, 'bucket',
+            encryption = _s3.BucketEncryption.S3_MANAGED,
+            block_public_access = _s3.BlockPublicAccess.BLOCK_ALL,
+            removal_policy = RemovalPolicy.RETAIN,
+            enforce_ssl = True,
+            versioned = False,
+            lifecycle_rules = [
+                _s3.LifecycleRule(
+                    transitions = [
+                        _s3.Transition(
+                            storage_class = _s3.StorageClass.INTELLIGENT_TIERING,
+                            transition_after = Duration.days(0)
+                        )
+                    ],
+                    expiration = Duration.days(395)
+                )
+            ]
+        )
+
+        self.bucket.add_to_resource_policy(
+            _iam.PolicyStatement(
+                principals = [
+                    _iam.ServicePrincipal('delivery.logs.amazonaws.com')
+                ],
+                actions = [
+                    's3:PutObject'
+                ],
+                resources = [
+                    self.bucket.arn_for_objects(PREFIX+'/*')
+                ],
+                conditions = {
+                    'StringEquals': {
+                        's3:x-amz-acl': 'bucket-owner-full-control',
+                        'aws:SourceAccount': account
+                    },
+                    'ArnLike': {
+                        'aws:SourceArn': 'arn:aws:logs:'+region+':'+account+':delivery-source:*'
+                    }
+                }
+            )
+        )
+
+        _ssm.StringParameter(
+            self, 'parameter',
+            description = slug+' cloudfront access logs',
+            parameter_name = parameter_name+'/accesslogs',
+            string_value = self.bucket.bucket_name,
+            tier = _ssm.ParameterTier.STANDARD
+        )
+
+    ### DELIVERY DESTINATION ###
+
+        self.destination = _logs.CfnDeliveryDestination(
+            self, 'destination',
+            name = 'domains-'+slug+'-accesslogs',
+            destination_resource_arn = self.bucket.arn_for_objects(PREFIX),
+            output_format = 'w3c'
+        )
+
+    def add(self, name: str, distribution: _cloudfront.IDistribution) -> _logs.CfnDelivery:
+
+    ### DELIVERY SOURCE ###
+
+        source = _logs.CfnDeliverySource(
+            self, name+'source',
+            name = 'domains-'+self.slug+'-'+name,
+            log_type = 'ACCESS_LOGS',
+            resource_arn = distribution.distribution_arn
+        )
+
+    ### DELIVERY ###
+
+        delivery = _logs.CfnDelivery(
+            self, name+'delivery',
+            delivery_source_name = source.name,
+            delivery_destination_arn = self.destination.attr_arn,
+            s3_suffix_path = SUFFIX,
+            s3_enable_hive_compatible_path = True
+        )
+
+        delivery.add_resource_dependency(source)
+
+        if self.previous is not None:
+            delivery.add_resource_dependency(self.previous)
+
+        self.previous = delivery
+
+        return delivery
@@ -0,0 +1,74 @@
+import fnmatch
+import os
+
+import aws_cdk as cdk
+
+from domains.domains_config import SPECS
+from domains.domains_dashboard import STACK as DASHBOARD, build as dashboard
+from domains.domains_redirects import STACK, build as redirects
+from domains.domains_replica import build as replicate, region as replica_region, stack_name
+from domains.domains_stack import DomainsStack
+from domains.domains_zone import build
+
+def environment(region = 'us-east-1'):
+    return {
+        'env': cdk.Environment(
+            account = os.getenv('CDK_DEFAULT_ACCOUNT'),
+            region = region
+        ),
+        'synthesizer': cdk.DefaultStackSynthesizer(
+            qualifier = 'lukach'
+        )
+    }
+
+def replica(spec, parent):
+    return lambda app: replicate(app, spec, parent(app), **environment(replica_region(spec)))
+
+def zone(spec, shared = None):
+    def factory(app):
+        stack = build(app, spec, **environment())
+        if shared is not None:
+            stack.add_stack_dependency(shared(app))
+        return stack
+    return factory
+
+def shared(specs):
+    return lambda app: redirects(app, specs, **environment())
+
+def monitor(stacks):
+    def factory(app):
+        return dashboard(app, [create(app) for create in stacks.values()], **environment())
+    return factory
+
+def factories():
+    stacks = {}
+    specs = tuple(spec for spec in SPECS if spec.shared)
+    if specs:
+        stacks[STACK] = shared(specs)
+    for spec in SPECS:
+        stacks[spec.stack] = zone(spec, stacks[STACK] if spec.consolidated else None)
+        if replica_region(spec) is not None:
+            stacks[stack_name(spec)] = replica(spec, stacks[spec.stack])
+    stacks[DASHBOARD] = monitor(dict(stacks))
+    stacks['DomainsStack'] = lambda app: DomainsStack(app, 'DomainsStack', **environment())
+    return stacks
+
+def selected(app):
+    stacks = factories()
+    value = app.node.try_get_context('stacks') or os.getenv('DOMAINS_STACKS')
+
+    if not value:
+        return stacks
+
+    patterns = [pattern.strip() for pattern in value.split(',') if pattern.strip()]
+    names = [name for name in stacks if any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)]
+
+    if not names:
+        raise ValueError('No stacks match '+value+', expected one of '+', '.join(stacks))
+
+    return {name: stacks[name] for name in names}
+
+def tags(app):
+    cdk.Tags.of(app).add('Alias','domains')
+    cdk.Tags.of(app).add('GitHub','https://github.com/jblukach/domains')
+    cdk.Tags.of(app).add('Org','lukach.io')
@@ -0,0 +1,269 @@
+from aws_cdk import (
+    Duration,
+    RemovalPolicy,
+    Stack,
+    aws_glue as _glue,
+    aws_iam as _iam,
+    aws_kinesisfirehose as _firehose,
+    aws_lambda as _lambda,
+    aws_logs as _logs,
+    aws_s3 as _s3,
+    aws_ssm as _ssm
+)
+
+from constructs import Construct
+
+COLUMNS = [
+    ('timestamp', 'timestamp'),
+    ('zone_id', 'string'),
+    ('qname', 'string'),
+    ('qtype', 'string'),
+    ('rcode', 'string'),
+    ('protocol', 'string'),
+    ('edge', 'string'),
+    ('resolver', 'string'),
+    ('subnet', 'string')
+]
+
+class DomainsArchive(Construct):
+
+    def __init__(self, scope: Construct, construct_id: str, logs: _logs.ILogGroup, slug: str, parameter_name: str, **kwargs) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        account = Stack.of(self).account
+        region = Stack.of(self).region
+
+    ### S3 BUCKET ###
+
+        self.bucket = _s3.Bucket(
+            self, 'bucket',
+            encryption = _s3.BucketEncryption.S3_MANAGED,
+            block_public_access = _s3.BlockPublicAccess.BLOCK_ALL,
+            removal_policy = RemovalPolicy.RETAIN,
+            enforce_ssl = True,
+            versioned = False,
+            lifecycle_rules = [
+                _s3.LifecycleRule(
+                    transitions = [
+                        _s3.Transition(
+                            storage_class = _s3.StorageClass.INTELLIGENT_TIERING,
+                            transition_after = Duration.days(0)
+                        )
+                    ]
+                ),
+                _s3.LifecycleRule(
+                    prefix = 'errors/',
+                    expiration = Duration.days(30)
+                )
+            ]
+        )
+
+        _ssm.StringParameter(
+            self, 'parameter',
+            description = slug+' query log archive',
+            parameter_name = parameter_name+'/archive',
+            string_value = self.bucket.bucket_name,
+            tier = _ssm.ParameterTier.STANDARD
+        )
+
+    ### GLUE TABLE ###
+
+        database = _glue.CfnDatabase(
+            self, 'database',
+            catalog_id = account,
+            database_input = _glue.CfnDatabase.DatabaseInputProperty(
+                name = 'route53_'+slug
+            )
+        )
+
+        table = _glue.CfnTable(
+            self, 'table',
+            catalog_id = account,
+            database_name = 'route53_'+slug,
+            table_input = _glue.CfnTable.TableInputProperty(
+                name = 'querylogs',
+                table_type = 'EXTERNAL_TABLE',
+                parameters = {
+                    'classification': 'parquet',
+                    'projection.enabled': 'true',
+                    'projection.zone.type': 'enum',
+                    'projection.zone.values': slug,
+                    'projection.date.type': 'date',
+                    'projection.date.format': 'yyyy-MM-dd',
+                    'projection.date.range': '2024-01-01,NOW',
+                    'storage.location.template': 's3://'+self.bucket.bucket_name+'/zone=${zone}/date=${date}/'
+                },
+                partition_keys = [
+                    _glue.CfnTable.ColumnProperty(name = 'zone', type = 'string'),
+                    _glue.CfnTable.ColumnProperty(name = 'date', type = 'string')
+                ],
+                storage_descriptor = _glue.CfnTable.StorageDescriptorProperty(
+                    location = 's3://'+self.bucket.bucket_name+'/',
+                    input_format = 'org.apache.hadoop.hive.ql.io.parquet.MapredParquetInputFormat',
+                    output_format = 'org.apache.hadoop.hive.ql.io.parquet.MapredParquetOutputFormat',
+                    serde_info = _glue.CfnTable.SerdeInfoProperty(
+                        serialization_library = 'org.apache.hadoop.hive.ql.io.parquet.serde.ParquetHiveSerDe'
+                    ),
+                    columns = [
+                        _glue.CfnTable.ColumnProperty(name = name, type = column_type)
+                        for name, column_type in COLUMNS
+                    ]
+                )
+            )
+        )
+
+        table.add_resource_dependency(database)
+
+    ### LAMBDA FUNCTION ###
+
+        stream_name = 'route53-'+slug
+
+        archivelogs = _logs.LogGroup(
+            self, 'archivelogs',
+            retention = _logs.RetentionDays.ONE_MONTH,
+            removal_policy = RemovalPolicy.DESTROY
+        )
+
+        function = _lambda.Function(
+            self, 'function',
+            runtime = _lambda.Runtime.PYTHON_3_13,
+            architecture = _lambda.Architecture.ARM_64,
+            code = _lambda.Code.from_asset('archive'),
+            handler = 'archive.handler',
+            timeout = Duration.minutes(1),
+            memory_size = 512,
+            environment = {
+                'STREAM': stream_name
+            },
+            log_group = archivelogs
+        )
+
+        function.add_to_role_policy(
+            _iam.PolicyStatement(
+                actions = [
+                    'firehose:PutRecordBatch'
+                ],
+                resources = [
+                    'arn:aws:firehose:'+region+':'+account+':deliverystream/'+stream_name
+                ]
+            )
+        )
+
+    ### FIREHOSE ###
+
+        role = _iam.Role(
+            self, 'role',
+            assumed_by = _iam.ServicePrincipal('firehose.amazonaws.com')
+        )
+
+        self.bucket.grant_read_write(role)
+        function.grant_invoke(role)
+
+        role.add_to_policy(
+            _iam.PolicyStatement(
+                actions = [
+                    'glue:GetTable',
+                    'glue:GetTableVersion',
+                    'glue:GetTableVersions'
+                ],
+                resources = [
+                    'arn:aws:glue:'+region+':'+account+':catalog',
+                    'arn:aws:glue:'+region+':'+account+':database/route53_'+slug,
+                    'arn:aws:glue:'+region+':'+account+':table/route53_'+slug+'/querylogs'
+                ]
+            )
+        )
+
+        self.stream = _firehose.CfnDeliveryStream(
+            self, 'stream',
+            delivery_stream_name = stream_name,
+            delivery_stream_type = 'DirectPut',
+            extended_s3_destination_configuration = _firehose.CfnDeliveryStream.ExtendedS3DestinationConfigurationProperty(
+                bucket_arn = self.bucket.bucket_arn,
+                role_arn = role.role_arn,
+                prefix = 'zone=!{partitionKeyFromLambda:zone}/date=!{partitionKeyFromLambda:date}/',
+                error_output_prefix = 'errors/!{firehose:error-output-type}/!{timestamp:yyyy-MM-dd}/',
+                buffering_hints = _firehose.CfnDeliveryStream.BufferingHintsProperty(
+                    interval_in_seconds = 900,
+                    size_in_m_bs = 128
+                ),
+                dynamic_partitioning_configuration = _firehose.CfnDeliveryStream.DynamicPartitioningConfigurationProperty(
+                    enabled = True
+                ),
+                processing_configuration = _firehose.CfnDeliveryStream.ProcessingConfigurationProperty(
+                    enabled = True,
+                    processors = [
+                        _firehose.CfnDeliveryStream.ProcessorProperty(
+                            type = 'Lambda',
+                            parameters = [
+                                _firehose.CfnDeliveryStream.ProcessorParameterProperty(
+                                    parameter_name = 'LambdaArn',
+                                    parameter_value = function.function_arn
+                                ),
+                                _firehose.CfnDeliveryStream.ProcessorParameterProperty(
+                                    parameter_name = 'BufferSizeInMBs',
+                                    parameter_value = '0.5'
+                                ),
+                                _firehose.CfnDeliveryStream.ProcessorParameterProperty(
+                                    parameter_name = 'BufferIntervalInSeconds',
+                                    parameter_value = '60'
+                                )
+                            ]
+                        )
+                    ]
+                ),
+                data_format_conversion_configuration = _firehose.CfnDeliveryStream.DataFormatConversionConfigurationProperty(
+                    enabled = True,
+                    input_format_configuration = _firehose.CfnDeliveryStream.InputFormatConfigurationProperty(
+                        deserializer = _firehose.CfnDeliveryStream.DeserializerProperty(
+                            open_x_json_ser_de = _firehose.CfnDeliveryStream.OpenXJsonSerDeProperty()
+                        )
+                    ),
+                    output_format_configuration = _firehose.CfnDeliveryStream.OutputFormatConfigurationProperty(
+                        serializer = _firehose.CfnDeliveryStream.SerializerProperty(
+                            parquet_ser_de = _firehose.CfnDeliveryStream.ParquetSerDeProperty(
+                                compression = 'SNAPPY'
+                            )
+                        )
+                    ),
+                    schema_configuration = _firehose.CfnDeliveryStream.SchemaConfigurationProperty(
+                        catalog_id = account,
+                        database_name = 'route53_'+slug,
+                        table_name = 'querylogs',
+                        region = region,
+                        role_arn = role.role_arn,
+                        version_id = 'LATEST'
+                    )
+                )
+            )
+        )
+
+        self.stream.node.add_dependency(role)
+        self.stream.add_resource_dependency(table)
+
+    ### SUBSCRIPTION FILTER ###
+
+        subscription = _iam.Role(
+            self, 'subscription',
+            assumed_by = _iam.ServicePrincipal('logs.amazonaws.com')
+        )
+
+        subscription.add_to_policy(
+            _iam.PolicyStatement(
+                actions = [
+                    'firehose:PutRecord',
+                    'firehose:PutRecordBatch'
+                ],
+                resources = [
+                    self.stream.attr_arn
+                ]
+            )
+        )
+
+        _logs.CfnSubscriptionFilter(
+            self, 'filter',
+            log_group_name = logs.log_group_name,
+            filter_pattern = '',
+            destination_arn = self.stream.attr_arn,
+            role_arn = subscription.role_arn
+        ).node.add_dependency(subscription)
@@ -0,0 +1,89 @@
+import hashlib
+import json
+import mimetypes
+import os
+
+BUILD = '.build'
+
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'public, max-age=300, must-revalidate'
+
+MANIFEST = 'manifest.json'
+
+CONTENT_TYPES = {
+    'avif': 'image/avif',
+    'webp': 'image/webp'
+}
+
+def files(source):
+    for root, dirs, names in os.walk(source):
+        dirs.sort()
+        for name in sorted(names):
+            path = os.path.join(root, name)
+            yield os.path.relpath(path, source).replace(os.sep, '/'), path
+
+def digest(path):
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1048576), b''):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+def fingerprint(name, value, length = 12):
+    directory, _, base = name.rpartition('/')
+    stem, dot, extension = base.partition('.')
+    hashed = stem+'.'+value[:length]+(dot+extension if dot else '')
+    return directory+'/'+hashed if directory else hashed
+
+def original(name, names):
+    base, dot, extension = name.rpartition('.')
+    if dot and extension in CONTENT_TYPES and base in names:
+        return base
+    return name
+
+def groups(source):
+    found = {}
+    paths = dict(files(source))
+    for name in paths:
+        found.setdefault(original(name, paths), []).append(name)
+    for key, names in found.items():
+        sha256 = hashlib.sha256()
+        for name in sorted(names):
+            sha256.update(name.encode()+b'\0'+digest(paths[name]).encode())
+        for name in names:
+            yield name, paths[name], sha256.hexdigest() if len(names) > 1 else digest(paths[name])
+
+def content_type(name):
+    extension = name.rpartition('.')[2]
+    if extension in CONTENT_TYPES:
+        return CONTENT_TYPES[extension]
+    return mimetypes.guess_type(name)[0] or 'application/octet-stream'
+
+def entry(key, path, value, cache_control):
+    return {
+        'key': key,
+        'path': path,
+        'digest': value,
+        'content_type': content_type(key),
+        'cache_control': cache_control
+    }
+
+def objects(source, fingerprinted = False):
+    items = []
+    manifest = {}
+    for name, path, value in sorted(groups(source)):
+        content = digest(path)
+        if not fingerprinted:
+            items.append(entry(name, path, content, None))
+            continue
+        manifest[name] = fingerprint(name, value)
+        items.append(entry(manifest[name], path, content, IMMUTABLE))
+        items.append(entry(name, path, content, REVALIDATE))
+    if fingerprinted:
+        os.makedirs(BUILD, exist_ok = True)
+        path = os.path.join(BUILD, source.replace('/', '-')+'.json')
+        with open(path, 'w') as f:
+            json.dump(manifest, f, indent = 2, sort_keys = True)
+            f.write('\n')
+        items.append(entry(MANIFEST, path, digest(path), REVALIDATE))
+    return items
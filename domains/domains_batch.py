@@ -0,0 +1,120 @@
+from aws_cdk import (
+    CustomResource,
+    Duration,
+    RemovalPolicy,
+    Stack,
+    aws_iam as _iam,
+    aws_lambda as _lambda,
+    aws_logs as _logs,
+    aws_route53 as _route53,
+    custom_resources as _custom
+)
+
+from constructs import Construct
+
+def fqdn(name, zone):
+    if name is None:
+        return zone
+    name = name.rstrip('.')
+    if name == zone or name.endswith('.'+zone):
+        return name
+    return name+'.'+zone
+
+def record_entry(record, zone):
+    item = {
+        'name': fqdn(record.name, zone),
+        'type': record.type,
+        'values': list(record.values)
+    }
+    if record.ttl is not None:
+        item['ttl'] = record.ttl
+    return item
+
+def alias_entry(name, record_type, hosted_zone_id, dns_name):
+    return {
+        'name': name,
+        'type': record_type,
+        'alias': {
+            'zone': hosted_zone_id,
+            'dns': dns_name
+        }
+    }
+
+class DomainsRecordSet(Construct):
+
+    def __init__(self, scope: Construct, construct_id: str, zone: _route53.IHostedZone, records: list, **kwargs) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        stack = Stack.of(self)
+        provider = stack.node.try_find_child('recordsprovider')
+
+        if provider is None:
+
+            logs = _logs.LogGroup(
+                stack, 'recordslogs',
+                retention = _logs.RetentionDays.ONE_MONTH,
+                removal_policy = RemovalPolicy.DESTROY
+            )
+
+            function = _lambda.Function(
+                stack, 'recordsfunction',
+                runtime = _lambda.Runtime.PYTHON_3_13,
+                architecture = _lambda.Architecture.ARM_64,
+                code = _lambda.Code.from_asset('records'),
+                handler = 'records.handler',
+                timeout = Duration.minutes(15),
+                memory_size = 256,
+                log_group = logs
+            )
+
+            complete = _lambda.Function(
+                stack, 'recordscomplete',
+                runtime = _lambda.Runtime.PYTHON_3_13,
+                architecture = _lambda.Architecture.ARM_64,
+                code = _lambda.Code.from_asset('records'),
+                handler = 'records.complete',
+                timeout = Duration.minutes(1),
+                memory_size = 128,
+                log_group = logs
+            )
+
+            complete.add_to_role_policy(
+                _iam.PolicyStatement(
+                    actions = [
+                        'route53:GetChange'
+                    ],
+                    resources = [
+                        'arn:aws:route53:::change/*'
+                    ]
+                )
+            )
+
+            provider = _custom.Provider(
+                stack, 'recordsprovider',
+                on_event_handler = function,
+                is_complete_handler = complete,
+                query_interval = Duration.seconds(10),
+                total_timeout = Duration.hours(1)
+            )
+
+        stack.node.find_child('recordsfunction').add_to_role_policy(
+            _iam.PolicyStatement(
+                actions = [
+                    'route53:ChangeResourceRecordSets',
+                    'route53:ListResourceRecordSets'
+                ],
+                resources = [
+                    zone.hosted_zone_arn
+                ]
+            )
+        )
+
+        self.resource = CustomResource(
+            self, 'resource',
+            service_token = provider.service_token,
+            resource_type = 'Custom::RecordSet',
+            properties = {
+                'HostedZoneId': zone.hosted_zone_id,
+                'Records': stack.to_json_string(records)
+            }
+        )
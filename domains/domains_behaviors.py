@@ -0,0 +1,90 @@
+import os
+
+from aws_cdk import (
+    Duration,
+    aws_cloudfront as _cloudfront
+)
+
+from constructs import Construct
+
+from domains.domains_negotiate import SOURCES
+
+MAX_BEHAVIORS = 24
+
+PROFILES = {
+    'images': {
+        'extensions': ('avif', 'gif', 'ico', 'jpeg', 'jpg', 'png', 'webp'),
+        'default_ttl': Duration.days(7),
+        'max_ttl': Duration.days(365),
+        'compress': False
+    },
+    'fonts': {
+        'extensions': ('otf', 'ttf', 'woff', 'woff2'),
+        'default_ttl': Duration.days(30),
+        'max_ttl': Duration.days(365),
+        'compress': True
+    },
+    'text': {
+        'extensions': ('css', 'csv', 'htm', 'html', 'js', 'json', 'map', 'md', 'mjs', 'svg', 'txt', 'xml'),
+        'default_ttl': Duration.days(1),
+        'max_ttl': Duration.days(365),
+        'compress': True
+    }
+}
+
+def extensions(source):
+    found = set()
+    for root, dirs, names in os.walk(source):
+        for name in names:
+            if '.' in name and not name.startswith('.'):
+                found.add(name.rsplit('.', 1)[1].lower())
+    return sorted(found)
+
+def profile(extension):
+    for name, settings in PROFILES.items():
+        if extension in settings['extensions']:
+            return name
+    return None
+
+class DomainsBehaviors(Construct):
+
+    def __init__(self, scope: Construct, construct_id: str, source: str, origin: _cloudfront.IOrigin, function_associations: list = None, response_headers_policy: _cloudfront.IResponseHeadersPolicy = None, **kwargs) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        self.policies = {}
+        self.behaviors = {}
+
+        for extension in extensions(source):
+
+            name = profile(extension)
+
+            if name is None:
+                continue
+
+            settings = PROFILES[name]
+
+            if name not in self.policies:
+                self.policies[name] = _cloudfront.CachePolicy(
+                    self, name,
+                    comment = name+' from '+source,
+                    default_ttl = settings['default_ttl'],
+                    min_ttl = Duration.seconds(0),
+                    max_ttl = settings['max_ttl'],
+                    cookie_behavior = _cloudfront.CacheCookieBehavior.none(),
+                    header_behavior = _cloudfront.CacheHeaderBehavior.none(),
+                    query_string_behavior = _cloudfront.CacheQueryStringBehavior.none(),
+                    enable_accept_encoding_gzip = settings['compress'],
+                    enable_accept_encoding_brotli = settings['compress']
+                )
+
+            self.behaviors['*.'+extension] = _cloudfront.BehaviorOptions(
+                origin = origin,
+                viewer_protocol_policy = _cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+                cache_policy = self.policies[name],
+                compress = settings['compress'],
+                function_associations = function_associations,
+                response_headers_policy = response_headers_policy if extension in SOURCES else None
+            )
+
+        if len(self.behaviors) > MAX_BEHAVIORS:
+            raise ValueError(source+' needs '+str(len(self.behaviors))+' cache behaviors, the limit is '+str(MAX_BEHAVIORS))
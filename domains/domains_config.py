@@ -0,0 +1,223 @@
+from domains.domains_spec import (
+    AliasSpec,
+    DistributionSpec,
+    DomainSpec,
+    RecordSpec,
+    RedirectSpec
+)
+from domains.domains_ttl import apply, overrides
+
+def mail(zone, apple, google):
+    return (
+        RecordSpec(
+            id = 'mx',
+            type = 'MX',
+            values = (
+                '10 mx01.mail.icloud.com',
+                '10 mx02.mail.icloud.com'
+            )
+        ),
+        RecordSpec(
+            id = 'spf',
+            type = 'TXT',
+            values = (
+                'apple-domain='+apple,
+                'v=spf1 include:icloud.com ~all',
+                'google-site-verification='+google
+            )
+        ),
+        RecordSpec(
+            id = 'dkim',
+            type = 'CNAME',
+            name = 'sig1._domainkey',
+            values = (
+                'sig1.dkim.'+zone+'.at.icloudmailadmin.com',
+            )
+        ),
+        RecordSpec(
+            id = 'dmarc',
+            type = 'TXT',
+            name = '_dmarc',
+            values = (
+                'v=DMARC1; p=reject; rua=mailto:hello@'+zone+'; ruf=mailto:hello@'+zone+';',
+            ),
+            ttl = 18000
+        )
+    )
+
+def website(zone, location):
+    return DistributionSpec(
+        domain_names = (
+            zone,
+            'www.'+zone
+        ),
+        redirect = RedirectSpec(
+            location = location,
+            rules = 'redirect/rules.json'
+        )
+    )
+
+def aliases(zone):
+    return (
+        AliasSpec(
+            id = 'alias',
+            name = zone
+        ),
+        AliasSpec(
+            id = 'www',
+            name = 'www.'+zone
+        )
+    )
+
+### 4N6IR.COM ###
+
+DOMAINS4N6IRCOM = DomainSpec(
+    stack = 'Domains4n6irCom',
+    zone = '4n6ir.com',
+    policy = 'Route53LogsPolicy4n6irCom',
+    records = mail(
+        '4n6ir.com',
+        'QrN2dB5mqCpHXDmp',
+        '48g-lZt5fMJAGuNoJeufLTBmpiZD_n9C1Ep7cg0paas'
+    ) + (
+        RecordSpec(
+            id = '_gh-4n6ir-o.4n6ir.com',
+            type = 'TXT',
+            name = '_gh-4n6ir-o.4n6ir.com',
+            values = ('78cd1b1e99',),
+            ttl = 18000
+        ),
+        RecordSpec(
+            id = '_gh-4n6ir-o.blog.4n6ir.com',
+            type = 'TXT',
+            name = '_gh-4n6ir-o.blog.4n6ir.com',
+            values = ('574ce20909',),
+            ttl = 18000
+        ),
+        RecordSpec(
+            id = '_gh-4n6ir-o.www.4n6ir.com',
+            type = 'TXT',
+            name = '_gh-4n6ir-o.www.4n6ir.com',
+            values = ('01b114cf2c',),
+            ttl = 18000
+        ),
+        RecordSpec(
+            id = 'blog',
+            type = 'CNAME',
+            name = 'blog.4n6ir.com',
+            values = ('4n6ir.github.io',)
+        )
+    ),
+    distributions = (
+        website('4n6ir.com', 'https://github.com/4n6ir'),
+    ),
+    aliases = aliases('4n6ir.com'),
+    archive = True,
+    sketches = True,
+    accesslogs = True
+)
+
+### LUKACH.IO ###
+
+DOMAINSLUKACHIO = DomainSpec(
+    stack = 'DomainsLukachIo',
+    zone = 'lukach.io',
+    policy = 'Route53LogsPolicyLukachIo',
+    records = (
+        RecordSpec(
+            id = 'apizone',
+            type = 'NS',
+            name = 'api.lukach.io',
+            values = (
+                'ns-210.awsdns-26.com',
+                'ns-1017.awsdns-63.net',
+                'ns-1698.awsdns-20.co.uk',
+                'ns-1534.awsdns-63.org'
+            )
+        ),
+    ) + mail(
+        'lukach.io',
+        'iJt7M09hmfaQJOAk',
+        'Q5p9swO-SAWvSQvFLboYO_pxI7xU1rJXjIvEQeXWr8U'
+    ) + (
+        RecordSpec(
+            id = 'blog',
+            type = 'CNAME',
+            name = 'blog.lukach.io',
+            values = ('jblukach.github.io',)
+        ),
+    ),
+    distributions = (
+        website('lukach.io', 'https://github.com/jblukach'),
+        DistributionSpec(
+            domain_names = (
+                'cdn.lukach.io',
+            ),
+            bucket = 'cache',
+            prefix = 'cdn',
+            function = 'negotiate/negotiate.js',
+            negotiate = True,
+            cache_policy = 'CACHING_OPTIMIZED',
+            asset = 'cache',
+            fingerprint = True,
+            behaviors = True,
+            shield = 'us-east-1',
+            replica = 'us-west-2',
+            metrics = True
+        )
+    ),
+    aliases = aliases('lukach.io') + (
+        AliasSpec(
+            id = 'cdn',
+            name = 'cdn.lukach.io',
+            distribution = 'cdndistribution'
+        ),
+    ),
+    archive = True,
+    sketches = True,
+    accesslogs = True
+)
+
+### LUKACH.NET ###
+
+DOMAINSLUKACHNET = DomainSpec(
+    stack = 'DomainsLukachNet',
+    zone = 'lukach.net',
+    policy = 'Route53LogsPolicyLukachNet',
+    records = mail(
+        'lukach.net',
+        'gOUpiYTLd4M1rhEa',
+        'LNWHvBz7ozTPcZmzOMdnM2cmg4oX2HtTfjoPRrjpgYY'
+    ),
+    distributions = (
+        website('lukach.net', 'https://github.com/jblukach'),
+        DistributionSpec(
+            domain_names = (
+                'ip.lukach.net',
+            ),
+            prefix = 'ip',
+            function = 'whoami/whoami.js',
+            edge = True
+        )
+    ),
+    aliases = aliases('lukach.net') + (
+        AliasSpec(
+            id = 'ip',
+            name = 'ip.lukach.net',
+            distribution = 'ipdistribution'
+        ),
+    ),
+    archive = True,
+    sketches = True,
+    accesslogs = True
+)
+
+TTLS = overrides()
+
+SPECS = tuple(
+    apply(spec, TTLS) for spec in (
+        DOMAINS4N6IRCOM,
+        DOMAINSLUKACHIO,
+        DOMAINSLUKACHNET
+    )
+)
@@ -0,0 +1,243 @@
+from aws_cdk import (
+    Duration,
+    Names,
+    Stack,
+    aws_cloudfront as _cloudfront,
+    aws_cloudwatch as _cloudwatch,
+    aws_route53 as _route53,
+    aws_ssm as _ssm
+)
+
+from constructs import Construct
+
+from domains.domains_sketches import DomainsSketches
+
+STACK = 'DomainsDashboard'
+
+PREFIX = '/domains/dashboard/'
+
+PERIOD = Duration.minutes(5)
+
+def parameter_name(construct: Construct) -> str:
+    return PREFIX+Names.unique_id(construct)
+
+def publish(construct: Construct, value: str) -> _ssm.StringParameter:
+    return _ssm.StringParameter(
+        construct, 'dashboard',
+        description = construct.node.path+' for the dashboard',
+        parameter_name = parameter_name(construct),
+        string_value = value,
+        tier = _ssm.ParameterTier.STANDARD
+    )
+
+def cloudfront(metric_name, distribution_id, statistic = 'Sum', label = None):
+    return _cloudwatch.Metric(
+        namespace = 'AWS/CloudFront',
+        metric_name = metric_name,
+        dimensions_map = {
+            'DistributionId': distribution_id,
+            'Region': 'Global'
+        },
+        statistic = statistic,
+        label = label,
+        period = PERIOD,
+        region = 'us-east-1'
+    )
+
+class DomainsDashboard(Construct):
+
+    def __init__(self, scope: Construct, construct_id: str, stacks: list, dashboard_name: str = 'domains', **kwargs) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        self.sources = []
+
+        self.dashboard = _cloudwatch.Dashboard(
+            self, 'dashboard',
+            dashboard_name = dashboard_name,
+            default_interval = Duration.days(1)
+        )
+
+        for stack in stacks:
+
+            found = stack.node.find_all()
+
+            zones = [item for item in found if isinstance(item, _route53.PublicHostedZone)]
+            sketches = {item.slug: item for item in found if isinstance(item, DomainsSketches)}
+            distributions = [item for item in found if isinstance(item, _cloudfront.Distribution)]
+            functions = [item for item in found if isinstance(item, _cloudfront.Function)]
+
+            if not zones and not distributions:
+                continue
+
+            self.sources.append(stack)
+
+            self.dashboard.add_widgets(
+                _cloudwatch.TextWidget(
+                    markdown = '## '+stack.stack_name,
+                    width = 24,
+                    height = 1
+                )
+            )
+
+    ### ROUTE 53 ###
+
+            for zone in zones:
+                self.dashboard.add_widgets(*self.zone(zone, sketches.get(zone.zone_name.replace('.',''))))
+
+    ### CLOUDFRONT ###
+
+            for distribution in distributions:
+                self.dashboard.add_widgets(*self.distribution(distribution))
+
+            if functions:
+                self.dashboard.add_widgets(self.functions(functions))
+
+    def reference(self, construct, value):
+        if Stack.of(construct) is Stack.of(self) or construct.node.try_find_child('dashboard') is None:
+            return value
+        return _ssm.StringParameter.value_for_string_parameter(self, parameter_name(construct))
+
+    def zone(self, zone, sketches = None):
+        queries = _cloudwatch.Metric(
+            namespace = 'AWS/Route53',
+            metric_name = 'DNSQueries',
+            dimensions_map = {
+                'HostedZoneId': self.reference(zone, zone.hosted_zone_id)
+            },
+            statistic = 'Sum',
+            label = 'queries',
+            period = PERIOD,
+            region = 'us-east-1'
+        )
+        right = []
+        if sketches is not None:
+            right = [
+                _cloudwatch.Metric(
+                    namespace = 'Route53/QueryLogs',
+                    metric_name = name,
+                    dimensions_map = {'Zone': sketches.slug},
+                    statistic = statistic,
+                    label = name,
+                    period = PERIOD
+                )
+                for name, statistic in (('NXDOMAIN', 'Sum'), ('QueriesPerSecond', 'Maximum'))
+            ]
+        return [
+            _cloudwatch.GraphWidget(
+                title = zone.zone_name+' DNS queries',
+                left = [queries],
+                right = right,
+                width = 24,
+                height = 5
+            )
+        ]
+
+    def distribution(self, distribution):
+        title = distribution.node.id
+        distribution_id = self.reference(distribution, distribution.distribution_id)
+        widgets = [
+            _cloudwatch.GraphWidget(
+                title = title+' requests',
+                left = [cloudfront('Requests', distribution_id, label = 'requests')],
+                right = [cloudfront('BytesDownloaded', distribution_id, label = 'bytes')],
+                width = 6,
+                height = 5
+            ),
+            _cloudwatch.GraphWidget(
+                title = title+' error rate',
+                left = [
+                    cloudfront('4xxErrorRate', distribution_id, 'Average', '4xx'),
+                    cloudfront('5xxErrorRate', distribution_id, 'Average', '5xx')
+                ],
+                left_y_axis = _cloudwatch.YAxisProps(min = 0, max = 100, label = '%', show_units = False),
+                width = 6,
+                height = 5
+            )
+        ]
+        if distribution.node.try_find_child('metrics') is not None:
+            widgets += [
+                _cloudwatch.GraphWidget(
+                    title = title+' cache hit rate',
+                    left = [cloudfront('CacheHitRate', distribution_id, 'Average', 'hit rate')],
+                    left_y_axis = _cloudwatch.YAxisProps(min = 0, max = 100, label = '%', show_units = False),
+                    width = 6,
+                    height = 5
+                ),
+                _cloudwatch.GraphWidget(
+                    title = title+' origin latency',
+                    left = [
+                        cloudfront('OriginLatency', distribution_id, statistic, statistic)
+                        for statistic in ('p50', 'p95', 'p99')
+                    ],
+                    left_y_axis = _cloudwatch.YAxisProps(min = 0, label = 'ms', show_units = False),
+                    width = 6,
+                    height = 5
+                )
+            ]
+        return widgets
+
+    def functions(self, functions):
+        return _cloudwatch.GraphWidget(
+            title = Stack.of(functions[0]).stack_name+' function compute utilization',
+            left = [
+                _cloudwatch.Metric(
+                    namespace = 'AWS/CloudFront',
+                    metric_name = 'FunctionComputeUtilization',
+                    dimensions_map = {
+                        'FunctionName': function.function_name,
+                        'Region': 'Global'
+                    },
+                    statistic = 'Maximum',
+                    label = function.node.id,
+                    period = PERIOD,
+                    region = 'us-east-1'
+                )
+                for function in functions
+            ],
+            right = [
+                _cloudwatch.MathExpression(
+                    expression = 'SUM(['+','.join('t'+str(number) for number in range(len(functions)))+'])',
+                    using_metrics = {
+                        't'+str(number): _cloudwatch.Metric(
+                            namespace = 'AWS/CloudFront',
+                            metric_name = 'FunctionThrottles',
+                            dimensions_map = {
+                                'FunctionName': function.function_name,
+                                'Region': 'Global'
+                            },
+                            statistic = 'Sum',
+                            period = PERIOD,
+                            region = 'us-east-1'
+                        )
+                        for number, function in enumerate(functions)
+                    },
+                    label = 'throttles',
+                    period = PERIOD
+                )
+            ],
+            left_y_axis = _cloudwatch.YAxisProps(min = 0, max = 100, label = '%', show_units = False),
+            width = 24,
+            height = 5
+        )
+
+class DomainsDashboardStack(Stack):
+
+    def __init__(self, scope: Construct, construct_id: str, stacks: list, **kwargs) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        self.dashboard = DomainsDashboard(
+            self, 'dashboard',
+            stacks = stacks
+        )
+
+        for stack in self.dashboard.sources:
+            self.add_stack_dependency(stack)
+
+def build(scope: Construct, stacks: list, **kwargs) -> DomainsDashboardStack:
+
+    existing = scope.node.try_find_child(STACK)
+
+    if existing is not None:
+        return existing
+
+    return DomainsDashboardStack(scope, STACK, stacks = stacks, **kwargs)
@@ -0,0 +1,9 @@
+HEADERS = (
+    'CloudFront-Viewer-Country',
+    'CloudFront-Viewer-Country-Region',
+    'CloudFront-Viewer-City',
+    'CloudFront-Viewer-Time-Zone',
+    'CloudFront-Viewer-ASN',
+    'CloudFront-Viewer-TLS',
+    'CloudFront-Viewer-Http-Version'
+)
@@ -0,0 +1,32 @@
+import json
+
+TEMPLATE = 'negotiate/negotiate.js'
+
+SOURCES = ('jpeg', 'jpg', 'png')
+
+FORMATS = ('avif', 'webp')
+
+MAX_SIZE = 10240
+
+def variants(keys):
+    keys = set(keys)
+    found = {}
+    for key in sorted(keys):
+        if key.rpartition('.')[2].lower() not in SOURCES:
+            continue
+        formats = ''.join(extension[0] for extension in FORMATS if key+'.'+extension in keys)
+        if formats:
+            found['/'+key] = formats
+    return found
+
+def code(keys, template = TEMPLATE):
+    with open(template) as f:
+        lines = f.read().split('\n')
+    for number, line in enumerate(lines):
+        if line.startswith('const variants = '):
+            lines[number] = 'const variants = '+json.dumps(variants(keys), separators = (',', ':'), sort_keys = True)+';'
+            source = '\n'.join(lines)
+            if len(source.encode()) > MAX_SIZE:
+                raise ValueError(template+' with '+str(len(variants(keys)))+' images exceeds the '+str(MAX_SIZE)+' byte function limit')
+            return source
+    raise ValueError(template+' has no variants line')
@@ -0,0 +1,73 @@
+import json
+
+TEMPLATE = 'redirect/redirect.js'
+
+RULES = 'redirect/rules.json'
+
+STATUSES = (301, 302, 307, 308)
+
+DEPTH = 4
+
+MAX_KEY = 512
+MAX_VALUE = 1024
+
+def site(redirect):
+    if redirect.status not in STATUSES:
+        raise ValueError('Unsupported redirect status: '+str(redirect.status))
+    return {
+        'location': redirect.location,
+        'status': redirect.status,
+        'path': redirect.path,
+        'query': redirect.query,
+        'maxAge': redirect.max_age
+    }
+
+def config(redirect, store = None, hosts = None):
+    return {
+        **site(redirect),
+        'store': store,
+        'depth': DEPTH,
+        'hosts': {host.lower(): site(value) for host, value in (hosts or {}).items()}
+    }
+
+def code(redirect, store = None, hosts = None, template = TEMPLATE):
+    with open(template) as f:
+        lines = f.read().split('\n')
+    for number, line in enumerate(lines):
+        if line.startswith('const config = '):
+            lines[number] = 'const config = '+json.dumps(config(redirect, store, hosts))+';'
+            return '\n'.join(lines)
+    raise ValueError(template+' has no config line')
+
+def rules(path = RULES):
+    with open(path) as f:
+        return json.load(f)
+
+def entry(host, path, target):
+    if not path.startswith('/'):
+        raise ValueError('Redirect path must start with /: '+host+path)
+    if '*' in path[:-1] or (path.endswith('*') and not path.endswith('/*')):
+        raise ValueError('Wildcards are only supported as a trailing /*: '+host+path)
+    if isinstance(target, str):
+        target = {'location': target}
+    status = target.get('status', 301)
+    if status not in STATUSES:
+        raise ValueError('Unsupported redirect status for '+host+path+': '+str(status))
+    if not target['location'].startswith(('https://', 'http://')):
+        raise ValueError('Redirect target must be an absolute URL: '+target['location'])
+    key = host.lower()+path
+    value = str(status)+' '+target['location']
+    if len(key.encode()) > MAX_KEY or len(value.encode()) > MAX_VALUE:
+        raise ValueError('Redirect rule exceeds the KeyValueStore limits: '+key)
+    return key, value
+
+def entries(table, hosts):
+    hosts = {host.lower() for host in hosts}
+    found = {}
+    for host, paths in table.items():
+        if host != '*' and host.lower() not in hosts:
+            continue
+        for path, target in paths.items():
+            key, value = entry(host, path, target)
+            found[key] = value
+    return found
@@ -0,0 +1,154 @@
+import urllib.parse
+
+from aws_cdk import (
+    Stack,
+    aws_certificatemanager as _acm,
+    aws_cloudfront as _cloudfront,
+    aws_cloudfront_origins as _origins,
+    aws_route53 as _route53,
+    aws_ssm as _ssm
+)
+
+from constructs import Construct
+
+from domains.domains_accesslogs import DomainsAccessLogs
+from domains.domains_dashboard import publish
+from domains.domains_redirect import code, entries, rules
+
+STACK = 'DomainsRedirects'
+
+PARAMETER = '/route53/redirects'
+
+DOMAIN = PARAMETER+'/domain'
+
+class DomainsRedirects(Stack):
+
+    def __init__(self, scope: Construct, construct_id: str, specs: tuple, **kwargs) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        zones = {}
+        hosts = {}
+        aliases = []
+        sites = []
+
+        for spec in specs:
+            zones[spec.zone] = _route53.HostedZone.from_hosted_zone_attributes(
+                self, spec.slug,
+                hosted_zone_id = _ssm.StringParameter.value_for_string_parameter(self, spec.parameter_name),
+                zone_name = spec.zone
+            )
+            for distribution in spec.shared:
+                sites.append((spec, distribution))
+                for host in distribution.domain_names:
+                    hosts[host] = zones[spec.zone]
+                    if distribution in spec.consolidated:
+                        aliases.append(host)
+
+        default = sites[0][1].redirect
+        names = list(hosts)
+
+    ### ACM CERTIFICATE ###
+
+        acm = _acm.Certificate(
+            self, 'acm',
+            domain_name = names[0],
+            subject_alternative_names = names[1:] or None,
+            validation = _acm.CertificateValidation.from_dns_multi_zone(hosts)
+        )
+
+    ### KEY VALUE STORE ###
+
+        table = {}
+
+        for spec, distribution in sites:
+            if distribution.redirect.rules is not None:
+                table.update(entries(rules(distribution.redirect.rules), distribution.domain_names))
+
+        store = None
+
+        if table:
+            store = _cloudfront.KeyValueStore(
+                self, 'redirects',
+                comment = 'consolidated redirect rules'
+            )
+            _ssm.StringParameter(
+                self, 'redirectsparameter',
+                description = 'consolidated redirect rules',
+                parameter_name = PARAMETER,
+                string_value = store.key_value_store_arn,
+                tier = _ssm.ParameterTier.STANDARD
+            )
+
+    ### CLOUDFRONT FUNCTIONS ###
+
+        function = _cloudfront.Function(
+            self, 'function',
+            code = _cloudfront.FunctionCode.from_inline(
+                code(
+                    default,
+                    store.key_value_store_id if store else None,
+                    {
+                        host: distribution.redirect
+                        for spec, distribution in sites
+                        for host in distribution.domain_names
+                    }
+                )
+            ),
+            runtime = _cloudfront.FunctionRuntime.JS_2_0,
+            key_value_store = store
+        )
+
+    ### CLOUDFRONT DISTRIBUTIONS ###
+
+        self.distribution = _cloudfront.Distribution(
+            self, 'distribution',
+            comment = 'redirects',
+            default_behavior = _cloudfront.BehaviorOptions(
+                origin = _origins.HttpOrigin(
+                    urllib.parse.urlparse(default.location).hostname
+                ),
+                viewer_protocol_policy = _cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+                cache_policy = _cloudfront.CachePolicy.CACHING_DISABLED,
+                function_associations = [
+                    _cloudfront.FunctionAssociation(
+                        function = function,
+                        event_type = _cloudfront.FunctionEventType.VIEWER_REQUEST
+                    )
+                ]
+            ),
+            domain_names = aliases or None,
+            minimum_protocol_version = _cloudfront.SecurityPolicyProtocol.TLS_V1_3_2025,
+            price_class = _cloudfront.PriceClass.PRICE_CLASS_ALL,
+            http_version = _cloudfront.HttpVersion.HTTP2_AND_3,
+            enable_ipv6 = True,
+            certificate = acm if aliases else None
+        )
+
+        publish(self.distribution, self.distribution.distribution_id)
+
+        _ssm.StringParameter(
+            self, 'domain',
+            description = 'consolidated redirect distribution',
+            parameter_name = DOMAIN,
+            string_value = self.distribution.distribution_domain_name,
+            tier = _ssm.ParameterTier.STANDARD
+        )
+
+    ### ACCESS LOGS ###
+
+        if any(spec.accesslogs for spec in specs):
+            self.accesslogs = DomainsAccessLogs(
+                self, 'accesslogs',
+                slug = 'redirects',
+                parameter_name = PARAMETER
+            )
+            self.accesslogs.add('site', self.distribution)
+
+def build(scope: Construct, specs: tuple, **kwargs) -> DomainsRedirects:
+
+    existing = scope.node.try_find_child(STACK)
+
+    if existing is not None:
+        return existing
+
+    return DomainsRedirects(scope, STACK, specs = specs, **kwargs)
@@ -0,0 +1,104 @@
+from aws_cdk import (
+    Aws,
+    RemovalPolicy,
+    Stack,
+    aws_iam as _iam,
+    aws_s3 as _s3
+)
+
+from constructs import Construct
+
+from domains.domains_assets import objects
+from domains.domains_spec import DomainSpec
+from domains.domains_upload import DomainsUpload
+
+def bucket_name(spec, distribution):
+    return 'domains-'+spec.slug+'-'+distribution.bucket+'-'+Aws.ACCOUNT_ID+'-'+distribution.replica
+
+def region(spec):
+    regions = sorted(set(distribution.replica for distribution in spec.distributions if distribution.replica))
+    if len(regions) > 1:
+        raise ValueError(spec.stack+' replicates to more than one region: '+', '.join(regions))
+    return regions[0] if regions else None
+
+def stack_name(spec):
+    return spec.stack+'Replica'
+
+class DomainsReplica(Stack):
+
+    def __init__(self, scope: Construct, construct_id: str, spec: DomainSpec, zone: Stack, **kwargs) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        account = Stack.of(self).account
+
+        self.buckets = {}
+
+        distributions = [distribution for distribution in spec.distributions if distribution.replica is not None]
+
+    ### S3 BUCKETS ###
+
+        for distribution in distributions:
+
+            if distribution.bucket in self.buckets:
+                continue
+
+            bucket = _s3.Bucket(
+                self, distribution.bucket,
+                bucket_name = bucket_name(spec, distribution),
+                encryption = _s3.BucketEncryption.S3_MANAGED,
+                block_public_access = _s3.BlockPublicAccess.BLOCK_ALL,
+                removal_policy = RemovalPolicy.DESTROY,
+                auto_delete_objects = True,
+                enforce_ssl = True,
+                versioned = False
+            )
+
+            bucket.add_to_resource_policy(
+                _iam.PolicyStatement(
+                    principals = [
+                        _iam.ServicePrincipal('cloudfront.amazonaws.com')
+                    ],
+                    actions = [
+                        's3:GetObject'
+                    ],
+                    resources = [
+                        bucket.arn_for_objects('*')
+                    ],
+                    conditions = {
+                        'StringEquals': {
+                            'AWS:SourceAccount': account,
+                            'AWS:SourceArn': [
+                                zone.distributions[item.id].distribution_arn
+                                for item in distributions
+                                if item.bucket == distribution.bucket
+                            ]
+                        }
+                    }
+                )
+            )
+
+            self.buckets[distribution.bucket] = bucket
+
+    ### INCREMENTAL UPLOAD ###
+
+        for distribution in distributions:
+
+            if distribution.asset is None:
+                continue
+
+            DomainsUpload(
+                self, distribution.prefix+'upload',
+                bucket = self.buckets[distribution.bucket],
+                objects = objects(distribution.asset, distribution.fingerprint),
+                distribution = zone.distributions[distribution.id],
+                prune = distribution.prune
+            )
+
+def build(scope: Construct, spec: DomainSpec, zone: Stack, **kwargs) -> DomainsReplica:
+
+    existing = scope.node.try_find_child(stack_name(spec))
+
+    if existing is not None:
+        return existing
+
+    return DomainsReplica(scope, stack_name(spec), spec = spec, zone = zone, cross_region_references = True, **kwargs)
@@ -0,0 +1,84 @@
+import re
+import zlib
+
+from aws_cdk import NestedStack
+
+from constructs import Construct
+
+LIMIT = 450
+
+FILL = 0.75
+
+SHARDS = 100
+
+BUCKETS = 32
+
+DEPTH = 32
+
+def relative(name, zone):
+    if name is None:
+        return ''
+    name = name.rstrip('.')
+    if name == zone:
+        return ''
+    if name.endswith('.'+zone):
+        return name[:-len(zone)-1]
+    return name
+
+def key(strategy, zone, record_type, name):
+    if strategy == 'type':
+        return record_type
+    if strategy == 'prefix':
+        labels = relative(name, zone)
+        return 'bucket'+str(bucket(labels.split('.')[-1] if labels else 'apex', BUCKETS))
+    raise ValueError('Unsupported shard strategy: '+str(strategy))
+
+def shard_id(value):
+    return 'records'+re.sub('[^A-Za-z0-9]', '', value.title())
+
+def bucket(value, count):
+    return zlib.crc32(value.lower().encode()) % count
+
+def digest(record_type, name):
+    return zlib.crc32((record_type+' '+str(name)).lower().encode())
+
+def split(value, members, residue = 0, depth = 0):
+    size = sum(count for record_type, name, count in members)
+    if size <= LIMIT * FILL or depth == DEPTH:
+        part = value+'-part'+str(residue) if residue else value
+        return [(part, members)]
+    low = [member for member in members if not digest(member[0], member[1]) >> depth & 1]
+    high = [member for member in members if digest(member[0], member[1]) >> depth & 1]
+    return split(value, low, residue, depth + 1) + split(value, high, residue | 1 << depth, depth + 1)
+
+def plan(strategy, zone, items):
+    groups = {}
+    for record_type, name, count in items:
+        groups.setdefault(key(strategy, zone, record_type, name), []).append((record_type, name, count))
+
+    shards = {}
+    owners = {}
+    for value, members in groups.items():
+        for part, parts in split(value, members):
+            construct_id = shard_id(part)
+            if owners.setdefault(construct_id, part) != part:
+                raise ValueError(part+' and '+owners[construct_id]+' both map to '+construct_id)
+            for record_type, name, count in parts:
+                shards[(record_type, name)] = construct_id
+
+    if len(owners) > SHARDS:
+        raise ValueError(str(len(owners))+' shards exceed the limit of '+str(SHARDS)+' nested stacks')
+
+    return shards
+
+class DomainsShard(NestedStack):
+
+    def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        self.resources = 0
+
+    def reserve(self, count):
+        self.resources += count
+        if self.resources > LIMIT:
+            raise ValueError(self.node.id+' exceeds '+str(LIMIT)+' records, use a finer shard strategy')
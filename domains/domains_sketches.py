@@ -0,0 +1,64 @@
+from aws_cdk import (
+    Duration,
+    RemovalPolicy,
+    aws_lambda as _lambda,
+    aws_logs as _logs,
+    aws_logs_destinations as _destinations,
+    aws_ssm as _ssm
+)
+
+from constructs import Construct
+
+class DomainsSketches(Construct):
+
+    def __init__(self, scope: Construct, construct_id: str, logs: _logs.ILogGroup, slug: str, parameter_name: str, **kwargs) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        self.slug = slug
+
+    ### SSM PARAMETER ###
+
+        self.parameter = _ssm.StringParameter(
+            self, 'parameter',
+            description = slug+' query log heavy hitters',
+            parameter_name = parameter_name+'/sketches',
+            string_value = '{}',
+            tier = _ssm.ParameterTier.STANDARD
+        )
+
+    ### LAMBDA FUNCTION ###
+
+        sketcheslogs = _logs.LogGroup(
+            self, 'sketcheslogs',
+            retention = _logs.RetentionDays.ONE_WEEK,
+            removal_policy = RemovalPolicy.DESTROY
+        )
+
+        self.function = _lambda.Function(
+            self, 'function',
+            runtime = _lambda.Runtime.PYTHON_3_13,
+            architecture = _lambda.Architecture.ARM_64,
+            code = _lambda.Code.from_asset('sketches'),
+            handler = 'sketches.handler',
+            timeout = Duration.seconds(30),
+            memory_size = 256,
+            reserved_concurrent_executions = 1,
+            environment = dict(
+                PARAMETER = self.parameter.parameter_name,
+                WINDOW = '60',
+                INTERVAL = '10',
+                LIMIT = '10'
+            ),
+            log_group = sketcheslogs
+        )
+
+        self.parameter.grant_write(self.function)
+
+    ### SUBSCRIPTION FILTER ###
+
+        _logs.SubscriptionFilter(
+            self, 'filter',
+            log_group = logs,
+            destination = _destinations.LambdaDestination(self.function),
+            filter_pattern = _logs.FilterPattern.all_events()
+        )
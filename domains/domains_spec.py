@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+
+@dataclass(frozen = True)
+class RecordSpec:
+    id: str
+    type: str
+    values: tuple
+    name: str = None
+    ttl: int = None
+
+@dataclass(frozen = True)
+class AliasSpec:
+    id: str
+    name: str
+    distribution: str = 'distribution'
+
+@dataclass(frozen = True)
+class RedirectSpec:
+    location: str
+    status: int = 301
+    path: bool = False
+    query: bool = False
+    max_age: int = 86400
+    rules: str = None
+
+@dataclass(frozen = True)
+class DistributionSpec:
+    domain_names: tuple
+    bucket: str = None
+    prefix: str = ''
+    function: str = None
+    cache_policy: str = 'CACHING_DISABLED'
+    asset: str = None
+    deployment: str = 'deployment'
+    fingerprint: bool = False
+    prune: bool = False
+    behaviors: bool = False
+    shield: str = None
+    replica: str = None
+    replica_shield: str = None
+    redirect: RedirectSpec = None
+    edge: bool = False
+    metrics: bool = False
+    negotiate: bool = False
+
+    @property
+    def id(self):
+        return self.prefix+'distribution'
+
+    @property
+    def certificate(self):
+        return self.prefix+'acm'
+
+    @property
+    def function_id(self):
+        return self.prefix+'function'
+
+    @property
+    def name(self):
+        return self.prefix or 'site'
+
+@dataclass(frozen = True)
+class DomainSpec:
+    stack: str
+    zone: str
+    policy: str
+    records: tuple = ()
+    distributions: tuple = ()
+    aliases: tuple = ()
+    shards: str = None
+    provider: str = 'cloudformation'
+    retention: str = 'THIRTEEN_MONTHS'
+    archive: bool = False
+    sketches: bool = False
+    accesslogs: bool = False
+    consolidate: bool = False
+
+    @property
+    def slug(self):
+        return self.zone.replace('.','')
+
+    @property
+    def log_group_name(self):
+        return '/aws/route53/'+self.slug
+
+    @property
+    def parameter_name(self):
+        return '/route53/'+self.slug
+
+    @property
+    def consolidated(self):
+        if self.consolidate is not True:
+            return ()
+        return tuple(distribution for distribution in self.distributions if distribution.redirect is not None)
+
+    @property
+    def shared(self):
+        if self.consolidate not in (True, 'staged'):
+            return ()
+        return tuple(distribution for distribution in self.distributions if distribution.redirect is not None)
@@ -176,3 +176,27 @@ class DomainsStack(Stack):
                 ]
             )
         )
+
+        github.add_to_policy(
+            _iam.PolicyStatement(
+                actions = [
+                    'ssm:PutParameter'
+                ],
+                resources = [
+                    'arn:aws:ssm:us-east-1:'+str(account)+':parameter/domains/*'
+                ]
+            )
+        )
+
+        github.add_to_policy(
+            _iam.PolicyStatement(
+                actions = [
+                    'cloudfront-keyvaluestore:DescribeKeyValueStore',
+                    'cloudfront-keyvaluestore:ListKeys',
+                    'cloudfront-keyvaluestore:UpdateKeys'
+                ],
+                resources = [
+                    'arn:aws:cloudfront::'+str(account)+':key-value-store/*'
+                ]
+            )
+        )
@@ -0,0 +1,26 @@
+import dataclasses
+import json
+import os
+
+from domains.domains_zonefile import qualify
+
+OVERRIDES = os.path.join(os.path.dirname(__file__), 'domains_ttl.json')
+
+def key(name, record_type):
+    return name+' '+record_type
+
+def overrides(path = OVERRIDES):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def apply(spec, values):
+    zone = values.get(spec.zone, {})
+    if not zone:
+        return spec
+    records = []
+    for record in spec.records:
+        name = key(qualify(record.name, spec.zone), record.type)
+        records.append(dataclasses.replace(record, ttl = zone[name]) if name in zone else record)
+    return dataclasses.replace(spec, records = tuple(records))
@@ -0,0 +1,128 @@
+import json
+import os
+import shutil
+
+from aws_cdk import (
+    CustomResource,
+    Duration,
+    RemovalPolicy,
+    Size,
+    Stack,
+    aws_cloudfront as _cloudfront,
+    aws_iam as _iam,
+    aws_lambda as _lambda,
+    aws_logs as _logs,
+    aws_s3 as _s3,
+    aws_s3_assets as _assets,
+    custom_resources as _custom
+)
+
+from constructs import Construct
+
+from domains.domains_assets import BUILD
+
+MANIFEST = 'manifest.json'
+
+class DomainsUpload(Construct):
+
+    def __init__(self, scope: Construct, construct_id: str, bucket: _s3.IBucket, objects: list, distribution: _cloudfront.IDistribution = None, prune: bool = False, concurrency: int = 16, **kwargs) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        stack = Stack.of(self)
+        provider = stack.node.try_find_child('uploadprovider')
+
+        if provider is None:
+
+            logs = _logs.LogGroup(
+                stack, 'uploadlogs',
+                retention = _logs.RetentionDays.ONE_MONTH,
+                removal_policy = RemovalPolicy.DESTROY
+            )
+
+            function = _lambda.Function(
+                stack, 'uploadfunction',
+                runtime = _lambda.Runtime.PYTHON_3_13,
+                architecture = _lambda.Architecture.ARM_64,
+                code = _lambda.Code.from_asset('upload'),
+                handler = 'upload.handler',
+                timeout = Duration.minutes(15),
+                memory_size = 512,
+                ephemeral_storage_size = Size.gibibytes(2),
+                log_group = logs
+            )
+
+            state = _s3.Bucket(
+                stack, 'uploadstate',
+                encryption = _s3.BucketEncryption.S3_MANAGED,
+                block_public_access = _s3.BlockPublicAccess.BLOCK_ALL,
+                removal_policy = RemovalPolicy.DESTROY,
+                auto_delete_objects = True,
+                enforce_ssl = True,
+                versioned = False
+            )
+
+            state.grant_read_write(function)
+
+            provider = _custom.Provider(
+                stack, 'uploadprovider',
+                on_event_handler = function
+            )
+
+        function = stack.node.find_child('uploadfunction')
+        state = stack.node.find_child('uploadstate')
+
+    ### BUNDLED ASSET ###
+
+        directory = os.path.join(BUILD, self.node.addr)
+        shutil.rmtree(directory, ignore_errors = True)
+        os.makedirs(directory)
+
+        entries = []
+
+        for item in objects:
+            target = os.path.join(directory, item['digest'])
+            if not os.path.exists(target):
+                shutil.copyfile(item['path'], target)
+            entries.append(
+                {
+                    'key': item['key'],
+                    'digest': item['digest'],
+                    'content_type': item['content_type'],
+                    'cache_control': item['cache_control']
+                }
+            )
+
+        with open(os.path.join(directory, MANIFEST), 'w') as f:
+            json.dump(entries, f, indent = 2, sort_keys = True)
+            f.write('\n')
+
+        archive = _assets.Asset(
+            self, 'archive',
+            path = directory
+        )
+
+        archive.bucket.grant_read(function)
+        bucket.grant_read_write(function)
+        bucket.grant_delete(function)
+
+        properties = {
+            'Bucket': bucket.bucket_name,
+            'StateBucket': state.bucket_name,
+            'SourceBucket': archive.s3_bucket_name,
+            'Archive': archive.s3_object_key,
+            'Prune': str(prune).lower(),
+            'Concurrency': str(concurrency)
+        }
+
+        if distribution is not None:
+            properties['DistributionId'] = distribution.distribution_id
+            distribution.grant_create_invalidation(function)
+
+    ### CUSTOM RESOURCE ###
+
+        self.resource = CustomResource(
+            self, 'resource',
+            service_token = provider.service_token,
+            resource_type = 'Custom::IncrementalUpload',
+            properties = properties
+        )
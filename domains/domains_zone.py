@@ -0,0 +1,589 @@
+import urllib.parse
+
+import jsii
+
+from aws_cdk import (
+    Duration,
+    RemovalPolicy,
+    Stack,
+    aws_certificatemanager as _acm,
+    aws_cloudfront as _cloudfront,
+    aws_cloudfront_origins as _origins,
+    aws_iam as _iam,
+    aws_logs as _logs,
+    aws_route53 as _route53,
+    aws_route53_targets as _targets,
+    aws_s3 as _s3,
+    aws_ssm as _ssm
+)
+
+from constructs import Construct
+
+from domains.domains_accesslogs import DomainsAccessLogs
+from domains.domains_archive import DomainsArchive
+from domains.domains_assets import objects
+from domains.domains_behaviors import DomainsBehaviors
+from domains.domains_dashboard import publish
+from domains.domains_edge import HEADERS
+from domains.domains_negotiate import code as negotiate
+from domains.domains_batch import DomainsRecordSet, alias_entry, record_entry
+from domains.domains_shard import DomainsShard, plan
+from domains.domains_sketches import DomainsSketches
+from domains.domains_redirect import code, entries, rules
+from domains.domains_redirects import DOMAIN
+from domains.domains_replica import bucket_name as replica_name
+from domains.domains_spec import DomainSpec
+from domains.domains_upload import DomainsUpload
+
+@jsii.implements(_route53.IAliasRecordTarget)
+class CloudFrontDomain:
+
+    def __init__(self, domain_name: str) -> None:
+        self.domain_name = domain_name
+
+    def bind(self, record, zone = None):
+        return _route53.AliasRecordTargetConfig(
+            dns_name = self.domain_name,
+            hosted_zone_id = _targets.CloudFrontTarget.get_hosted_zone_id(record)
+        )
+
+class DomainsZone(Stack):
+
+    def __init__(self, scope: Construct, construct_id: str, spec: DomainSpec, **kwargs) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        account = Stack.of(self).account
+        region = Stack.of(self).region
+
+        self.spec = spec
+
+    ### HOSTZONE ###
+
+        policy_statement = _iam.PolicyStatement(
+            principals = [
+                _iam.ServicePrincipal('route53.amazonaws.com')
+            ],
+            actions = [
+                'logs:CreateLogStream',
+                'logs:PutLogEvents'
+            ],
+            resources=[
+                'arn:aws:logs:'+region+':'+account+':log-group:*'
+            ]
+        )
+
+        self.resourcepolicy = _logs.ResourcePolicy(
+            self, 'resourcepolicy',
+            policy_statements = [
+                policy_statement
+            ],
+            resource_policy_name = spec.policy
+        )
+
+        self.logs = _logs.LogGroup(
+            self, 'logs',
+            log_group_name = spec.log_group_name,
+            retention = getattr(_logs.RetentionDays, spec.retention),
+            removal_policy = RemovalPolicy.DESTROY
+        )
+
+        self.hostzone = _route53.PublicHostedZone(
+            self, 'hostzone',
+            zone_name = spec.zone,
+            comment = spec.zone,
+            query_logs_log_group_arn = self.logs.log_group_arn
+        )
+
+        publish(self.hostzone, self.hostzone.hosted_zone_id)
+
+    ### PARAMETER ###
+
+        _ssm.StringParameter(
+            self, 'parameter',
+            description = spec.zone,
+            parameter_name = spec.parameter_name,
+            string_value = self.hostzone.hosted_zone_id,
+            tier = _ssm.ParameterTier.STANDARD
+        )
+
+    ### ARCHIVE ###
+
+        if spec.archive:
+            self.archive = DomainsArchive(
+                self, 'archive',
+                logs = self.logs,
+                slug = spec.slug,
+                parameter_name = spec.parameter_name
+            )
+
+    ### SKETCHES ###
+
+        if spec.sketches:
+            self.sketches = DomainsSketches(
+                self, 'sketches',
+                logs = self.logs,
+                slug = spec.slug,
+                parameter_name = spec.parameter_name
+            )
+
+    ### RECORDS ###
+
+        self.records = {}
+        self.shards = {}
+        self.entries = {}
+
+        if spec.shards is not None:
+            self.plan = plan(
+                spec.shards, spec.zone,
+                [(record.type, record.name, 1) for record in spec.records] +
+                [('ALIAS', alias.name, 2) for alias in spec.aliases]
+            )
+
+        for record in spec.records:
+            self.records[record.id] = self.record(record)
+
+    ### DISTRIBUTIONS ###
+
+        self.buckets = {}
+        self.distributions = {}
+
+        for distribution in spec.distributions:
+            if distribution not in spec.consolidated:
+                self.distributions[distribution.id] = self.distribution(distribution)
+                publish(self.distributions[distribution.id], self.distributions[distribution.id].distribution_id)
+
+        if spec.consolidated:
+            self.shared = _ssm.StringParameter.value_for_string_parameter(self, DOMAIN)
+
+    ### ACCESS LOGS ###
+
+        if spec.accesslogs and self.distributions:
+            self.accesslogs = DomainsAccessLogs(
+                self, 'accesslogs',
+                slug = spec.slug,
+                parameter_name = spec.parameter_name
+            )
+            for distribution in spec.distributions:
+                if distribution.id in self.distributions:
+                    self.accesslogs.add(distribution.name, self.distributions[distribution.id])
+
+    ### WEBSITE RECORDS ###
+
+        for alias in spec.aliases:
+            self.alias(alias)
+
+    ### RECORD SETS ###
+
+        for scope, entries in self.entries.values():
+            DomainsRecordSet(
+                scope, 'recordset',
+                zone = self.hostzone,
+                records = entries
+            )
+
+    def alias(self, spec):
+
+        scope = self.shard('ALIAS', spec.name, 2)
+
+        if spec.distribution in self.distributions:
+            domain_name = self.distributions[spec.distribution].distribution_domain_name
+        else:
+            domain_name = self.shared
+
+        if self.spec.provider == 'batch':
+            hosted_zone_id = _targets.CloudFrontTarget.get_hosted_zone_id(self)
+            self.records[spec.id] = self.batch(scope, alias_entry(spec.name, 'A', hosted_zone_id, domain_name))
+            self.records[spec.id+'aaa'] = self.batch(scope, alias_entry(spec.name, 'AAAA', hosted_zone_id, domain_name))
+            return
+
+        target = _route53.RecordTarget.from_alias(
+            CloudFrontDomain(domain_name)
+        )
+
+        self.records[spec.id] = _route53.ARecord(
+            scope, spec.id,
+            zone = self.hostzone,
+            record_name = spec.name,
+            target = target
+        )
+
+        self.records[spec.id+'aaa'] = _route53.AaaaRecord(
+            scope, spec.id+'aaa',
+            zone = self.hostzone,
+            record_name = spec.name,
+            target = target
+        )
+
+    def batch(self, scope, item):
+
+        self.entries.setdefault(scope.node.path, (scope, []))[1].append(item)
+
+        return item
+
+    def shard(self, record_type, name, count = 1):
+
+        if self.spec.shards is None:
+            return self
+
+        construct_id = self.plan[(record_type, name)]
+
+        if construct_id not in self.shards:
+            self.shards[construct_id] = DomainsShard(self, construct_id)
+
+        self.shards[construct_id].reserve(count)
+
+        return self.shards[construct_id]
+
+    def record(self, record):
+
+        scope = self.shard(record.type, record.name)
+
+        if self.spec.provider == 'batch':
+            return self.batch(scope, record_entry(record, self.spec.zone))
+
+        ttl = Duration.seconds(record.ttl) if record.ttl is not None else None
+
+        if record.type == 'MX':
+            values = []
+            for value in record.values:
+                priority, host_name = value.split()
+                values.append(
+                    _route53.MxRecordValue(
+                        host_name = host_name,
+                        priority = int(priority)
+                    )
+                )
+            return _route53.MxRecord(
+                scope, record.id,
+                zone = self.hostzone,
+                record_name = record.name,
+                values = values,
+                ttl = ttl
+            )
+
+        if record.type == 'TXT':
+            return _route53.TxtRecord(
+                scope, record.id,
+                zone = self.hostzone,
+                record_name = record.name,
+                values = list(record.values),
+                ttl = ttl
+            )
+
+        if record.type == 'CNAME':
+            return _route53.CnameRecord(
+                scope, record.id,
+                zone = self.hostzone,
+                record_name = record.name,
+                domain_name = record.values[0],
+                ttl = ttl
+            )
+
+        if record.type == 'NS':
+            return _route53.NsRecord(
+                scope, record.id,
+                zone = self.hostzone,
+                record_name = record.name,
+                values = list(record.values),
+                ttl = ttl
+            )
+
+        if not hasattr(_route53.RecordType, record.type):
+            raise ValueError('Unsupported record type: '+record.type)
+
+        return _route53.RecordSet(
+            scope, record.id,
+            zone = self.hostzone,
+            record_type = getattr(_route53.RecordType, record.type),
+            record_name = record.name,
+            target = _route53.RecordTarget.from_values(*record.values),
+            ttl = ttl
+        )
+
+    def bucket(self, bucket_id):
+
+        if bucket_id not in self.buckets:
+            self.buckets[bucket_id] = _s3.Bucket(
+                self, bucket_id,
+                encryption = _s3.BucketEncryption.S3_MANAGED,
+                block_public_access = _s3.BlockPublicAccess.BLOCK_ALL,
+                removal_policy = RemovalPolicy.DESTROY,
+                auto_delete_objects = True,
+                enforce_ssl = True,
+                versioned = False
+            )
+
+        return self.buckets[bucket_id]
+
+    def distribution(self, distribution):
+
+    ### ACM CERTIFICATE ###
+
+        acm = _acm.Certificate(
+            self, distribution.certificate,
+            domain_name = distribution.domain_names[0],
+            subject_alternative_names = list(distribution.domain_names[1:]) or None,
+            validation = _acm.CertificateValidation.from_dns(self.hostzone)
+        )
+
+        if distribution.redirect is not None:
+            return self.redirect(distribution, acm)
+
+        if distribution.edge:
+            return self.edge(distribution, acm)
+
+    ### S3 BUCKET ###
+
+        bucket = self.bucket(distribution.bucket)
+
+        items = None
+
+        if distribution.asset is not None:
+            items = objects(distribution.asset, distribution.fingerprint)
+
+    ### CLOUDFRONT FUNCTIONS ###
+
+        function_associations = None
+        response_headers_policy = None
+
+        if distribution.function is not None:
+            if distribution.negotiate:
+                function_code = _cloudfront.FunctionCode.from_inline(
+                    negotiate([item['key'] for item in items or []], distribution.function)
+                )
+                response_headers_policy = _cloudfront.ResponseHeadersPolicy(
+                    self, distribution.prefix+'vary',
+                    comment = 'Vary: Accept for '+distribution.domain_names[0],
+                    custom_headers_behavior = _cloudfront.ResponseCustomHeadersBehavior(
+                        custom_headers = [
+                            _cloudfront.ResponseCustomHeader(
+                                header = 'Vary',
+                                value = 'Accept',
+                                override = True
+                            )
+                        ]
+                    )
+                )
+            else:
+                function_code = _cloudfront.FunctionCode.from_file(
+                    file_path = distribution.function
+                )
+            function = _cloudfront.Function(
+                self, distribution.function_id,
+                code = function_code,
+                runtime = _cloudfront.FunctionRuntime.JS_2_0
+            )
+            function_associations = [
+                _cloudfront.FunctionAssociation(
+                    function = function,
+                    event_type = _cloudfront.FunctionEventType.VIEWER_REQUEST
+                )
+            ]
+
+    ### CACHE BEHAVIORS ###
+
+        origin = _origins.S3BucketOrigin.with_origin_access_control(
+            bucket,
+            origin_shield_enabled = distribution.shield is not None,
+            origin_shield_region = distribution.shield
+        )
+
+        if distribution.replica is not None:
+            replica = _s3.Bucket.from_bucket_attributes(
+                self, distribution.prefix+'replica',
+                bucket_name = replica_name(self.spec, distribution),
+                region = distribution.replica
+            )
+            origin = _origins.OriginGroup(
+                primary_origin = origin,
+                fallback_origin = _origins.S3BucketOrigin.with_origin_access_control(
+                    replica,
+                    origin_shield_enabled = distribution.shield is not None,
+                    origin_shield_region = distribution.replica_shield or distribution.replica
+                ),
+                fallback_status_codes = [500, 502, 503, 504]
+            )
+
+        additional_behaviors = None
+
+        if distribution.behaviors and distribution.asset is not None:
+            additional_behaviors = DomainsBehaviors(
+                self, distribution.prefix+'behaviors',
+                source = distribution.asset,
+                origin = origin,
+                function_associations = function_associations,
+                response_headers_policy = response_headers_policy
+            ).behaviors
+
+    ### CLOUDFRONT DISTRIBUTIONS ###
+
+        cloudfront = _cloudfront.Distribution(
+            self, distribution.id,
+            comment = distribution.domain_names[0],
+            default_behavior = _cloudfront.BehaviorOptions(
+                origin = origin,
+                viewer_protocol_policy = _cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+                cache_policy = getattr(_cloudfront.CachePolicy, distribution.cache_policy),
+                function_associations = function_associations,
+                response_headers_policy = response_headers_policy
+            ),
+            additional_behaviors = additional_behaviors,
+            domain_names = list(distribution.domain_names),
+            error_responses = [
+                _cloudfront.ErrorResponse(
+                    http_status = 404,
+                    response_http_status = 200,
+                    response_page_path = '/'
+                )
+            ],
+            minimum_protocol_version = _cloudfront.SecurityPolicyProtocol.TLS_V1_3_2025,
+            price_class = _cloudfront.PriceClass.PRICE_CLASS_ALL,
+            http_version = _cloudfront.HttpVersion.HTTP2_AND_3,
+            enable_ipv6 = True,
+            certificate = acm
+        )
+
+    ### ADDITIONAL METRICS ###
+
+        if distribution.metrics:
+            _cloudfront.CfnMonitoringSubscription(
+                cloudfront, 'metrics',
+                distribution_id = cloudfront.distribution_id,
+                monitoring_subscription = _cloudfront.CfnMonitoringSubscription.MonitoringSubscriptionProperty(
+                    realtime_metrics_subscription_config = _cloudfront.CfnMonitoringSubscription.RealtimeMetricsSubscriptionConfigProperty(
+                        realtime_metrics_subscription_status = 'Enabled'
+                    )
+                )
+            )
+
+    ### INCREMENTAL UPLOAD ###
+
+        if distribution.asset is not None:
+            DomainsUpload(
+                self, distribution.deployment,
+                bucket = bucket,
+                objects = items,
+                distribution = cloudfront,
+                prune = distribution.prune
+            )
+
+        return cloudfront
+
+    def redirect(self, distribution, acm):
+
+    ### KEY VALUE STORE ###
+
+        store = None
+        table = {}
+
+        if distribution.redirect.rules is not None:
+            table = entries(rules(distribution.redirect.rules), distribution.domain_names)
+
+        if table:
+            store = _cloudfront.KeyValueStore(
+                self, distribution.prefix+'redirects',
+                comment = distribution.domain_names[0]+' redirect rules'
+            )
+            _ssm.StringParameter(
+                self, distribution.prefix+'redirectsparameter',
+                description = distribution.domain_names[0]+' redirect rules',
+                parameter_name = self.spec.parameter_name+'/'+distribution.prefix+'redirects',
+                string_value = store.key_value_store_arn,
+                tier = _ssm.ParameterTier.STANDARD
+            )
+
+    ### CLOUDFRONT FUNCTIONS ###
+
+        function = _cloudfront.Function(
+            self, distribution.function_id,
+            code = _cloudfront.FunctionCode.from_inline(
+                code(distribution.redirect, store.key_value_store_id if store else None)
+            ),
+            runtime = _cloudfront.FunctionRuntime.JS_2_0,
+            key_value_store = store
+        )
+
+    ### CLOUDFRONT DISTRIBUTIONS ###
+
+        return _cloudfront.Distribution(
+            self, distribution.id,
+            comment = distribution.domain_names[0],
+            default_behavior = _cloudfront.BehaviorOptions(
+                origin = _origins.HttpOrigin(
+                    urllib.parse.urlparse(distribution.redirect.location).hostname
+                ),
+                viewer_protocol_policy = _cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+                cache_policy = _cloudfront.CachePolicy.CACHING_DISABLED,
+                function_associations = [
+                    _cloudfront.FunctionAssociation(
+                        function = function,
+                        event_type = _cloudfront.FunctionEventType.VIEWER_REQUEST
+                    )
+                ]
+            ),
+            domain_names = list(distribution.domain_names),
+            minimum_protocol_version = _cloudfront.SecurityPolicyProtocol.TLS_V1_3_2025,
+            price_class = _cloudfront.PriceClass.PRICE_CLASS_ALL,
+            http_version = _cloudfront.HttpVersion.HTTP2_AND_3,
+            enable_ipv6 = True,
+            certificate = acm
+        )
+
+    def edge(self, distribution, acm):
+
+    ### CLOUDFRONT FUNCTIONS ###
+
+        function = _cloudfront.Function(
+            self, distribution.function_id,
+            code = _cloudfront.FunctionCode.from_file(
+                file_path = distribution.function
+            ),
+            runtime = _cloudfront.FunctionRuntime.JS_2_0
+        )
+
+    ### S3 BUCKET ###
+
+        bucket = self.bucket(distribution.prefix+'origin')
+
+    ### VIEWER HEADERS ###
+
+        policy = _cloudfront.OriginRequestPolicy(
+            self, distribution.prefix+'viewer',
+            comment = distribution.domain_names[0]+' viewer headers',
+            header_behavior = _cloudfront.OriginRequestHeaderBehavior.allow_list(*HEADERS),
+            query_string_behavior = _cloudfront.OriginRequestQueryStringBehavior.all()
+        )
+
+    ### CLOUDFRONT DISTRIBUTIONS ###
+
+        return _cloudfront.Distribution(
+            self, distribution.id,
+            comment = distribution.domain_names[0],
+            default_behavior = _cloudfront.BehaviorOptions(
+                origin = _origins.S3BucketOrigin.with_origin_access_control(bucket),
+                viewer_protocol_policy = _cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+                cache_policy = _cloudfront.CachePolicy.CACHING_DISABLED,
+                origin_request_policy = policy,
+                function_associations = [
+                    _cloudfront.FunctionAssociation(
+                        function = function,
+                        event_type = _cloudfront.FunctionEventType.VIEWER_REQUEST
+                    )
+                ]
+            ),
+            domain_names = list(distribution.domain_names),
+            minimum_protocol_version = _cloudfront.SecurityPolicyProtocol.TLS_V1_3_2025,
+            price_class = _cloudfront.PriceClass.PRICE_CLASS_ALL,
+            http_version = _cloudfront.HttpVersion.HTTP2_AND_3,
+            enable_ipv6 = True,
+            certificate = acm
+        )
+
+def build(scope: Construct, spec: DomainSpec, **kwargs) -> DomainsZone:
+
+    existing = scope.node.try_find_child(spec.stack)
+
+    if existing is not None:
+        return existing
+
+    return DomainsZone(scope, spec.stack, spec = spec, **kwargs)
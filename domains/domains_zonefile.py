@@ -0,0 +1,225 @@
+import re
+import warnings
+
+from domains.domains_spec import RecordSpec
+
+DEFAULT_TTL = 1800
+
+CLASSES = ('IN', 'CH', 'HS', 'CS')
+
+NAMES = ('CNAME', 'NS', 'PTR', 'DNAME')
+
+SKIP = ('SOA',)
+
+UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+def ttl(value):
+    if value.isdigit():
+        return int(value)
+    if re.fullmatch('(?:[0-9]+[smhdwSMHDW])+', value) is None:
+        raise ValueError('Invalid TTL: '+value)
+    return sum(int(number) * UNITS[unit.lower()] for number, unit in re.findall('([0-9]+)([smhdwSMHDW])', value))
+
+def unescape(value):
+    return re.sub(r'\\([0-9]{3}|.)', lambda match: chr(int(match.group(1))) if match.group(1).isdigit() else match.group(1), value)
+
+TOKEN = re.compile(r'\s*(?:(;.*)|"((?:[^"\\]|\\.)*)"|([()])|((?:[^\s();"\\]|\\.)+)|(\S))')
+
+def tokenize(line):
+    tokens = []
+    for comment, quoted, paren, word, invalid in TOKEN.findall(line.rstrip('\r\n')):
+        if comment:
+            break
+        if invalid:
+            raise ValueError('Unterminated string: '+line.strip())
+        if paren:
+            tokens.append((paren, False))
+        elif word:
+            tokens.append((word, False))
+        else:
+            tokens.append((unescape(quoted) if '\\' in quoted else quoted, True))
+    return tokens
+
+def entries(lines):
+    depth = 0
+    pending = []
+    blank = False
+    for number, line in enumerate(lines, 1):
+        tokens = tokenize(line)
+        if depth == 0:
+            blank = line[:1].isspace()
+        for token in tokens:
+            if token == ('(', False):
+                depth += 1
+            elif token == (')', False):
+                depth -= 1
+                if depth < 0:
+                    raise ValueError('Unbalanced parenthesis on line '+str(number))
+            else:
+                pending.append(token)
+        if depth == 0 and pending:
+            yield number, blank, pending
+            pending = []
+    if depth != 0:
+        raise ValueError('Unbalanced parenthesis at end of file')
+
+def absolute(name, origin):
+    if name == '@':
+        return origin
+    if name.endswith('.'):
+        return name[:-1].lower()
+    return (name+'.'+origin).lower() if origin else name.lower()
+
+def rdata(record_type, fields, origin):
+    if record_type == 'TXT' or record_type == 'SPF':
+        return ''.join(text for text, _ in fields)
+    values = [text for text, _ in fields]
+    if record_type in NAMES:
+        return absolute(values[0], origin)
+    if record_type == 'MX':
+        return values[0]+' '+absolute(values[1], origin)
+    if record_type == 'SRV':
+        return ' '.join(values[:3])+' '+absolute(values[3], origin)
+    if record_type == 'CAA':
+        return values[0]+' '+values[1]+' "'+' '.join(values[2:])+'"'
+    return ' '.join(values)
+
+def record_id(name, record_type, zone):
+    if name == zone:
+        label = '@'
+    elif name.endswith('.'+zone):
+        label = name[:-len(zone)-1]
+    else:
+        label = name
+    return label+'-'+record_type.lower()
+
+def rrs(lines, origin = ''):
+    origin = origin.rstrip('.').lower()
+    default = None
+    owner = None
+    previous = None
+    for number, blank, tokens in entries(lines):
+        first = tokens[0][0]
+        if first.upper() == '$ORIGIN':
+            origin = absolute(tokens[1][0], origin)
+            continue
+        if first.upper() == '$TTL':
+            default = ttl(tokens[1][0])
+            continue
+        if first.startswith('$'):
+            raise ValueError('Unsupported directive '+first+' on line '+str(number))
+        if not blank:
+            owner = absolute(first, origin)
+            tokens = tokens[1:]
+        if owner is None:
+            raise ValueError('Missing owner on line '+str(number))
+        record_ttl = None
+        while tokens and not tokens[0][1]:
+            field = tokens[0][0]
+            if field.upper() in CLASSES:
+                tokens = tokens[1:]
+            elif field[:1].isdigit():
+                record_ttl = ttl(field)
+                tokens = tokens[1:]
+            else:
+                break
+        if not tokens:
+            raise ValueError('Missing record type on line '+str(number))
+        record_type = tokens[0][0].upper()
+        if record_ttl is None:
+            record_ttl = default if default is not None else previous
+        previous = record_ttl
+        yield owner, record_type, record_ttl, rdata(record_type, tokens[1:], origin)
+
+def load(lines, zone):
+    zone = zone.rstrip('.').lower()
+    groups = {}
+    for name, record_type, record_ttl, value in rrs(lines, zone):
+        if record_type in SKIP or (record_type == 'NS' and name == zone):
+            continue
+        group = groups.setdefault((name, record_type), [record_ttl, []])
+        if group[0] is None:
+            group[0] = record_ttl
+        elif record_ttl is not None and record_ttl != group[0]:
+            warnings.warn(name+' '+record_type+' has TTLs '+str(group[0])+' and '+str(record_ttl)+', using the lower')
+            group[0] = min(group[0], record_ttl)
+        group[1].append(value)
+    for (name, record_type), (record_ttl, values) in groups.items():
+        yield record_spec(zone, name, record_type, record_ttl, values)
+
+def record_spec(zone, name, record_type, record_ttl, values):
+    return RecordSpec(
+        id = record_id(name, record_type, zone),
+        type = record_type,
+        name = None if name == zone else name,
+        values = tuple(values),
+        ttl = record_ttl
+    )
+
+def records(path, zone):
+    with open(path) as f:
+        return tuple(load(f, zone))
+
+def quote(value):
+    value = value.replace('\\', '\\\\').replace('"', '\\"')
+    return ' '.join('"'+value[i:i+255]+'"' for i in range(0, max(len(value), 1), 255))
+
+def qualify(name, zone):
+    if name is None:
+        return zone
+    name = name.rstrip('.').lower()
+    if name == zone or name.endswith('.'+zone):
+        return name
+    return name+'.'+zone
+
+def owner(name, zone):
+    if name == zone:
+        return '@'
+    if name.endswith('.'+zone):
+        return name[:-len(zone)-1]
+    return name+'.'
+
+def present(record_type, value):
+    if record_type == 'TXT' or record_type == 'SPF':
+        return quote(value)
+    if record_type in NAMES:
+        return value.rstrip('.')+'.'
+    if record_type == 'MX':
+        priority, host = value.split()
+        return priority+' '+host.rstrip('.')+'.'
+    if record_type == 'SRV':
+        fields = value.split()
+        return ' '.join(fields[:3])+' '+fields[3].rstrip('.')+'.'
+    return value
+
+def dump(spec):
+    zone = spec.zone.rstrip('.').lower()
+    yield '$ORIGIN '+zone+'.\n'
+    yield '$TTL '+str(DEFAULT_TTL)+'\n'
+    for record in spec.records:
+        name = owner(qualify(record.name, zone), zone)
+        record_ttl = record.ttl if record.ttl is not None else DEFAULT_TTL
+        for value in record.values:
+            yield name+' '+str(record_ttl)+' IN '+record.type+' '+present(record.type, value)+'\n'
+    for alias in spec.aliases:
+        name = owner(qualify(alias.name, zone), zone)
+        yield '; '+name+' ALIAS '+alias.distribution+'\n'
+
+def normalized(records, zone):
+    zone = zone.rstrip('.').lower()
+    found = {}
+    for record in records:
+        name = qualify(record.name, zone)
+        values = record.values
+        if record.type in NAMES:
+            values = tuple(value.rstrip('.').lower() for value in values)
+        elif record.type == 'MX':
+            values = tuple(value.split()[0]+' '+value.split()[1].rstrip('.').lower() for value in values)
+        found[(name, record.type)] = (
+            record.ttl if record.ttl is not None else DEFAULT_TTL,
+            tuple(sorted(values))
+        )
+    return found
+
+def verify(spec):
+    return normalized(load(dump(spec), spec.zone), spec.zone) == normalized(spec.records, spec.zone)
@@ -0,0 +1,36 @@
+const variants = {};
+
+function quality(accept, type) {
+  const parts = accept.toLowerCase().split(',');
+  for (let i = 0; i < parts.length; i++) {
+    const params = parts[i].split(';');
+    if (params[0].trim() !== type) {
+      continue;
+    }
+    for (let j = 1; j < params.length; j++) {
+      const param = params[j].trim();
+      if (param.indexOf('q=') === 0) {
+        return parseFloat(param.substring(2)) || 0;
+      }
+    }
+    return 1;
+  }
+  return 0;
+}
+
+function handler(event) {
+  const request = event.request;
+  const formats = variants[request.uri];
+  if (!formats || !request.headers['accept']) {
+    return request;
+  }
+  const accept = request.headers['accept'].value;
+  const avif = formats.indexOf('a') !== -1 ? quality(accept, 'image/avif') : 0;
+  const webp = formats.indexOf('w') !== -1 ? quality(accept, 'image/webp') : 0;
+  if (avif > 0 && avif >= webp) {
+    request.uri = request.uri + '.avif';
+  } else if (webp > 0) {
+    request.uri = request.uri + '.webp';
+  }
+  return request;
+}
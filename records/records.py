@@ -0,0 +1,155 @@
+import json
+
+import boto3
+
+MAX_RECORDS = 1000
+MAX_CHARACTERS = 32000
+
+def fqdn(name):
+    return name.lower().replace('\\052', '*').rstrip('.')+'.'
+
+def quote(value):
+    value = value.replace('\\', '\\\\').replace('"', '\\"')
+    return ' '.join('"'+value[i:i+255]+'"' for i in range(0, max(len(value), 1), 255))
+
+def record_set(record):
+    rrset = {
+        'Name': fqdn(record['name']),
+        'Type': record['type']
+    }
+    if 'alias' in record:
+        rrset['AliasTarget'] = {
+            'HostedZoneId': record['alias']['zone'],
+            'DNSName': fqdn(record['alias']['dns']),
+            'EvaluateTargetHealth': False
+        }
+        return rrset
+    values = record['values']
+    if record['type'] == 'TXT':
+        values = [quote(value) for value in values]
+    rrset['TTL'] = int(record.get('ttl', 1800))
+    rrset['ResourceRecords'] = [{'Value': value} for value in values]
+    return rrset
+
+def normalize(rrset):
+    normal = {
+        'Name': fqdn(rrset['Name']),
+        'Type': rrset['Type']
+    }
+    if 'AliasTarget' in rrset:
+        normal['AliasTarget'] = {
+            'HostedZoneId': rrset['AliasTarget']['HostedZoneId'],
+            'DNSName': fqdn(rrset['AliasTarget']['DNSName']),
+            'EvaluateTargetHealth': rrset['AliasTarget'].get('EvaluateTargetHealth', False)
+        }
+        return normal
+    normal['TTL'] = int(rrset.get('TTL', 0))
+    normal['ResourceRecords'] = sorted(rrset.get('ResourceRecords', []), key = lambda value: value['Value'])
+    return normal
+
+def desired(records):
+    return {(rrset['Name'], rrset['Type']): rrset for rrset in (record_set(record) for record in records)}
+
+def actual(client, zone_id):
+    found = {}
+    paginator = client.get_paginator('list_resource_record_sets')
+    for page in paginator.paginate(HostedZoneId = zone_id):
+        for rrset in page['ResourceRecordSets']:
+            if 'SetIdentifier' in rrset:
+                continue
+            rrset['Name'] = fqdn(rrset['Name'])
+            found[(rrset['Name'], rrset['Type'])] = rrset
+    return found
+
+def diff(previous, current, live):
+    changes = []
+    for key, rrset in sorted(current.items()):
+        if key not in live or normalize(live[key]) != normalize(rrset):
+            changes.append({'Action': 'UPSERT', 'ResourceRecordSet': rrset})
+    for key in sorted(set(previous) - set(current)):
+        if key in live:
+            changes.append({'Action': 'DELETE', 'ResourceRecordSet': live[key]})
+    return changes
+
+def weight(change):
+    rrset = change['ResourceRecordSet']
+    values = [value['Value'] for value in rrset.get('ResourceRecords', [])]
+    factor = 2 if change['Action'] == 'UPSERT' else 1
+    return factor * max(len(values), 1), factor * sum(len(value) for value in values)
+
+def batches(changes):
+    batch, records, characters = [], 0, 0
+    for change in changes:
+        count, size = weight(change)
+        if batch and (records + count > MAX_RECORDS or characters + size > MAX_CHARACTERS):
+            yield batch
+            batch, records, characters = [], 0, 0
+        batch.append(change)
+        records += count
+        characters += size
+    if batch:
+        yield batch
+
+def apply(client, zone_id, changes):
+    submitted = []
+    for batch in batches(changes):
+        response = client.change_resource_record_sets(
+            HostedZoneId = zone_id,
+            ChangeBatch = {
+                'Comment': 'domains batch',
+                'Changes': batch
+            }
+        )
+        submitted.append(response['ChangeInfo']['Id'])
+    return submitted
+
+def pending(client, change_ids):
+    return [change_id for change_id in change_ids if client.get_change(Id = change_id)['ChangeInfo']['Status'] != 'INSYNC']
+
+def reconcile(client, zone_id, previous, current):
+    live = actual(client, zone_id)
+    changes = diff(desired(previous), desired(current), live)
+    return len(changes), apply(client, zone_id, changes)
+
+def handler(event, context):
+
+    client = boto3.client('route53')
+
+    properties = event['ResourceProperties']
+    zone_id = properties['HostedZoneId']
+    records = json.loads(properties['Records'])
+
+    previous = []
+    if event['RequestType'] == 'Update':
+        old = event['OldResourceProperties']
+        if old['HostedZoneId'] == zone_id:
+            previous = json.loads(old['Records'])
+
+    if event['RequestType'] == 'Delete':
+        previous, records = records, []
+
+    changes, change_ids = reconcile(client, zone_id, previous, records)
+
+    print('Submitted '+str(changes)+' changes to '+zone_id+' in '+str(len(change_ids))+' batches')
+
+    return {
+        'PhysicalResourceId': zone_id+'-'+event['LogicalResourceId'],
+        'Data': {
+            'Changes': changes,
+            'ChangeIds': ','.join(change_ids)
+        }
+    }
+
+def complete(event, context):
+
+    client = boto3.client('route53')
+
+    change_ids = [change_id for change_id in event['Data']['ChangeIds'].split(',') if change_id]
+
+    waiting = pending(client, change_ids)
+
+    print(str(len(change_ids) - len(waiting))+' of '+str(len(change_ids))+' batches in sync')
+
+    return {
+        'IsComplete': not waiting
+    }
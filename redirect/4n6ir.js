@@ -1,10 +0,0 @@
-function handler(event) {
-  const response = {
-    statusCode: 302,
-    statusDescription: 'Found',
-    headers: {
-      'location': {value: 'https://github.com/4n6ir'},
-    }
-  };
-  return response;
-}
\ No newline at end of file
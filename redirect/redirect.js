@@ -1,9 +1,84 @@
-function handler(event) {
+import cf from 'cloudfront';
+
+const config = {"location": "https://github.com/jblukach", "status": 301, "path": false, "query": false, "maxAge": 86400, "store": null, "depth": 4, "hosts": {}};
+
+const store = config.store ? cf.kvs(config.store) : null;
+
+const descriptions = {
+  301: 'Moved Permanently',
+  302: 'Found',
+  307: 'Temporary Redirect',
+  308: 'Permanent Redirect'
+};
+
+function query(querystring) {
+  const parts = [];
+  for (const key in querystring) {
+    const item = querystring[key];
+    const values = item.multiValue ? item.multiValue : [item];
+    for (let i = 0; i < values.length; i++) {
+      parts.push(values[i].value === '' ? key : key + '=' + values[i].value);
+    }
+  }
+  return parts.length ? '?' + parts.join('&') : '';
+}
+
+function candidates(host, uri) {
+  const keys = [host + uri];
+  const segments = uri.split('/');
+  for (let i = segments.length - 1; i > 0 && keys.length <= config.depth; i--) {
+    keys.push(host + segments.slice(0, i).join('/') + '/*');
+  }
+  return keys;
+}
+
+async function lookup(host, uri) {
+  const hosts = [host, '*'];
+  for (let h = 0; h < hosts.length; h++) {
+    const keys = candidates(hosts[h], uri);
+    for (let i = 0; i < keys.length; i++) {
+      try {
+        const value = await store.get(keys[i]);
+        const space = value.indexOf(' ');
+        let location = value.slice(space + 1);
+        if (keys[i].charAt(keys[i].length - 1) === '*') {
+          const prefix = keys[i].slice(hosts[h].length, -1);
+          location = location.replace('*', uri.slice(prefix.length));
+        }
+        return {status: parseInt(value.slice(0, space), 10), location: location};
+      } catch (e) {
+        continue;
+      }
+    }
+  }
+  return null;
+}
+
+async function handler(event) {
+  const request = event.request;
+  const host = request.headers['host'] ? request.headers['host'].value.toLowerCase() : '';
+  const site = config.hosts[host] || config;
+  let status = site.status;
+  let location = site.location;
+  let matched = null;
+  if (store) {
+    matched = await lookup(host, request.uri);
+  }
+  if (matched) {
+    status = matched.status;
+    location = matched.location;
+  } else if (site.path) {
+    location = location.replace(/\/$/, '') + request.uri;
+  }
+  if (site.query) {
+    location = location + query(request.querystring);
+  }
   const response = {
-    statusCode: 302,
-    statusDescription: 'Found',
+    statusCode: status,
+    statusDescription: descriptions[status],
     headers: {
-      'location': {value: 'https://github.com/jblukach'},
+      'location': {value: location},
+      'cache-control': {value: site.maxAge > 0 ? 'public, max-age=' + site.maxAge : 'no-store'}
     }
   };
   return response;
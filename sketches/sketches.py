@@ -0,0 +1,236 @@
+import base64
+import gzip
+import hashlib
+import heapq
+import json
+import math
+import os
+import time
+
+from datetime import datetime
+
+import boto3
+
+NAMESPACE = 'Route53/QueryLogs'
+
+WINDOW = int(os.environ.get('WINDOW', '60'))
+INTERVAL = int(os.environ.get('INTERVAL', '10'))
+LIMIT = int(os.environ.get('LIMIT', '10'))
+MAX_CHARACTERS = 4096
+
+def digest(key):
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size = 8).digest(), 'big')
+
+class CountMin:
+
+    def __init__(self, width = 2048, depth = 4):
+        self.width = width
+        self.depth = depth
+        self.table = [[0] * width for _ in range(depth)]
+
+    def cells(self, key):
+        value = digest(key)
+        first = value & 0xffffffff
+        second = value >> 32
+        return [(first + row * second) % self.width for row in range(self.depth)]
+
+    def add(self, key, count = 1):
+        cells = self.cells(key)
+        for row, cell in enumerate(cells):
+            self.table[row][cell] += count
+        return min(self.table[row][cell] for row, cell in enumerate(cells))
+
+    def estimate(self, key):
+        return min(self.table[row][cell] for row, cell in enumerate(self.cells(key)))
+
+# Top-k over a Count-Min sketch: a lazy min-heap keeps the keys with the largest
+# estimates, so counts inherit the sketch's overestimate (not Space-Saving).
+
+class CountMinHeap:
+
+    def __init__(self, capacity = 100, width = 2048, depth = 4):
+        self.capacity = capacity
+        self.sketch = CountMin(width, depth)
+        self.counts = {}
+        self.heap = []
+
+    def add(self, key, count = 1):
+        estimate = self.sketch.add(key, count)
+        if key in self.counts:
+            self.counts[key] = estimate
+            heapq.heappush(self.heap, (estimate, key))
+        elif len(self.counts) < self.capacity:
+            self.counts[key] = estimate
+            heapq.heappush(self.heap, (estimate, key))
+        elif estimate > self.minimum():
+            del self.counts[heapq.heappop(self.heap)[1]]
+            self.counts[key] = estimate
+            heapq.heappush(self.heap, (estimate, key))
+        if len(self.heap) > self.capacity * 4:
+            self.heap = [(count, key) for key, count in self.counts.items()]
+            heapq.heapify(self.heap)
+
+    def minimum(self):
+        while self.heap and self.counts.get(self.heap[0][1]) != self.heap[0][0]:
+            heapq.heappop(self.heap)
+        return self.heap[0][0] if self.heap else 0
+
+    def top(self, limit):
+        return sorted(self.counts.items(), key = lambda item: (-item[1], item[0]))[:limit]
+
+class HyperLogLog:
+
+    def __init__(self, precision = 12):
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(self.size)
+
+    def add(self, key):
+        value = digest(key)
+        index = value >> (64 - self.precision)
+        rest = value & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def estimate(self):
+        alpha = 0.7213 / (1 + 1.079 / self.size)
+        raw = alpha * self.size * self.size / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * self.size and zeros:
+            return self.size * math.log(self.size / zeros)
+        return raw
+
+class Window:
+
+    def __init__(self, zone, started):
+        self.zone = zone
+        self.started = started
+        self.queries = 0
+        self.nxdomain = 0
+        self.first = None
+        self.last = None
+        self.names = CountMinHeap()
+        self.sources = CountMinHeap()
+        self.resolvers = HyperLogLog()
+        self.qnames = HyperLogLog()
+
+    def add(self, query):
+        self.queries += 1
+        self.first = query['timestamp'] if self.first is None else min(self.first, query['timestamp'])
+        self.last = query['timestamp'] if self.last is None else max(self.last, query['timestamp'])
+        if query['rcode'] == 'NXDOMAIN':
+            self.nxdomain += 1
+        self.names.add(query['qname'])
+        self.sources.add(query['resolver'])
+        self.resolvers.add(query['resolver'])
+        self.qnames.add(query['qname'])
+
+    def snapshot(self, limit = LIMIT):
+        seconds = max(self.last - self.first, 1) if self.queries else 1
+        return {
+            'zone': self.zone,
+            'started': int(self.started),
+            'seconds': round(seconds, 1),
+            'queries': self.queries,
+            'qps': round(self.queries / seconds, 2),
+            'nxdomain': self.nxdomain,
+            'resolvers': round(self.resolvers.estimate()),
+            'qnames': round(self.qnames.estimate()),
+            'names': [[name, count] for name, count in self.names.top(limit)],
+            'sources': [[source, count] for source, count in self.sources.top(limit)]
+        }
+
+def parse(message):
+    fields = message.split()
+    if len(fields) < 9 or fields[0] != '1.0':
+        return None
+    try:
+        timestamp = datetime.fromisoformat(fields[1].replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+    return {
+        'timestamp': timestamp,
+        'qname': fields[3].lower().rstrip('.'),
+        'rcode': fields[5],
+        'resolver': fields[8]
+    }
+
+def aggregate(window, messages):
+    counts = {'queries': 0, 'nxdomain': 0}
+    for message in messages:
+        query = parse(message)
+        if query is None:
+            continue
+        window.add(query)
+        counts['queries'] += 1
+        if query['rcode'] == 'NXDOMAIN':
+            counts['nxdomain'] += 1
+    return counts
+
+def metric(snapshot, counts, now):
+    return {
+        '_aws': {
+            'Timestamp': int(now * 1000),
+            'CloudWatchMetrics': [
+                {
+                    'Namespace': NAMESPACE,
+                    'Dimensions': [['Zone']],
+                    'Metrics': [
+                        {'Name': 'Queries', 'Unit': 'Count'},
+                        {'Name': 'NXDOMAIN', 'Unit': 'Count'},
+                        {'Name': 'QueriesPerSecond', 'Unit': 'Count/Second'},
+                        {'Name': 'DistinctResolvers', 'Unit': 'Count'},
+                        {'Name': 'DistinctNames', 'Unit': 'Count'},
+                        {'Name': 'TopNameQueries', 'Unit': 'Count'}
+                    ]
+                }
+            ]
+        },
+        'Zone': snapshot['zone'],
+        'Queries': counts['queries'],
+        'NXDOMAIN': counts['nxdomain'],
+        'QueriesPerSecond': snapshot['qps'],
+        'DistinctResolvers': snapshot['resolvers'],
+        'DistinctNames': snapshot['qnames'],
+        'TopNameQueries': snapshot['names'][0][1] if snapshot['names'] else 0,
+        'TopName': snapshot['names'][0][0] if snapshot['names'] else ''
+    }
+
+def truncate(snapshot):
+    snapshot = dict(snapshot)
+    while len(json.dumps(snapshot, separators = (',', ':'))) > MAX_CHARACTERS and (snapshot['names'] or snapshot['sources']):
+        longest = 'names' if len(snapshot['names']) >= len(snapshot['sources']) else 'sources'
+        snapshot[longest] = snapshot[longest][:-1]
+    return json.dumps(snapshot, separators = (',', ':'))
+
+WINDOWS = {}
+PUBLISHED = {}
+
+def handler(event, context):
+
+    payload = json.loads(gzip.decompress(base64.b64decode(event['awslogs']['data'])))
+
+    if payload.get('messageType') != 'DATA_MESSAGE':
+        return
+
+    zone = payload['logGroup'].rsplit('/', 1)[-1]
+    now = time.time()
+
+    window = WINDOWS.get(zone)
+    if window is None or now - window.started >= WINDOW:
+        window = WINDOWS[zone] = Window(zone, now)
+
+    counts = aggregate(window, (item['message'] for item in payload['logEvents']))
+    snapshot = window.snapshot()
+
+    print(json.dumps(metric(snapshot, counts, now), separators = (',', ':')))
+
+    if now - PUBLISHED.get(zone, 0) >= INTERVAL:
+        boto3.client('ssm').put_parameter(
+            Name = os.environ['PARAMETER'],
+            Value = truncate(snapshot),
+            Type = 'String',
+            Overwrite = True
+        )
+        PUBLISHED[zone] = now
@@ -0,0 +1,51 @@
+import gzip
+import math
+
+from tools import accesslogs
+
+def rows(path):
+    with gzip.open(path, 'rt') as f:
+        names = None
+        for line in f:
+            if line.startswith('#Fields:'):
+                names = line.split()[1:]
+            elif not line.startswith('#'):
+                yield dict(zip(names, line.rstrip('\n').split('\t')))
+
+def quantile(values, q):
+    values = sorted(values)
+    position = q * (len(values) - 1)
+    lower = math.floor(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+def test_report(tmp_path):
+    path = str(tmp_path / 'access.gz')
+    accesslogs.generate(path, 5000, 7)
+    table, invalid = accesslogs.load([path])
+    report = accesslogs.analyze(table, invalid = invalid)
+    expected = list(rows(path))
+    results = [row['x-edge-result-type'] for row in expected]
+    cacheable = sum(result in accesslogs.CACHEABLE for result in results)
+    taken = [float(row['time-taken']) for row in expected]
+    assert report['requests'] == 5000
+    assert report['invalid'] == 0
+    assert math.isclose(report['hit_ratio'], sum(result in accesslogs.HITS for result in results) / cacheable)
+    assert math.isclose(report['origin_rate'], sum(result in accesslogs.ORIGIN for result in results) / cacheable)
+    for q in accesslogs.QUANTILES:
+        assert math.isclose(report['time_taken'][format(q, 'g')], quantile(taken, q))
+    assert sum(host['requests'] for host in report['hosts']) == 5000
+
+def test_invalid_rows(tmp_path):
+    source = str(tmp_path / 'access.gz')
+    accesslogs.generate(source, 100, 7)
+    with gzip.open(source, 'rt') as f:
+        lines = f.readlines()
+    lines.insert(10, 'truncated\trow\n')
+    lines.append('\t'.join(['-'] * (len(accesslogs.FIELDS) + 2))+'\n')
+    path = tmp_path / 'access.log'
+    path.write_text(''.join(lines))
+    table, invalid = accesslogs.load([str(path)])
+    report = accesslogs.analyze(table, invalid = invalid)
+    assert report['requests'] == 100
+    assert report['invalid'] == 2
@@ -0,0 +1,37 @@
+import pytest
+
+from tools import analytics
+from tools.querylog import read
+
+LINES = [
+    '1.0 2025-01-01T00:00:00.000Z Z123 www.lukach.io. A NOERROR UDP IAD89-C1 192.0.2.1 -\n',
+    '1.0 2025-01-01T00:00:01.000Z Z123 NX.lukach.io. AAAA NXDOMAIN UDP FRA56-P2 192.0.2.2 -\n',
+    '1.0 2025-01-01T00:00:02.000Z Z123 lukach.io. TXT NOERROR TCP IAD89-C1 192.0.2.3\n',
+    '1.0 2025-01-01T00:00:03.000Z Z123 lukach.io. MX NOERROR UDP IAD89-C1 192.0.2.3 198.51.100.0/24 extra\n',
+    'truncated line\n',
+    '1.0 not-a-timestamp\n',
+    '\n'
+]
+
+@pytest.mark.parametrize('prefix', ['', '2025-01-01T00:00:00.000Z '])
+def test_fast_path_matches_querylog(tmp_path, prefix):
+    path = tmp_path / 'queries.log'
+    path.write_text(''.join(prefix+line if line.strip() else line for line in LINES))
+    table, invalid = analytics.load([str(path)])
+    report = analytics.analyze(table, invalid = invalid)
+    assert report['queries'] == len(list(read([str(path)]))) == 4
+    assert report['invalid'] == 2
+    assert report['nxdomain']['queries'] == 1
+    assert sorted(table['qname'].to_pylist()) == ['lukach.io', 'lukach.io', 'nx.lukach.io', 'www.lukach.io']
+
+def test_generated_report(tmp_path):
+    path = str(tmp_path / 'queries.log')
+    analytics.generate(path, 3000, 3)
+    table, invalid = analytics.load([path])
+    report = analytics.analyze(table, unit = 'second', invalid = invalid)
+    expected = list(read([path]))
+    assert report['queries'] == len(expected) == 3000
+    assert report['invalid'] == 0
+    assert report['nxdomain']['queries'] == sum(query.rcode == 'NXDOMAIN' for query in expected)
+    assert sum(count for moment, count in report['qps']['Z0123456789']) == 3000
+    assert report['first'] == '2025-01-01T00:00:00+00:00'
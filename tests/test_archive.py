@@ -0,0 +1,47 @@
+import base64
+import gzip
+import json
+
+from archive import archive
+
+def record(record_id, messages):
+    payload = {
+        'messageType': 'DATA_MESSAGE',
+        'logGroup': '/aws/route53/lukachio',
+        'logEvents': [{'message': message} for message in messages]
+    }
+    return {'recordId': record_id, 'data': base64.b64encode(gzip.compress(json.dumps(payload).encode())).decode()}
+
+def message(timestamp, qname):
+    return '1.0 '+timestamp+' Z123 '+qname+' A NOERROR UDP IAD89-C1 192.0.2.1 -'
+
+def rows(output):
+    return [json.loads(line) for line in base64.b64decode(output['data']).decode().splitlines()]
+
+def test_batch_across_midnight(monkeypatch):
+    reingested = []
+    monkeypatch.setattr(archive, 'reingest', reingested.extend)
+    result = archive.handler(
+        {
+            'records': [
+                record('1', [message('2026-01-01T23:59:59Z', 'A.lukach.io.'), message('2026-01-02T00:00:01Z', 'b.lukach.io.')])
+            ]
+        },
+        None
+    )
+    output = result['records'][0]
+    assert output['metadata']['partitionKeys'] == {'zone': 'lukachio', 'date': '2026-01-01'}
+    assert [row['qname'] for row in rows(output)] == ['a.lukach.io']
+    assert len(reingested) == 1
+
+    again = archive.handler({'records': [{'recordId': '2', 'data': base64.b64encode(reingested[0]['Data']).decode()}]}, None)
+    output = again['records'][0]
+    assert output['metadata']['partitionKeys'] == {'zone': 'lukachio', 'date': '2026-01-02'}
+    assert [row['qname'] for row in rows(output)] == ['b.lukach.io']
+
+def test_single_day_is_not_reingested(monkeypatch):
+    reingested = []
+    monkeypatch.setattr(archive, 'reingest', reingested.extend)
+    result = archive.handler({'records': [record('1', [message('2026-01-01T12:00:00Z', 'a.lukach.io')])]}, None)
+    assert result['records'][0]['result'] == 'Ok'
+    assert reingested == []
@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from records import records
+from tools.route53local import LocalRoute53, UnsupportedOperation
+
+ZONE = 'Z0LOCAL'
+
+WWW = {'name': 'www.example.com', 'type': 'CNAME', 'values': ['example.github.io'], 'ttl': 300}
+TXT = {'name': 'example.com', 'type': 'TXT', 'values': ['v=spf1 -all']}
+
+@pytest.fixture
+def route53(monkeypatch):
+    client = LocalRoute53([ZONE])
+    client.add(ZONE, {'Name': 'unmanaged.example.com.', 'Type': 'A', 'TTL': 60, 'ResourceRecords': [{'Value': '192.0.2.1'}]})
+    monkeypatch.setattr(records.boto3, 'client', lambda service: client)
+    return client
+
+def event(request_type, current, previous = None):
+    item = {
+        'RequestType': request_type,
+        'LogicalResourceId': 'recordset',
+        'ResourceProperties': {'HostedZoneId': ZONE, 'Records': json.dumps(current)}
+    }
+    if previous is not None:
+        item['OldResourceProperties'] = {'HostedZoneId': ZONE, 'Records': json.dumps(previous)}
+    return item
+
+def deploy(request):
+    response = records.handler(request, None)
+    polls = 0
+    while not records.complete({**request, **response}, None)['IsComplete']:
+        polls += 1
+    return response['Data']['Changes'], polls
+
+def names(client):
+    return sorted(name for name, _ in client.zones[ZONE])
+
+def test_create_then_noop(route53):
+    assert deploy(event('Create', [WWW, TXT]))[0] == 2
+    assert deploy(event('Update', [WWW, TXT], [WWW, TXT])) == (0, 0)
+    assert names(route53) == ['example.com.', 'unmanaged.example.com.', 'www.example.com.']
+
+def test_drift_is_repaired(route53):
+    deploy(event('Create', [WWW]))
+    route53.add(ZONE, {'Name': 'www.example.com.', 'Type': 'CNAME', 'TTL': 300, 'ResourceRecords': [{'Value': 'drifted.example.net'}]})
+    assert deploy(event('Update', [WWW], [WWW]))[0] == 1
+    assert route53.zones[ZONE][('www.example.com.', 'CNAME')]['ResourceRecords'] == [{'Value': 'example.github.io'}]
+
+def test_removed_record_is_deleted(route53):
+    deploy(event('Create', [WWW, TXT]))
+    assert deploy(event('Update', [WWW], [WWW, TXT]))[0] == 1
+    assert names(route53) == ['unmanaged.example.com.', 'www.example.com.']
+
+def test_delete_leaves_unmanaged_records(route53):
+    deploy(event('Create', [WWW, TXT]))
+    assert deploy(event('Delete', [WWW, TXT]))[0] == 2
+    assert names(route53) == ['unmanaged.example.com.']
+
+def test_batches_are_submitted_before_polling(route53):
+    many = [{'name': 'host'+str(number)+'.example.com', 'type': 'A', 'values': ['192.0.2.'+str(number % 250 + 1)]} for number in range(1200)]
+    request = event('Create', many)
+    response = records.handler(request, None)
+    assert len(route53.calls) == 3
+    assert route53.polls == []
+    assert records.complete({**request, **response}, None) == {'IsComplete': False}
+    assert records.complete({**request, **response}, None) == {'IsComplete': True}
+
+def test_local_client_names_supported_calls(route53):
+    with pytest.raises(UnsupportedOperation, match = 'supports only change_resource_record_sets, get_change, get_paginator, not list_hosted_zones'):
+        route53.list_hosted_zones()
+    with pytest.raises(UnsupportedOperation, match = 'paginates only list_resource_record_sets'):
+        route53.get_paginator('list_hosted_zones')
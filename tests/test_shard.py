@@ -0,0 +1,96 @@
+import json
+import os
+
+import aws_cdk as cdk
+import pytest
+
+from domains.domains_shard import LIMIT, SHARDS, plan
+from domains.domains_spec import DomainSpec, RecordSpec
+from domains.domains_zone import DomainsZone
+
+ZONE = 'shard.example'
+
+def cnames(count, labels = False):
+    return tuple(
+        RecordSpec(
+            id = 'cname'+str(number),
+            type = 'CNAME',
+            name = ('host'+str(number)+'.label'+str(number) if labels else 'host'+str(number))+'.'+ZONE,
+            values = ('target.example.com',)
+        )
+        for number in range(count)
+    )
+
+def synth(tmp_path, records, strategy):
+    app = cdk.App(outdir = str(tmp_path))
+    DomainsZone(
+        app, 'DomainsShardTest',
+        spec = DomainSpec(
+            stack = 'DomainsShardTest',
+            zone = ZONE,
+            policy = 'ShardTest',
+            records = records,
+            shards = strategy
+        ),
+        env = cdk.Environment(account = '123456789012', region = 'us-east-1')
+    )
+    assembly = app.synth()
+    templates = {}
+    for name in os.listdir(assembly.directory):
+        if name.endswith('.template.json'):
+            with open(os.path.join(assembly.directory, name)) as f:
+                templates[name] = json.load(f)['Resources']
+    return templates
+
+def counts(templates):
+    parent = templates['DomainsShardTest.template.json']
+    nested = [item for item in parent.values() if item['Type'] == 'AWS::CloudFormation::Stack']
+    records = sum(
+        1
+        for resources in templates.values()
+        for item in resources.values()
+        if item['Type'] == 'AWS::Route53::RecordSet'
+    )
+    largest = max(
+        len(resources)
+        for name, resources in templates.items()
+        if name != 'DomainsShardTest.template.json'
+    )
+    return len(nested), records, largest
+
+@pytest.mark.parametrize('count', [600, 5000])
+def test_type_shards_split(tmp_path, count):
+    nested, records, largest = counts(synth(tmp_path, cnames(count), 'type'))
+    assert records == count
+    assert nested > 1
+    assert largest <= LIMIT
+
+@pytest.mark.parametrize('count', [600, 5000])
+def test_prefix_shards_capped(tmp_path, count):
+    nested, records, largest = counts(synth(tmp_path, cnames(count, labels = True), 'prefix'))
+    assert records == count
+    assert nested <= SHARDS
+    assert largest <= LIMIT
+
+def test_plan_is_stable():
+    items = [('CNAME', 'host'+str(number)+'.'+ZONE, 1) for number in range(600)]
+    first = plan('type', ZONE, items)
+    second = plan('type', ZONE, list(reversed(items)))
+    assert first == second
+    assert set(first.values()) == {'recordsCname', 'recordsCnamePart1'}
+
+@pytest.mark.parametrize('strategy, labels', [('type', False), ('prefix', True)])
+def test_adding_records_moves_one_shard(strategy, labels):
+    items = []
+    previous = {}
+    for number in range(3000):
+        name = 'host'+str(number)+('.label'+str(number) if labels else '')+'.'+ZONE
+        items.append(('CNAME', name, 1))
+        current = plan(strategy, ZONE, items)
+        moved = {previous[item] for item in previous if current[item] != previous[item]}
+        assert len(moved) <= 1
+        previous = current
+
+def test_plan_keeps_small_shards():
+    items = [('CNAME', 'www.'+ZONE, 1), ('TXT', None, 1), ('ALIAS', 'cdn.'+ZONE, 2)]
+    assert set(plan('type', ZONE, items).values()) == {'recordsCname', 'recordsTxt', 'recordsAlias'}
@@ -0,0 +1,85 @@
+import base64
+import gzip
+import json
+import random
+
+from sketches import sketches
+
+def zipf(generator, names, count):
+    weights = [1 / rank for rank in range(1, len(names) + 1)]
+    return generator.choices(names, weights = weights, k = count)
+
+def test_hyperloglog_within_error_bound():
+    for distinct in (1000, 20000, 200000):
+        sketch = sketches.HyperLogLog(precision = 12)
+        for number in range(distinct):
+            sketch.add('198.51.'+str(number))
+        error = 1.04 / (sketch.size ** 0.5)
+        assert abs(sketch.estimate() - distinct) <= 3 * error * distinct
+
+def test_countmin_never_underestimates():
+    generator = random.Random(1)
+    stream = zipf(generator, ['name'+str(number) for number in range(5000)], 50000)
+    sketch = sketches.CountMin(width = 2048, depth = 4)
+    truth = {}
+    for key in stream:
+        sketch.add(key)
+        truth[key] = truth.get(key, 0) + 1
+    bound = 2.718281828 / sketch.width * len(stream)
+    over = [sketch.estimate(key) - count for key, count in truth.items()]
+    assert min(over) >= 0
+    assert sum(1 for value in over if value > bound) <= 0.05 * len(over)
+
+def test_heavy_hitters_top_k():
+    generator = random.Random(2)
+    names = ['name'+str(number) for number in range(5000)]
+    stream = zipf(generator, names, 50000)
+    hitters = sketches.CountMinHeap(capacity = 100)
+    truth = {}
+    for key in stream:
+        hitters.add(key)
+        truth[key] = truth.get(key, 0) + 1
+    expected = sorted(truth, key = lambda key: -truth[key])[:5]
+    assert [key for key, count in hitters.top(5)] == expected
+    for key, count in hitters.top(5):
+        assert count >= truth[key]
+
+def test_handler_emits_embedded_metric_format(monkeypatch, capsys):
+    parameters = []
+    monkeypatch.setattr(sketches.boto3, 'client', lambda service: type('SSM', (), {'put_parameter': lambda self, **kwargs: parameters.append(kwargs)})())
+    monkeypatch.setenv('PARAMETER', '/route53/lukachio/sketches')
+    sketches.WINDOWS.clear()
+    sketches.PUBLISHED.clear()
+    messages = [
+        '1.0 2026-01-01T00:00:00Z Z123 www.lukach.io. A NOERROR UDP IAD89-C1 192.0.2.'+str(number % 10)+' -'
+        for number in range(30)
+    ] + ['1.0 2026-01-01T00:00:00Z Z123 missing.lukach.io. A NXDOMAIN UDP IAD89-C1 192.0.2.1 -', 'garbage']
+    payload = {
+        'messageType': 'DATA_MESSAGE',
+        'logGroup': '/aws/route53/lukachio',
+        'logEvents': [{'message': message} for message in messages]
+    }
+    sketches.handler({'awslogs': {'data': base64.b64encode(gzip.compress(json.dumps(payload).encode())).decode()}}, None)
+    line = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    definition = line['_aws']['CloudWatchMetrics'][0]
+    assert definition['Namespace'] == 'Route53/QueryLogs'
+    assert definition['Dimensions'] == [['Zone']]
+    for item in definition['Metrics']:
+        assert isinstance(line[item['Name']], (int, float))
+    assert line['Zone'] == 'lukachio'
+    assert line['Queries'] == 31
+    assert line['NXDOMAIN'] == 1
+    assert line['DistinctResolvers'] == 10
+    assert line['TopName'] == 'www.lukach.io'
+    assert line['TopNameQueries'] == 30
+    assert json.loads(parameters[0]['Value'])['names'][0] == ['www.lukach.io', 30]
+
+def test_qps_uses_log_timestamps():
+    window = sketches.Window('lukachio', 0)
+    for number in range(50):
+        second = format(number // 5, '02')
+        window.add(sketches.parse('1.0 2026-01-01T00:00:'+second+'Z Z123 www.lukach.io. A NOERROR UDP IAD89-C1 192.0.2.1 -'))
+    snapshot = window.snapshot()
+    assert snapshot['seconds'] == 9
+    assert snapshot['qps'] == round(50 / 9, 2)
+    assert sketches.parse('1.0 yesterday Z123 www.lukach.io. A NOERROR UDP IAD89-C1 192.0.2.1 -') is None
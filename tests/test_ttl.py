@@ -0,0 +1,61 @@
+import json
+
+from domains.domains_spec import DomainSpec, RecordSpec
+from tools import ttl
+from tools.querylog import parse
+
+SPEC = DomainSpec(
+    stack = 'DomainsExample',
+    zone = 'example.com',
+    policy = 'Example',
+    records = (
+        RecordSpec(id = 'blog', type = 'CNAME', name = 'blog.example.com', values = ('example.github.io',)),
+        RecordSpec(id = 'www', type = 'A', name = 'www.example.com', values = ('192.0.2.1',), ttl = 300),
+        RecordSpec(id = 'txt', type = 'TXT', values = ('v=spf1 -all',))
+    )
+)
+
+def query(second, qname, qtype, resolver = '192.0.2.53'):
+    return parse('1.0 2026-01-01T00:'+format(second // 60, '02')+':'+format(second % 60, '02')+'Z Z123 '+qname+'. '+qtype+' NOERROR UDP IAD89-C1 '+resolver+' -')
+
+def test_usage_credits_cname_for_any_type():
+    queries = [
+        query(0, 'blog.example.com', 'A'),
+        query(1, 'blog.example.com', 'AAAA'),
+        query(2, 'blog.example.com', 'TXT', '198.51.100.53'),
+        query(3, 'www.example.com', 'A'),
+        query(4, 'www.example.com', 'TXT'),
+        query(10, 'other.example.com', 'A')
+    ]
+    stats, window = ttl.usage(queries, ttl.managed([SPEC]))
+    assert window == 10
+    assert sum(stats[('blog.example.com', 'CNAME')].values()) == 3
+    assert len(stats[('blog.example.com', 'CNAME')]) == 2
+    assert sum(stats[('www.example.com', 'A')].values()) == 1
+    assert ('www.example.com', 'TXT') not in stats
+
+def test_cap():
+    assert ttl.cap([]) == ttl.LADDER[-1]
+    assert ttl.cap([100]) == ttl.LADDER[-1]
+    assert ttl.cap([0, 4000, 8000, 20000]) == 1000
+
+def test_propose():
+    assert ttl.propose(300, 1, 1000) == 900
+    assert ttl.propose(300, ttl.MINIMUM_RATE / 2, 1000) == 300
+    assert ttl.propose(3600, 0, 1000) == 900
+    assert ttl.propose(300, 1, 10) == ttl.LADDER[0]
+
+def test_write_prunes_removed_records(tmp_path):
+    path = tmp_path / 'ttl.json'
+    path.write_text(
+        json.dumps(
+            {
+                'example.com': {'gone.example.com A': 60, 'example.com TXT': 900},
+                'removed.com': {'removed.com A': 60}
+            }
+        )
+    )
+    queries = [query(second, 'blog.example.com', 'A') for second in range(0, 3600, 2)]
+    ttl.write(ttl.analyze(queries, {}, [SPEC]), str(path))
+    values = json.loads(path.read_text())
+    assert values == {'example.com': {'blog.example.com CNAME': 86400, 'example.com TXT': 900}}
@@ -0,0 +1,76 @@
+import pytest
+
+from domains.domains_spec import DomainSpec, RecordSpec
+from domains.domains_zonefile import dump, load, verify
+
+ZONE = '''$ORIGIN example.com.
+$TTL 300
+www A 192.0.2.1
+mail MX 10 mx
+www A 192.0.2.2
+'''
+
+def test_non_adjacent_records_share_a_set():
+    records = list(load(ZONE.splitlines(True), 'example.com'))
+    assert [record.id for record in records] == ['www-a', 'mail-mx']
+    assert records[0].values == ('192.0.2.1', '192.0.2.2')
+    assert records[1].values == ('10 mx.example.com',)
+
+def test_directives_are_inherited():
+    records = {
+        record.id: record
+        for record in load(
+            [
+                '$TTL 1h\n',
+                'example.com. IN A 192.0.2.1\n',
+                '$ORIGIN sub.example.com.\n',
+                'api 60 CNAME target\n',
+                'web CNAME @\n'
+            ],
+            'example.com'
+        )
+    }
+    assert records['@-a'].ttl == 3600
+    assert records['@-a'].name is None
+    assert records['api.sub-cname'].ttl == 60
+    assert records['api.sub-cname'].values == ('target.sub.example.com',)
+    assert records['web.sub-cname'].ttl == 3600
+    assert records['web.sub-cname'].values == ('sub.example.com',)
+
+def test_conflicting_ttls_take_the_lowest():
+    lines = ['$ORIGIN example.com.\n', 'www 300 A 192.0.2.1\n', 'www 60 A 192.0.2.2\n']
+    with pytest.warns(UserWarning, match = 'using the lower'):
+        records = list(load(lines, 'example.com'))
+    assert records[0].ttl == 60
+    assert records[0].values == ('192.0.2.1', '192.0.2.2')
+
+def test_parentheses_span_lines():
+    records = list(
+        load(
+            [
+                '$ORIGIN example.com.\n',
+                '@ 300 IN SOA ns1 hostmaster ( 1 ; serial\n',
+                '    7200 3600 1209600 300 )\n',
+                'txt 300 IN TXT ( "first part" ; comment\n',
+                '    "second part" )\n',
+                '        300 IN TXT "other"\n'
+            ],
+            'example.com'
+        )
+    )
+    assert [record.id for record in records] == ['txt-txt']
+    assert records[0].values == ('first partsecond part', 'other')
+
+def test_export_round_trips():
+    spec = DomainSpec(
+        stack = 'DomainsExample',
+        zone = 'example.com',
+        policy = 'Example',
+        records = (
+            RecordSpec(id = 'mx', type = 'MX', values = ('10 mx.example.com', '20 backup.example.net')),
+            RecordSpec(id = 'txt', type = 'TXT', values = ('v=spf1 -all', 'a "quoted" '+'x' * 300)),
+            RecordSpec(id = 'www', type = 'CNAME', name = 'www.example.com', values = ('example.net',), ttl = 60)
+        )
+    )
+    assert verify(spec)
+    assert {record.id for record in load(dump(spec), 'example.com')} == {'@-mx', '@-txt', 'www-cname'}
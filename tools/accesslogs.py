@@ -0,0 +1,336 @@
+import argparse
+import datetime
+import gzip
+import json
+import random
+import sys
+
+from tools.archive import arrow
+from tools.querylog import files
+
+COLUMNS = {
+    'date': 'date',
+    'time': 'time',
+    'x-edge-location': 'edge',
+    'sc-bytes': 'bytes',
+    'x-host-header': 'host',
+    'cs-uri-stem': 'uri',
+    'sc-status': 'status',
+    'x-edge-result-type': 'result',
+    'time-taken': 'time_taken',
+    'time-to-first-byte': 'ttfb'
+}
+
+HITS = ('Hit', 'RefreshHit')
+ORIGIN = ('Miss', 'RefreshHit')
+CACHEABLE = ('Hit', 'RefreshHit', 'Miss')
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+FIELDS = (
+    'date', 'time', 'x-edge-location', 'sc-bytes', 'c-ip', 'cs-method', 'cs(Host)', 'cs-uri-stem',
+    'sc-status', 'cs(Referer)', 'cs(User-Agent)', 'cs-uri-query', 'cs(Cookie)', 'x-edge-result-type',
+    'x-edge-request-id', 'x-host-header', 'cs-protocol', 'cs-bytes', 'time-taken', 'x-forwarded-for',
+    'ssl-protocol', 'ssl-cipher', 'x-edge-response-result-type', 'cs-protocol-version', 'fle-status',
+    'fle-encrypted-fields', 'c-port', 'time-to-first-byte', 'x-edge-detailed-result-type',
+    'sc-content-type', 'sc-content-len', 'sc-range-start', 'sc-range-end'
+)
+
+def types(pa):
+    return {
+        'sc-bytes': pa.int64(),
+        'sc-status': pa.int64(),
+        'time-taken': pa.float64(),
+        'time-to-first-byte': pa.float64()
+    }
+
+### SOURCES ###
+
+def sources(paths):
+    pa = arrow()
+    import pyarrow.fs
+    for path in paths:
+        if '://' in path:
+            filesystem, root = pa.fs.FileSystem.from_uri(path)
+            selector = pa.fs.FileSelector(root, recursive = True, allow_not_found = True)
+            for info in sorted(filesystem.get_file_info(selector), key = lambda info: info.path):
+                if info.type == pa.fs.FileType.File:
+                    yield filesystem, info.path
+        else:
+            for name in files([path]):
+                yield pa.fs.LocalFileSystem(), name
+
+def content(filesystem, path):
+    with filesystem.open_input_stream(path) as stream:
+        data = stream.read()
+    if data[:2] == b'\x1f\x8b':
+        data = gzip.decompress(data)
+    return data
+
+def header(data):
+    names = None
+    skip = 0
+    for line in data.split(b'\n'):
+        if not line.startswith(b'#'):
+            break
+        skip += 1
+        if line.startswith(b'#Fields:'):
+            names = line[len(b'#Fields:'):].decode().split()
+    return names, skip
+
+### COLUMNAR ###
+
+def read(filesystem, path, invalid):
+    pa = arrow()
+    import pyarrow.csv
+    data = content(filesystem, path)
+    names, skip = header(data)
+    if names is None or 'date' not in names or 'time' not in names:
+        return None
+    def handler(row):
+        invalid.append(row.number)
+        return 'skip'
+    table = pa.csv.read_csv(
+        pa.BufferReader(data),
+        read_options = pa.csv.ReadOptions(
+            column_names = names,
+            skip_rows = skip
+        ),
+        parse_options = pa.csv.ParseOptions(
+            delimiter = '\t',
+            quote_char = False,
+            invalid_row_handler = handler
+        ),
+        convert_options = pa.csv.ConvertOptions(
+            include_columns = list(COLUMNS),
+            include_missing_columns = True,
+            column_types = {
+                **{name: pa.string() for name in COLUMNS},
+                **types(pa)
+            },
+            null_values = ['-'],
+            strings_can_be_null = True
+        )
+    )
+    table = table.rename_columns([COLUMNS[name] for name in table.column_names])
+    pc = pa.compute
+    timestamp = pc.strptime(
+        pc.binary_join_element_wise(table['date'], table['time'], 'T'),
+        format = '%Y-%m-%dT%H:%M:%S',
+        unit = 's'
+    )
+    table = table.drop_columns(['date', 'time'])
+    return table.add_column(0, 'timestamp', pc.assume_timezone(timestamp, 'UTC'))
+
+def load(paths):
+    pa = arrow()
+    invalid = []
+    tables = [table for table in (read(filesystem, path, invalid) for filesystem, path in sources(paths)) if table is not None]
+    if not tables:
+        raise ValueError('No access logs found')
+    return pa.concat_tables(tables).combine_chunks(), len(invalid)
+
+### ANALYSIS ###
+
+def flags(table):
+    pa = arrow()
+    pc = pa.compute
+    result = table['result']
+    for name, values in (('hit', HITS), ('origin', ORIGIN), ('cacheable', CACHEABLE)):
+        table = table.append_column(name, pc.cast(pc.fill_null(pc.is_in(result, value_set = pa.array(values)), False), pa.int64()))
+    return table.append_column('pop', pc.utf8_slice_codeunits(table['edge'], 0, 3))
+
+def ratio(numerator, denominator):
+    return numerator / denominator if denominator else None
+
+def quantiles(column):
+    pa = arrow()
+    pc = pa.compute
+    if column.null_count == len(column):
+        return {format(q, 'g'): None for q in QUANTILES}
+    values = pc.quantile(column, q = list(QUANTILES), skip_nulls = True).to_pylist()
+    return {format(q, 'g'): value for q, value in zip(QUANTILES, values)}
+
+def digests(table, keys, column):
+    pa = arrow()
+    grouped = table.group_by(keys).aggregate(
+        [(column, 'tdigest', pa.compute.TDigestOptions(q = list(QUANTILES), skip_nulls = True))]
+    )
+    found = {}
+    for row in grouped.to_pylist():
+        values = row[column+'_tdigest'] or [None] * len(QUANTILES)
+        found[tuple(row[key] for key in keys)] = {format(q, 'g'): value for q, value in zip(QUANTILES, values)}
+    return found
+
+def paths(table, limit):
+    grouped = table.group_by(['host', 'uri']).aggregate(
+        [('uri', 'count'), ('hit', 'sum'), ('cacheable', 'sum'), ('bytes', 'sum')]
+    )
+    grouped = grouped.sort_by([('uri_count', 'descending')]).slice(0, limit)
+    return [
+        {
+            'host': row['host'],
+            'uri': row['uri'],
+            'requests': row['uri_count'],
+            'hit_ratio': ratio(row['hit_sum'], row['cacheable_sum']),
+            'bytes': row['bytes_sum']
+        }
+        for row in grouped.to_pylist()
+    ]
+
+def edges(table, limit):
+    grouped = table.group_by(['pop']).aggregate(
+        [('pop', 'count'), ('origin', 'sum'), ('cacheable', 'sum'), ('bytes', 'sum')]
+    )
+    grouped = grouped.sort_by([('pop_count', 'descending')]).slice(0, limit)
+    latency = digests(table, ['pop'], 'time_taken')
+    return [
+        {
+            'pop': row['pop'],
+            'requests': row['pop_count'],
+            'origin_fetches': row['origin_sum'],
+            'origin_rate': ratio(row['origin_sum'], row['cacheable_sum']),
+            'bytes': row['bytes_sum'],
+            'time_taken': latency[(row['pop'],)]
+        }
+        for row in grouped.to_pylist()
+    ]
+
+def hosts(table):
+    grouped = table.group_by(['host']).aggregate(
+        [('host', 'count'), ('hit', 'sum'), ('cacheable', 'sum'), ('bytes', 'sum')]
+    )
+    latency = digests(table, ['host'], 'time_taken')
+    firstbyte = digests(table, ['host'], 'ttfb')
+    return [
+        {
+            'host': row['host'],
+            'requests': row['host_count'],
+            'hit_ratio': ratio(row['hit_sum'], row['cacheable_sum']),
+            'bytes': row['bytes_sum'],
+            'time_taken': latency[(row['host'],)],
+            'ttfb': firstbyte[(row['host'],)]
+        }
+        for row in grouped.sort_by([('host_count', 'descending')]).to_pylist()
+    ]
+
+def top(table, key, limit):
+    counted = table.group_by([key]).aggregate([(key, 'count')])
+    counted = counted.rename_columns([key, 'requests'])
+    return counted.sort_by([('requests', 'descending')]).slice(0, limit).to_pylist()
+
+def analyze(table, limit = 10, invalid = 0):
+    pa = arrow()
+    pc = pa.compute
+    table = flags(table)
+    bounds = pc.min_max(table['timestamp'])
+    hits = pc.sum(table['hit']).as_py() or 0
+    origin = pc.sum(table['origin']).as_py() or 0
+    cacheable = pc.sum(table['cacheable']).as_py() or 0
+    return {
+        'requests': table.num_rows,
+        'invalid': invalid,
+        'first': bounds['min'].as_py().isoformat() if table.num_rows else None,
+        'last': bounds['max'].as_py().isoformat() if table.num_rows else None,
+        'bytes': pc.sum(table['bytes']).as_py(),
+        'hit_ratio': ratio(hits, cacheable),
+        'origin_rate': ratio(origin, cacheable),
+        'time_taken': quantiles(table['time_taken']),
+        'ttfb': quantiles(table['ttfb']),
+        'results': top(table, 'result', limit),
+        'statuses': top(table, 'status', limit),
+        'hosts': hosts(table),
+        'paths': paths(table, limit),
+        'edges': edges(table, limit)
+    }
+
+### SYNTHETIC ###
+
+def generate(path, lines, seed = 1):
+    rng = random.Random(seed)
+    assets = ['/'+name for name in ('index.html', 'app.js', 'style.css', 'logo.png', 'logo.png.avif', 'font.woff2')]
+    sites = (
+        ('cdn.lukach.io', 0.8, lambda: rng.choice(assets) if rng.random() < 0.9 else '/'+format(rng.getrandbits(32), 'x')+'.png'),
+        ('lukach.io', 0.1, lambda: '/'),
+        ('ip.lukach.net', 0.1, lambda: '/')
+    )
+    edges = ['IAD89-C1', 'FRA56-P2', 'NRT57-C3', 'SYD1-C1', 'GRU3-C2']
+    start = datetime.datetime(2025, 1, 1, tzinfo = datetime.timezone.utc).timestamp()
+    with gzip.open(path, 'wt') as f:
+        f.write('#Version: 1.0\n#Fields: '+' '.join(FIELDS)+'\n')
+        for number in range(lines):
+            roll = rng.random()
+            for host, weight, uri in sites:
+                roll -= weight
+                if roll < 0:
+                    break
+            location = uri()
+            if host != 'cdn.lukach.io':
+                result, status, size, taken = 'FunctionGeneratedResponse', '301' if host == 'lukach.io' else '200', 300, 0.001
+            elif location not in assets:
+                result, status, size, taken = 'Error', '404', 400, rng.uniform(0.02, 0.2)
+            elif rng.random() < 0.85:
+                result, status, size, taken = rng.choice(('Hit', 'Hit', 'Hit', 'RefreshHit')), '200', rng.randint(500, 50000), rng.uniform(0.001, 0.02)
+            else:
+                result, status, size, taken = 'Miss', '200', rng.randint(500, 50000), rng.uniform(0.03, 0.4)
+            moment = datetime.datetime.fromtimestamp(start + number * 0.01, datetime.timezone.utc)
+            values = {
+                'date': moment.strftime('%Y-%m-%d'),
+                'time': moment.strftime('%H:%M:%S'),
+                'x-edge-location': rng.choice(edges),
+                'sc-bytes': str(size),
+                'c-ip': '192.0.2.'+str(rng.randint(1, 254)),
+                'cs-method': 'GET',
+                'cs(Host)': 'd111111abcdef8.cloudfront.net',
+                'cs-uri-stem': location,
+                'sc-status': status,
+                'x-edge-result-type': result,
+                'x-edge-request-id': format(rng.getrandbits(64), 'x'),
+                'x-host-header': host,
+                'cs-protocol': 'https',
+                'cs-bytes': '120',
+                'time-taken': format(taken, '.3f'),
+                'x-edge-response-result-type': result,
+                'cs-protocol-version': 'HTTP/2.0',
+                'c-port': str(rng.randint(1024, 65535)),
+                'time-to-first-byte': format(taken * 0.9, '.3f'),
+                'x-edge-detailed-result-type': result
+            }
+            f.write('\t'.join(values.get(name, '-') for name in FIELDS)+'\n')
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Columnar CloudFront access log analytics')
+    commands = parser.add_subparsers(dest = 'command', required = True)
+
+    command = commands.add_parser('report', help = 'analyze standard access log files')
+    command.add_argument('paths', nargs = '+', help = 'log files or directories, local or s3://bucket/prefix, plain or gzip')
+    command.add_argument('--top', type = int, default = 10)
+    command.add_argument('--output', help = 'write the report as JSON')
+
+    command = commands.add_parser('generate', help = 'write a synthetic access log file')
+    command.add_argument('path')
+    command.add_argument('--lines', type = int, default = 100000)
+    command.add_argument('--seed', type = int, default = 1)
+
+    args = parser.parse_args()
+
+    if args.command == 'generate':
+        generate(args.path, args.lines, args.seed)
+        return 0
+
+    table, invalid = load(args.paths)
+    report = analyze(table, args.top, invalid)
+
+    if invalid:
+        print('Skipped '+str(invalid)+' malformed rows', file = sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent = 2)
+    else:
+        print(json.dumps(report, indent = 2))
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,224 @@
+import argparse
+import datetime
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from tools.archive import COLUMNS, arrow, batches, scan
+from tools.querylog import files, lines, parse
+
+def pyarrow():
+    pa = arrow()
+    import pyarrow.csv
+    return pa
+
+def fields(path):
+    for line in lines(path):
+        return line.split()
+    return []
+
+def read(path, invalid):
+    pa = pyarrow()
+    sample = fields(path)
+    if not sample:
+        return None
+    if '1.0' not in sample[:3]:
+        return fallback(lines(path), invalid)
+    rows = []
+    def handler(row):
+        rows.append(row.text)
+        return 'skip'
+    names = ['prefix'+str(number) for number in range(sample.index('1.0'))] + ['version'] + list(COLUMNS)
+    with pa.input_stream(path, compression = 'detect') as stream:
+        table = pa.csv.read_csv(
+            stream,
+            read_options = pa.csv.ReadOptions(
+                column_names = names,
+                block_size = 1 << 24
+            ),
+            parse_options = pa.csv.ParseOptions(
+                delimiter = ' ',
+                quote_char = False,
+                invalid_row_handler = handler
+            ),
+            convert_options = pa.csv.ConvertOptions(
+                include_columns = list(COLUMNS),
+                column_types = {
+                    'timestamp': pa.timestamp('ms', tz = 'UTC'),
+                    **{name: pa.string() for name in COLUMNS[1:]}
+                },
+                strings_can_be_null = False
+            )
+        )
+    pc = pa.compute
+    qname = pc.utf8_rtrim(pc.utf8_lower(table['qname']), characters = '.')
+    table = table.set_column(table.schema.get_field_index('qname'), 'qname', qname)
+    if not rows:
+        return table
+    rest = fallback(rows, invalid)
+    return pa.concat_tables([table, rest]) if rest is not None else table
+
+def fallback(texts, invalid):
+    pa = pyarrow()
+    queries = []
+    for line in texts:
+        query = parse(line)
+        if query is not None:
+            queries.append(query)
+        elif line.strip():
+            invalid.append(line)
+    tables = [table.select(list(COLUMNS)) for table in batches(queries, '')]
+    return pa.concat_tables(tables) if tables else None
+
+def load(paths = (), archive = (), zones = None, start = None, end = None):
+    pa = pyarrow()
+    invalid = []
+    tables = [table for table in (read(path, invalid) for path in files(paths)) if table is not None]
+    if archive:
+        tables.append(scan(archive, zones, None, start, end, COLUMNS))
+    if not tables:
+        raise ValueError('No query logs found')
+    return pa.concat_tables(tables).combine_chunks(), len(invalid)
+
+def top(table, keys, limit, name = 'queries'):
+    counted = table.group_by(keys).aggregate([(keys[0], 'count')])
+    counted = counted.rename_columns(list(keys) + [name])
+    return counted.sort_by([(name, 'descending')]).slice(0, limit).to_pylist()
+
+def series(table, unit = 'minute'):
+    pa = pyarrow()
+    pc = pa.compute
+    seconds = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}[unit]
+    bucket = pc.floor_temporal(table['timestamp'], unit = unit)
+    frame = pa.table({'zone_id': table['zone_id'], 'bucket': bucket})
+    counted = frame.group_by(['zone_id', 'bucket']).aggregate([('bucket', 'count')])
+    counted = counted.sort_by([('zone_id', 'ascending'), ('bucket', 'ascending')])
+    result = {}
+    for zone_id, moment, count in zip(counted['zone_id'].to_pylist(), counted['bucket'].to_pylist(), counted['bucket_count'].to_pylist()):
+        result.setdefault(zone_id, []).append([moment.isoformat(), count / seconds])
+    return result
+
+def analyze(table, limit = 10, unit = 'minute', invalid = 0):
+    pa = pyarrow()
+    pc = pa.compute
+    nxdomain = table.filter(pc.equal(table['rcode'], 'NXDOMAIN'))
+    pops = table.append_column('pop', pc.utf8_slice_codeunits(table['edge'], 0, 3))
+    bounds = pc.min_max(table['timestamp'])
+    return {
+        'queries': table.num_rows,
+        'invalid': invalid,
+        'first': bounds['min'].as_py().isoformat() if table.num_rows else None,
+        'last': bounds['max'].as_py().isoformat() if table.num_rows else None,
+        'qps': series(table, unit),
+        'zones': top(table, ['zone_id'], limit),
+        'qnames': top(table, ['zone_id', 'qname'], limit),
+        'qtypes': top(table, ['qtype'], limit),
+        'rcodes': top(table, ['zone_id', 'rcode'], limit * 4),
+        'nxdomain': {
+            'queries': nxdomain.num_rows,
+            'qnames': top(nxdomain, ['qname'], limit),
+            'resolvers': top(nxdomain, ['resolver'], limit)
+        },
+        'resolvers': top(table, ['resolver'], limit),
+        'edges': top(table, ['edge'], limit),
+        'pops': top(pops, ['pop'], limit),
+        'protocols': top(table, ['protocol'], limit)
+    }
+
+def generate(path, lines, seed = 1):
+    rng = random.Random(seed)
+    names = ['lukach.io', 'www.lukach.io', 'cdn.lukach.io', '_dmarc.lukach.io', 'lukach.net', '4n6ir.com'] + ['nx'+str(i)+'.lukach.io' for i in range(50)]
+    qtypes = ['A', 'AAAA', 'MX', 'TXT', 'CNAME', 'HTTPS']
+    edges = ['IAD89-C1', 'FRA56-P2', 'NRT57-C3', 'SYD1-C1', 'GRU3-C2']
+    start = datetime.datetime(2025, 1, 1, tzinfo = datetime.timezone.utc).timestamp()
+    with open(path, 'w') as f:
+        chunk = []
+        for i in range(lines):
+            name = rng.choice(names)
+            moment = datetime.datetime.fromtimestamp(start + i * 0.01, datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]+'Z'
+            chunk.append(
+                '1.0 '+moment+' Z0123456789 '+name+' '+rng.choice(qtypes)+' '+
+                ('NXDOMAIN' if name.startswith('nx') else 'NOERROR')+' UDP '+rng.choice(edges)+
+                ' 192.0.2.'+str(rng.randint(1, 254))+' -\n'
+            )
+            if len(chunk) >= 100000:
+                f.writelines(chunk)
+                chunk = []
+        f.writelines(chunk)
+
+def bench(lines, repeat):
+    directory = tempfile.mkdtemp(prefix = 'querylogs.')
+    path = os.path.join(directory, 'bench.log')
+    generate(path, lines)
+    results = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        table = load([path])[0]
+        loaded = time.perf_counter()
+        analyze(table)
+        finished = time.perf_counter()
+        results.append(
+            {
+                'lines': table.num_rows,
+                'load_seconds': loaded - start,
+                'analyze_seconds': finished - loaded,
+                'lines_per_minute': table.num_rows / (finished - start) * 60
+            }
+        )
+    os.remove(path)
+    os.rmdir(directory)
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Columnar Route 53 query log analytics')
+    commands = parser.add_subparsers(dest = 'command', required = True)
+
+    command = commands.add_parser('report', help = 'analyze query log files or the Parquet archive')
+    command.add_argument('paths', nargs = '*', help = 'query log files or directories, plain or gzip')
+    command.add_argument('--archive', action = 'append', default = [], help = 'archive location, local or s3://bucket')
+    command.add_argument('--zone', action = 'append', help = 'archive zone slug filter')
+    command.add_argument('--start')
+    command.add_argument('--end')
+    command.add_argument('--top', type = int, default = 10)
+    command.add_argument('--unit', choices = ['second', 'minute', 'hour', 'day'], default = 'minute')
+    command.add_argument('--output', help = 'write the report as JSON')
+
+    command = commands.add_parser('bench', help = 'measure ingest and analysis throughput')
+    command.add_argument('--lines', type = int, default = 5000000)
+    command.add_argument('--repeat', type = int, default = 3)
+    command.add_argument('--minimum', type = float, default = 0, help = 'fail below this many lines per minute')
+
+    args = parser.parse_args()
+
+    if args.command == 'bench':
+        results = bench(args.lines, args.repeat)
+        for result in results:
+            print(
+                format(result['lines'], '>12')+' lines' +
+                format(result['load_seconds'], '>9.2f')+'s load' +
+                format(result['analyze_seconds'], '>9.2f')+'s analyze' +
+                format(result['lines_per_minute'] / 1000000, '>9.1f')+'M lines/min'
+            )
+        best = max(result['lines_per_minute'] for result in results)
+        return 1 if best < args.minimum else 0
+
+    table, invalid = load(args.paths, args.archive, args.zone, args.start, args.end)
+    report = analyze(table, args.top, args.unit, invalid)
+
+    if invalid:
+        print('Skipped '+str(invalid)+' malformed lines', file = sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent = 2)
+    else:
+        summary = {key: value for key, value in report.items() if key != 'qps'}
+        print(json.dumps(summary, indent = 2))
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
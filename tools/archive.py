@@ -0,0 +1,154 @@
+import argparse
+import datetime
+import sys
+import uuid
+
+from tools.querylog import read
+
+COLUMNS = (
+    'timestamp',
+    'zone_id',
+    'qname',
+    'qtype',
+    'rcode',
+    'protocol',
+    'edge',
+    'resolver',
+    'subnet'
+)
+
+def arrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.dataset
+    except ImportError:
+        raise SystemExit('pyarrow is required, pip install -r requirements-dev.txt')
+    return pyarrow
+
+def schema():
+    pa = arrow()
+    return pa.schema(
+        [pa.field('timestamp', pa.timestamp('ms', tz = 'UTC'))] +
+        [pa.field(name, pa.string()) for name in COLUMNS[1:]] +
+        [pa.field('zone', pa.string()), pa.field('date', pa.string())]
+    )
+
+def partitioning():
+    pa = arrow()
+    return pa.dataset.partitioning(
+        pa.schema([pa.field('zone', pa.string()), pa.field('date', pa.string())]),
+        flavor = 'hive'
+    )
+
+def dataset(sources):
+    pa = arrow()
+    if isinstance(sources, str):
+        sources = [sources]
+    datasets = [
+        pa.dataset.dataset(
+            source,
+            schema = schema(),
+            format = 'parquet',
+            partitioning = partitioning(),
+            ignore_prefixes = ['errors', '.', '_']
+        )
+        for source in sources
+    ]
+    return datasets[0] if len(datasets) == 1 else pa.dataset.dataset(datasets)
+
+def expression(zones = None, qnames = None, start = None, end = None):
+    pa = arrow()
+    field = pa.dataset.field
+    condition = None
+    terms = []
+    if zones:
+        terms.append(field('zone').isin(list(zones)))
+    if qnames:
+        terms.append(field('qname').isin([qname.lower().rstrip('.') for qname in qnames]))
+    if start:
+        terms.append(field('date') >= start)
+    if end:
+        terms.append(field('date') <= end)
+    for term in terms:
+        condition = term if condition is None else condition & term
+    return condition
+
+def scan(sources, zones = None, qnames = None, start = None, end = None, columns = None):
+    return dataset(sources).to_table(
+        columns = list(columns) if columns else None,
+        filter = expression(zones, qnames, start, end)
+    )
+
+def batches(queries, slug, size = 1000000):
+    pa = arrow()
+    rows = {name: [] for name in COLUMNS}
+    for query in queries:
+        for name, value in zip(COLUMNS, query):
+            rows[name].append(value)
+        if len(rows['timestamp']) >= size:
+            yield table(pa, rows, slug)
+            rows = {name: [] for name in COLUMNS}
+    if rows['timestamp']:
+        yield table(pa, rows, slug)
+
+def table(pa, rows, slug):
+    timestamps = pa.array([int(value * 1000) for value in rows['timestamp']], pa.int64()).cast(pa.timestamp('ms', tz = 'UTC'))
+    dates = [datetime.datetime.fromtimestamp(value, datetime.timezone.utc).strftime('%Y-%m-%d') for value in rows['timestamp']]
+    return pa.table(
+        [timestamps] +
+        [pa.array(rows[name], pa.string()) for name in COLUMNS[1:]] +
+        [pa.array([slug] * len(dates), pa.string()), pa.array(dates, pa.string())],
+        schema = schema()
+    )
+
+def backfill(paths, slug, destination, run = None):
+    pa = arrow()
+    run = run or uuid.uuid4().hex
+    written = 0
+    for number, batch in enumerate(batches(read(paths), slug)):
+        pa.dataset.write_dataset(
+            batch,
+            destination,
+            format = 'parquet',
+            partitioning = partitioning(),
+            basename_template = 'backfill-'+run+'-'+str(number)+'-{i}.parquet',
+            existing_data_behavior = 'overwrite_or_ignore',
+            file_options = pa.dataset.ParquetFileFormat().make_write_options(compression = 'zstd')
+        )
+        written += batch.num_rows
+    return written
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Partitioned Parquet archive of Route 53 query logs')
+    commands = parser.add_subparsers(dest = 'command', required = True)
+
+    command = commands.add_parser('backfill', help = 'convert exported query logs into the archive layout')
+    command.add_argument('paths', nargs = '+')
+    command.add_argument('--zone', required = True, help = 'zone slug, for example lukachio')
+    command.add_argument('--destination', required = True, help = 'local directory or s3://bucket')
+    command.add_argument('--run', help = 'run id in the file names, rerun with the same id to replace its files')
+
+    command = commands.add_parser('query', help = 'scan the archive with partition and column filters')
+    command.add_argument('sources', nargs = '+', help = 'local directories or s3://bucket')
+    command.add_argument('--zone', action = 'append')
+    command.add_argument('--qname', action = 'append')
+    command.add_argument('--start', help = 'first date, YYYY-MM-DD')
+    command.add_argument('--end', help = 'last date, YYYY-MM-DD')
+    command.add_argument('--limit', type = int, default = 20)
+
+    args = parser.parse_args()
+
+    if args.command == 'backfill':
+        run = args.run or uuid.uuid4().hex
+        print(str(backfill(args.paths, args.zone, args.destination, run))+' rows in run '+run)
+        return 0
+
+    result = scan(args.sources, args.zone, args.qname, args.start, args.end)
+    print(str(result.num_rows)+' rows')
+    for row in result.slice(0, args.limit).to_pylist():
+        print(' '.join(str(row[name]) for name in COLUMNS))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,200 @@
+import argparse
+import importlib
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BUDGET = os.path.join(os.path.dirname(__file__), 'bench_budget.json')
+
+def children(pid):
+    found = []
+    try:
+        for tid in os.listdir('/proc/'+str(pid)+'/task'):
+            with open('/proc/'+str(pid)+'/task/'+tid+'/children') as f:
+                found.extend(int(child) for child in f.read().split())
+    except OSError:
+        pass
+    return found
+
+def highwater(pid):
+    try:
+        with open('/proc/'+str(pid)+'/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+def rss():
+    python = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    node = sum(highwater(child) for child in children(os.getpid()))
+    return {'python_kb': python, 'node_kb': node}
+
+def growth(before, after):
+    return max(0, after['python_kb'] + after['node_kb'] - before['python_kb'] - before['node_kb'])
+
+class Phases:
+
+    def __init__(self):
+        self.start = rss()
+        self.results = []
+
+    def run(self, name, function, *args):
+        before = rss()
+        start = time.perf_counter()
+        value = function(*args)
+        seconds = time.perf_counter() - start
+        after = rss()
+        self.results.append(
+            {
+                'phase': name,
+                'seconds': seconds,
+                'growth_kb': growth(before, after),
+                **after
+            }
+        )
+        return value
+
+def worker(output):
+    phases = Phases()
+
+    cdk = phases.run('import', __import__, 'aws_cdk')
+
+    domains = phases.run('import domains', importlib.import_module, 'domains.domains_app')
+
+    outdir = tempfile.mkdtemp(prefix = 'cdk.bench.')
+    app = phases.run('app', lambda: cdk.App(outdir = outdir))
+
+    phases.run('assets', cdk.FileSystem.fingerprint, 'cache')
+
+    for name, factory in domains.factories().items():
+        phases.run('stack:'+name, factory, app)
+
+    domains.tags(app)
+    phases.run('synth', app.synth)
+
+    with open(output, 'w') as f:
+        json.dump({'start': phases.start, 'phases': phases.results}, f)
+
+def iteration():
+    with tempfile.NamedTemporaryFile(suffix = '.json') as f:
+        env = dict(os.environ)
+        env.setdefault('CDK_DEFAULT_ACCOUNT', '123456789012')
+        env.setdefault('CDK_DEFAULT_REGION', 'us-east-1')
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, '-m', 'tools.bench', '--worker', f.name],
+            env = env,
+            check = True
+        )
+        total = time.perf_counter() - start
+        with open(f.name) as results:
+            results = json.load(results)
+    phases = results['phases']
+    phases.append(
+        {
+            'phase': 'total',
+            'seconds': total,
+            'growth_kb': growth(results['start'], phases[-1]),
+            'python_kb': max(phase['python_kb'] for phase in phases),
+            'node_kb': max(phase['node_kb'] for phase in phases)
+        }
+    )
+    return phases
+
+def summarize(iterations):
+    summary = {}
+    for phases in iterations:
+        for phase in phases:
+            entry = summary.setdefault(phase['phase'], {'seconds': [], 'growth_kb': [], 'python_kb': [], 'node_kb': []})
+            entry['seconds'].append(phase['seconds'])
+            entry['growth_kb'].append(phase['growth_kb'])
+            entry['python_kb'].append(phase['python_kb'])
+            entry['node_kb'].append(phase['node_kb'])
+    for name, entry in summary.items():
+        summary[name] = {
+            'min': min(entry['seconds']),
+            'median': statistics.median(entry['seconds']),
+            'max': max(entry['seconds']),
+            'growth_kb': max(entry['growth_kb']),
+            'peak_python_kb': max(entry['python_kb']),
+            'peak_node_kb': max(entry['node_kb'])
+        }
+    return summary
+
+def check(summary, budget):
+    failures = []
+    for name in summary:
+        if name not in budget:
+            failures.append(name+' has no entry in the budget')
+    for name, limits in budget.items():
+        if name not in summary:
+            continue
+        if 'seconds' in limits and summary[name]['median'] > limits['seconds']:
+            failures.append(name+' median '+format(summary[name]['median'], '.3f')+'s > '+str(limits['seconds'])+'s')
+        peak = summary[name]['peak_python_kb'] + summary[name]['peak_node_kb']
+        if 'rss_kb' in limits and peak > limits['rss_kb']:
+            failures.append(name+' cumulative peak '+str(peak)+'kb > '+str(limits['rss_kb'])+'kb')
+        if 'growth_kb' in limits and summary[name]['growth_kb'] > limits['growth_kb']:
+            failures.append(name+' growth '+str(summary[name]['growth_kb'])+'kb > '+str(limits['growth_kb'])+'kb')
+    return failures
+
+def report(summary):
+    print(format('phase', '<32')+format('min', '>9')+format('median', '>9')+format('max', '>9')+format('growth_kb', '>12')+format('peak_kb', '>12'))
+    for name, entry in summary.items():
+        print(
+            format(name, '<32') +
+            format(entry['min'], '>9.3f') +
+            format(entry['median'], '>9.3f') +
+            format(entry['max'], '>9.3f') +
+            format(entry['growth_kb'], '>12') +
+            format(entry['peak_python_kb'] + entry['peak_node_kb'], '>12')
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Offline synthesis benchmark')
+    parser.add_argument('--iterations', type = int, default = 5)
+    parser.add_argument('--output', default = 'bench.json')
+    parser.add_argument('--budget', default = BUDGET)
+    parser.add_argument('--worker', help = argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args.worker)
+        return 0
+
+    iterations = [iteration() for _ in range(args.iterations)]
+    summary = summarize(iterations)
+
+    with open(args.budget) as f:
+        budget = json.load(f)
+
+    failures = check(summary, budget)
+
+    with open(args.output, 'w') as f:
+        json.dump(
+            {
+                'iterations': iterations,
+                'summary': summary,
+                'budget': budget,
+                'failures': failures
+            },
+            f,
+            indent = 2
+        )
+
+    report(summary)
+
+    for failure in failures:
+        print('BUDGET EXCEEDED: '+failure, file = sys.stderr)
+
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+'use strict';
+
+const crypto = require('crypto');
+const fs = require('fs');
+const vm = require('vm');
+
+const MODULES = ['cloudfront', 'crypto'];
+
+function kvs(tables) {
+  return function (id) {
+    const table = tables[id] || {};
+    return {
+      get: async function (key, options) {
+        if (!Object.prototype.hasOwnProperty.call(table, key)) {
+          throw new Error('Key not found: ' + key);
+        }
+        const value = table[key];
+        return options && options.format === 'json' ? JSON.parse(value) : value;
+      },
+      exists: async function (key) {
+        return Object.prototype.hasOwnProperty.call(table, key);
+      },
+      meta: async function () {
+        return {creationDateTime: '', lastUpdatedDateTime: '', keyCount: Object.keys(table).length};
+      }
+    };
+  };
+}
+
+function load(source, tables) {
+  const sandbox = {
+    console: {log: function () {}},
+    Buffer: Buffer,
+    __modules: {
+      cloudfront: {kvs: kvs(tables)},
+      crypto: {createHash: crypto.createHash, createHmac: crypto.createHmac, randomBytes: crypto.randomBytes}
+    }
+  };
+  const code = source.replace(/^import\s+(\w+)\s+from\s+['"]([^'"]+)['"];?$/gm, function (line, name, module) {
+    if (MODULES.indexOf(module) === -1) {
+      throw new Error('Unsupported import in cloudfront-js-2.0: ' + module);
+    }
+    return 'const ' + name + ' = __modules[' + JSON.stringify(module) + '];';
+  });
+  if (/^\s*(import|export)\s/m.test(code)) {
+    throw new Error('Only default imports of ' + MODULES.join(', ') + ' are supported');
+  }
+  const context = vm.createContext(sandbox, {codeGeneration: {strings: false, wasm: false}});
+  new vm.Script(code + '\n;globalThis.__handler = handler;').runInContext(context, {timeout: 1000});
+  return context.__handler;
+}
+
+async function run(item) {
+  const handler = load(item.code, item.kvs || {});
+  const outputs = [];
+  const timings = [];
+  for (let i = 0; i < item.events.length; i++) {
+    try {
+      outputs.push(await handler(JSON.parse(JSON.stringify(item.events[i]))));
+    } catch (e) {
+      outputs.push({error: String(e && e.message || e)});
+    }
+  }
+  for (let n = 0; n < item.iterations; n++) {
+    for (let i = 0; i < item.events.length; i++) {
+      const event = JSON.parse(JSON.stringify(item.events[i]));
+      const start = process.hrtime.bigint();
+      try {
+        await handler(event);
+      } catch (e) {
+        continue;
+      }
+      timings.push(Number(process.hrtime.bigint() - start));
+    }
+  }
+  return {name: item.name, outputs: outputs, timings: timings};
+}
+
+async function main() {
+  const items = JSON.parse(fs.readFileSync(process.argv[2], 'utf8'));
+  const results = [];
+  for (let i = 0; i < items.length; i++) {
+    try {
+      results.push(await run(items[i]));
+    } catch (e) {
+      results.push({name: items[i].name, error: String(e && e.message || e), outputs: [], timings: []});
+    }
+  }
+  fs.writeFileSync(process.argv[3], JSON.stringify(results));
+}
+
+main().catch(function (e) {
+  console.error(e);
+  process.exit(1);
+});
@@ -0,0 +1,372 @@
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from domains.domains_assets import objects
+from domains.domains_config import SPECS
+from domains.domains_negotiate import code as negotiated, variants
+from domains.domains_redirect import DEPTH, code, entries, rules
+
+RUNNER = os.path.join(os.path.dirname(__file__), 'functions.js')
+BUDGET = os.path.join(os.path.dirname(__file__), 'functions_budget.json')
+
+MAX_SIZE = 10240
+
+STORE = 'harness'
+
+FIXTURE = {
+    '*': {
+        '/harness/exact': 'https://github.com/4n6ir',
+        '/harness/tree/*': {'location': 'https://github.com/4n6ir/*', 'status': 308}
+    }
+}
+
+ACCEPTS = (
+    'image/avif,image/webp,image/apng,*/*;q=0.8',
+    'image/webp,*/*;q=0.8',
+    'image/avif;q=0,image/webp,*/*',
+    'image/webp;q=0.9,image/avif;q=0.5',
+    'IMAGE/AVIF',
+    'image/png,image/*;q=0.8,*/*;q=0.5',
+    '*/*',
+    None
+)
+
+IMAGES = ('a.png', 'a.png.avif', 'a.png.webp', 'b/c.JPG', 'b/c.JPG.webp', 'd.jpeg', 'e.css', 'f.png.avif')
+
+### EVENTS ###
+
+def event(host, uri, querystring = None, headers = None, ip = '198.51.100.7'):
+    request_headers = {'host': {'value': host}}
+    for name, value in (headers or {}).items():
+        if value is not None:
+            request_headers[name] = {'value': value}
+    return {
+        'version': '1.0',
+        'context': {
+            'distributionDomainName': 'd111111abcdef8.cloudfront.net',
+            'distributionId': 'EDFDVBD6EXAMPLE',
+            'eventType': 'viewer-request',
+            'requestId': '4TyzHTaYWb1GX1qTfsHhEqV6HUDd_BzoBZnwfnvQc_1oF26ClkoUSEQ=='
+        },
+        'viewer': {'ip': ip},
+        'request': {
+            'method': 'GET',
+            'uri': uri,
+            'querystring': {key: {'value': value} for key, value in (querystring or {}).items()},
+            'headers': request_headers,
+            'cookies': {}
+        }
+    }
+
+def uris(generator, count):
+    found = ['/', '/index.html', '/a/b/c/d/e/f/g']
+    for _ in range(count):
+        depth = generator.randint(1, 8)
+        found.append('/'+'/'.join(format(generator.getrandbits(24), 'x') for _ in range(depth)))
+    return found
+
+### REDIRECT ###
+
+def site(redirect):
+    return {
+        'location': redirect.location,
+        'status': redirect.status,
+        'path': redirect.path,
+        'query': redirect.query,
+        'max_age': redirect.max_age
+    }
+
+def resolve(table, host, uri):
+    for name in (host, '*'):
+        keys = [name+uri]
+        segments = uri.split('/')
+        for index in range(len(segments) - 1, 0, -1):
+            if len(keys) > DEPTH:
+                break
+            keys.append(name+'/'.join(segments[:index])+'/*')
+        for key in keys:
+            if key in table:
+                status, location = table[key].split(' ', 1)
+                if key.endswith('*'):
+                    location = location.replace('*', uri[len(key) - len(name) - 1:], 1)
+                return int(status), location
+    return None
+
+def expected(settings, table, host, uri, querystring):
+    matched = resolve(table, host, uri)
+    if matched is not None:
+        status, location = matched
+    else:
+        status, location = settings['status'], settings['location']
+        if settings['path']:
+            location = location.rstrip('/')+uri
+    if settings['query'] and querystring:
+        location = location+'?'+'&'.join(key if value == '' else key+'='+value for key, value in querystring.items())
+    return {
+        'statusCode': status,
+        'headers.location.value': location,
+        'headers.cache-control.value': 'public, max-age='+str(settings['max_age']) if settings['max_age'] > 0 else 'no-store'
+    }
+
+def redirect(name, default, hosts, table, generator, count):
+    cases = []
+    settings = {host: site(value) for host, value in hosts.items()}
+    paths = uris(generator, count) + [key[key.index('/'):].replace('*', 'x/y') for key in table]
+    for host in settings:
+        for uri in paths:
+            for querystring in ({}, {'utm_source': 'harness', 'debug': ''}):
+                cases.append(
+                    (
+                        event(host, uri, querystring),
+                        expected(settings[host], table, host, uri, querystring)
+                    )
+                )
+    return {
+        'name': name,
+        'code': code(default, STORE, hosts if len(hosts) > 1 else None),
+        'kvs': {STORE: table},
+        'cases': cases
+    }
+
+def redirects(generator, count):
+    sites = {}
+    table = {}
+    for spec in SPECS:
+        for distribution in spec.distributions:
+            if distribution.redirect is None:
+                continue
+            source = dict(FIXTURE)
+            if distribution.redirect.rules is not None:
+                source.update(rules(distribution.redirect.rules))
+            table.update(entries(source, distribution.domain_names))
+            for host in distribution.domain_names:
+                sites[host] = distribution.redirect
+    items = []
+    for host, value in sites.items():
+        if host.startswith('www.'):
+            continue
+        items.append(redirect('redirect:'+host, value, {host: value}, table, generator, count))
+    if sites:
+        items.append(redirect('redirect:consolidated', next(iter(sites.values())), sites, table, generator, count))
+    return items
+
+### NEGOTIATE ###
+
+def quality(accept, media):
+    for part in accept.lower().split(','):
+        params = part.split(';')
+        if params[0].strip() != media:
+            continue
+        for param in params[1:]:
+            param = param.strip()
+            if param.startswith('q='):
+                try:
+                    return float(param[2:])
+                except ValueError:
+                    return 0
+        return 1
+    return 0
+
+def negotiation(formats, uri, accept):
+    found = formats.get(uri)
+    if not found or accept is None:
+        return uri
+    avif = quality(accept, 'image/avif') if 'a' in found else 0
+    webp = quality(accept, 'image/webp') if 'w' in found else 0
+    if avif > 0 and avif >= webp:
+        return uri+'.avif'
+    if webp > 0:
+        return uri+'.webp'
+    return uri
+
+def negotiate(generator, count):
+    items = []
+    for spec in SPECS:
+        for distribution in spec.distributions:
+            if not distribution.negotiate:
+                continue
+            keys = [item['key'] for item in objects(distribution.asset, distribution.fingerprint)] if distribution.asset else []
+            keys += list(IMAGES)
+            formats = variants(keys)
+            cases = []
+            for uri in uris(generator, count) + ['/'+key for key in sorted(set(keys))]:
+                for accept in ACCEPTS:
+                    cases.append((event(distribution.domain_names[0], uri, headers = {'accept': accept}), {'uri': negotiation(formats, uri, accept)}))
+            items.append({'name': 'negotiate:'+distribution.domain_names[0], 'code': negotiated(keys, distribution.function), 'kvs': {}, 'cases': cases})
+    return items
+
+### WHOAMI ###
+
+def whoami(generator, count):
+    cases = []
+    for number in range(count + 2):
+        if generator.random() < 0.5:
+            ip = '.'.join(str(generator.randint(1, 254)) for _ in range(4))
+        else:
+            ip = ':'.join(format(generator.getrandbits(16), 'x') for _ in range(8))
+        cases.append((event('ip.lukach.net', '/', ip = ip), {'statusCode': 200, 'body': ip, 'headers.content-type.value': 'text/plain'}))
+        viewer = {
+            'cloudfront-viewer-country': generator.choice(('US', 'DE', 'JP')),
+            'cloudfront-viewer-asn': str(generator.randint(1, 400000)),
+            'cloudfront-viewer-tls': 'TLSv1.3:TLS_AES_128_GCM_SHA256:sessionResumed',
+            'cloudfront-viewer-http-version': generator.choice(('2.0', '3.0'))
+        }
+        body = json.dumps(
+            {
+                'ip': ip,
+                'country': viewer['cloudfront-viewer-country'],
+                'asn': int(viewer['cloudfront-viewer-asn']),
+                'tls': viewer['cloudfront-viewer-tls'],
+                'http': viewer['cloudfront-viewer-http-version']
+            },
+            separators = (',', ':')
+        )
+        requests = (
+            event('ip.lukach.net', '/json', headers = viewer, ip = ip),
+            event('ip.lukach.net', '/', {'format': 'json'}, headers = viewer, ip = ip),
+            event('ip.lukach.net', '/', headers = {**viewer, 'accept': 'application/json'}, ip = ip)
+        )
+        cases.append((requests[number % len(requests)], {'statusCode': 200, 'body': body, 'headers.content-type.value': 'application/json'}))
+    with open('whoami/whoami.js') as f:
+        source = f.read()
+    return [{'name': 'whoami', 'code': source, 'kvs': {}, 'cases': cases}]
+
+### HARNESS ###
+
+def value(item, path):
+    for part in path.split('.'):
+        if not isinstance(item, dict) or part not in item:
+            return None
+        item = item[part]
+    return item
+
+def verify(item, result):
+    failures = []
+    if len(item['code'].encode()) > MAX_SIZE:
+        failures.append(item['name']+' is '+str(len(item['code'].encode()))+' bytes, the limit is '+str(MAX_SIZE))
+    if 'error' in result:
+        failures.append(item['name']+' failed to load: '+result['error'])
+        return failures
+    for (request, expect), output in zip(item['cases'], result['outputs']):
+        if 'error' in output:
+            failures.append(item['name']+' '+request['request']['uri']+' threw: '+output['error'])
+            continue
+        for path, wanted in expect.items():
+            found = value(output, path)
+            if found != wanted:
+                failures.append(item['name']+' '+request['request']['headers']['host']['value']+request['request']['uri']+' '+path+' = '+json.dumps(found)+', expected '+json.dumps(wanted))
+    return failures
+
+def execute(items, iterations):
+    payload = [
+        {
+            'name': item['name'],
+            'code': item['code'],
+            'kvs': item['kvs'],
+            'events': [request for request, expect in item['cases']],
+            'iterations': iterations
+        }
+        for item in items
+    ]
+    with tempfile.TemporaryDirectory(prefix = 'functions.') as directory:
+        source = os.path.join(directory, 'input.json')
+        output = os.path.join(directory, 'output.json')
+        with open(source, 'w') as f:
+            json.dump(payload, f)
+        subprocess.run(['node', '--jitless', '--no-expose-wasm', RUNNER, source, output], check = True)
+        with open(output) as f:
+            return json.load(f)
+
+def summarize(timings):
+    if not timings:
+        return {'invocations': 0, 'p50_us': 0.0, 'p95_us': 0.0, 'p99_us': 0.0, 'max_us': 0.0}
+    micros = [timing / 1000 for timing in timings]
+    cuts = statistics.quantiles(micros, n = 100) if len(micros) > 1 else micros * 99
+    return {
+        'invocations': len(micros),
+        'p50_us': cuts[49],
+        'p95_us': cuts[94],
+        'p99_us': cuts[98],
+        'max_us': max(micros)
+    }
+
+def check(name, summary, budget):
+    limits = budget.get(name, budget.get(name.split(':')[0], {}))
+    if 'p99_us' in limits and summary['p99_us'] > limits['p99_us']:
+        return [name+' p99 '+format(summary['p99_us'], '.1f')+'us > '+str(limits['p99_us'])+'us']
+    return []
+
+def report(rows, budget):
+    print(format('function', '<32')+format('cases', '>7')+format('p50_us', '>9')+format('p95_us', '>9')+format('p99_us', '>9')+format('max_us', '>9')+format('budget', '>8'))
+    for name, cases, summary in rows:
+        limits = budget.get(name, budget.get(name.split(':')[0], {}))
+        used = format(summary['p99_us'] / limits['p99_us'] * 100, '.0f')+'%' if 'p99_us' in limits else '-'
+        print(
+            format(name, '<32') +
+            format(cases, '>7') +
+            format(summary['p50_us'], '>9.1f') +
+            format(summary['p95_us'], '>9.1f') +
+            format(summary['p99_us'], '>9.1f') +
+            format(summary['max_us'], '>9.1f') +
+            format(used, '>8')
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Run CloudFront Functions against generated viewer-request events')
+    parser.add_argument('--iterations', type = int, default = 200)
+    parser.add_argument('--events', type = int, default = 50, help = 'random paths generated per function')
+    parser.add_argument('--seed', type = int, default = 0)
+    parser.add_argument('--only', help = 'run functions whose name starts with this prefix')
+    parser.add_argument('--output', default = 'functions.json')
+    parser.add_argument('--budget', default = BUDGET)
+    args = parser.parse_args()
+
+    generator = random.Random(args.seed)
+    items = redirects(generator, args.events) + negotiate(generator, args.events) + whoami(generator, args.events)
+
+    if args.only:
+        items = [item for item in items if item['name'].startswith(args.only)]
+
+    with open(args.budget) as f:
+        budget = json.load(f)
+
+    results = execute(items, args.iterations)
+
+    rows = []
+    failures = []
+
+    for item, result in zip(items, results):
+        summary = summarize(result['timings'])
+        rows.append((item['name'], len(item['cases']), summary))
+        failures.extend(verify(item, result))
+        failures.extend(check(item['name'], summary, budget))
+
+    with open(args.output, 'w') as f:
+        json.dump(
+            {
+                'summary': {name: {'cases': cases, **summary} for name, cases, summary in rows},
+                'budget': budget,
+                'failures': failures
+            },
+            f,
+            indent = 2
+        )
+
+    report(rows, budget)
+
+    for failure in failures[:50]:
+        print('FAILED: '+failure, file = sys.stderr)
+
+    if len(failures) > 50:
+        print('FAILED: '+str(len(failures) - 50)+' more', file = sys.stderr)
+
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+import argparse
+import io
+import os
+import re
+import sys
+
+SOURCES = ('.png', '.jpg', '.jpeg')
+
+SIZED = re.compile(r'\.[0-9]+w\.[^.]+$')
+
+FORMATS = {
+    'avif': {'format': 'AVIF', 'quality': 60, 'speed': 4},
+    'webp': {'format': 'WEBP', 'quality': 80, 'method': 6}
+}
+
+def pillow():
+    try:
+        from PIL import Image
+    except ImportError:
+        raise SystemExit('Pillow is required, pip install -r requirements-dev.txt')
+    return Image
+
+def sources(directory, responsive = False):
+    for root, dirs, names in os.walk(directory):
+        dirs.sort()
+        for name in sorted(names):
+            if name.lower().endswith(SOURCES) and (responsive or not SIZED.search(name)):
+                yield os.path.join(root, name)
+
+def resized(image, width):
+    if width is None or width >= image.width:
+        return image
+    return image.resize((width, round(image.height * width / image.width)), pillow().Resampling.LANCZOS)
+
+def sized(path, width):
+    stem, extension = os.path.splitext(path)
+    return stem+'.'+str(width)+'w'+extension
+
+def encode(image, **options):
+    buffer = io.BytesIO()
+    image.save(buffer, **options)
+    return buffer.getvalue()
+
+def store(path, data):
+    if os.path.isfile(path):
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return 0
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+def recompression(path):
+    if path.lower().endswith('.png'):
+        return {'format': 'PNG', 'optimize': True}
+    return {'format': 'JPEG', 'quality': 85, 'optimize': True, 'progressive': True}
+
+def recompress(path, image):
+    data = encode(image, **recompression(path))
+    if len(data) < os.path.getsize(path):
+        return store(path, data)
+    return 0
+
+def variants(path, image):
+    written = {}
+    for extension, options in FORMATS.items():
+        data = encode(image, **options)
+        store(path+'.'+extension, data)
+        written[extension] = len(data)
+    return written
+
+def optimize(directory, widths = ()):
+    Image = pillow()
+    report = []
+    for path in list(sources(directory)):
+        with Image.open(path) as opened:
+            image = opened.copy()
+        original = os.path.getsize(path)
+        recompress(path, image)
+        report.append((path, original, os.path.getsize(path), variants(path, image)))
+        for width in widths:
+            if width >= image.width:
+                continue
+            target = sized(path, width)
+            smaller = resized(image, width)
+            store(target, encode(smaller, **recompression(target)))
+            report.append((target, None, os.path.getsize(target), variants(target, smaller)))
+    return report
+
+def missing(directory):
+    return [
+        path+'.'+extension
+        for path in sources(directory, responsive = True)
+        for extension in FORMATS
+        if not os.path.isfile(path+'.'+extension)
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Generate recompressed, WebP and AVIF image variants')
+    parser.add_argument('directory', nargs = '?', default = 'cache')
+    parser.add_argument('--widths', type = lambda value: [int(item) for item in value.split(',') if item], default = [], help = 'comma separated responsive widths')
+    parser.add_argument('--check', action = 'store_true', help = 'fail if any image lacks its variants')
+    args = parser.parse_args()
+
+    if args.check:
+        absent = missing(args.directory)
+        for path in absent:
+            print('missing '+path)
+        return 1 if absent else 0
+
+    for path, original, size, formats in optimize(args.directory, args.widths):
+        print(
+            format(path, '<40') +
+            format(original if original is not None else '-', '>10') +
+            format(size, '>10') +
+            ''.join(format(extension+' '+str(length), '>14') for extension, length in formats.items())
+        )
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,143 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from tools.planner import FileStore, SsmStore, record
+from tools.synthcache import templates
+
+def graph(outdir, stacks = None):
+    with open(os.path.join(outdir, 'manifest.json')) as f:
+        manifest = json.load(f)
+    artifacts = {
+        name: artifact for name, artifact in manifest.get('artifacts', {}).items()
+        if artifact.get('type') == 'aws:cloudformation:stack'
+    }
+    selected = set(stacks) if stacks else set(artifacts)
+    unknown = selected - set(artifacts)
+    if unknown:
+        raise ValueError('Unknown stacks: '+', '.join(sorted(unknown)))
+    return {
+        name: sorted(set(artifacts[name].get('dependencies', [])) & selected)
+        for name in sorted(selected)
+    }
+
+class Printer:
+
+    def __init__(self, stream = sys.stdout):
+        self.lock = threading.Lock()
+        self.stream = stream
+
+    def __call__(self, stack, line):
+        with self.lock:
+            self.stream.write(stack+' | '+line.rstrip('\n')+'\n')
+            self.stream.flush()
+
+class CdkBackend:
+
+    def __init__(self, outdir, command = 'cdk deploy --require-approval never --exclusively'):
+        self.outdir = outdir
+        self.command = command.split()
+
+    def deploy(self, stack, progress):
+        process = subprocess.Popen(
+            self.command + ['--app', self.outdir, stack],
+            stdout = subprocess.PIPE,
+            stderr = subprocess.STDOUT,
+            text = True
+        )
+        for line in process.stdout:
+            progress(stack, line)
+        return process.wait() == 0
+
+class FakeBackend:
+
+    def __init__(self, seconds = None, failures = ()):
+        self.seconds = seconds or {}
+        self.failures = set(failures)
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.order = []
+
+    def deploy(self, stack, progress):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.order.append(stack)
+        progress(stack, 'deploying')
+        time.sleep(self.seconds.get(stack, 0))
+        with self.lock:
+            self.running -= 1
+        progress(stack, 'failed' if stack in self.failures else 'deployed')
+        return stack not in self.failures
+
+def orchestrate(dag, backend, concurrency = 4, progress = None):
+    progress = progress or Printer()
+    summary = {}
+    pending = dict(dag)
+    running = {}
+
+    def deploy(stack):
+        start = time.perf_counter()
+        try:
+            ok = backend.deploy(stack, progress)
+        except Exception as e:
+            progress(stack, 'error: '+str(e))
+            ok = False
+        return {'status': 'deployed' if ok else 'failed', 'seconds': time.perf_counter() - start}
+
+    with ThreadPoolExecutor(max_workers = max(1, concurrency)) as executor:
+        while pending or running:
+            changed = False
+            for stack, dependencies in list(pending.items()):
+                if any(summary.get(dependency, {}).get('status') in ('failed', 'skipped') for dependency in dependencies):
+                    summary[stack] = {'status': 'skipped', 'seconds': 0.0}
+                    progress(stack, 'skipped after dependency failure')
+                    del pending[stack]
+                    changed = True
+                elif len(running) < concurrency and all(dependency in summary for dependency in dependencies):
+                    running[executor.submit(deploy, stack)] = stack
+                    del pending[stack]
+            if not running:
+                if changed:
+                    continue
+                if pending:
+                    raise ValueError('Dependency cycle between '+', '.join(sorted(pending)))
+                break
+            done, _ = wait(running, return_when = FIRST_COMPLETED)
+            for future in done:
+                summary[running.pop(future)] = future.result()
+
+    return summary
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Deploy independent stacks concurrently')
+    parser.add_argument('stacks', nargs = '*')
+    parser.add_argument('--output', default = 'cdk.out')
+    parser.add_argument('--concurrency', type = int, default = 4)
+    parser.add_argument('--record', action = 'store_true', help = 'store template hashes of deployed stacks')
+    parser.add_argument('--store', help = 'local JSON file instead of SSM')
+    args = parser.parse_args()
+
+    dag = graph(args.output, args.stacks)
+    summary = orchestrate(dag, CdkBackend(args.output), args.concurrency)
+
+    for stack, result in summary.items():
+        print(format(stack, '<24')+format(result['status'], '<10')+format(result['seconds'], '>8.1f')+'s')
+
+    deployed = [stack for stack, result in summary.items() if result['status'] == 'deployed']
+
+    if args.record and deployed:
+        store = FileStore(args.store) if args.store else SsmStore()
+        record(templates(args.output), store, deployed)
+
+    return 0 if len(deployed) == len(summary) else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,86 @@
+import argparse
+import json
+import os
+import sys
+
+from tools.synthcache import templates
+
+PREFIX = '/domains/'
+
+def parameter(stack):
+    return PREFIX+stack+'/template'
+
+class FileStore:
+
+    def __init__(self, path):
+        self.path = path
+        self.values = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.values = json.load(f)
+
+    def get(self, stack):
+        return self.values.get(parameter(stack))
+
+    def put(self, stack, value):
+        self.values[parameter(stack)] = value
+        with open(self.path, 'w') as f:
+            json.dump(self.values, f, indent = 2, sort_keys = True)
+
+class SsmStore:
+
+    def __init__(self, client = None):
+        if client is None:
+            import boto3
+            client = boto3.client('ssm')
+        self.client = client
+
+    def get(self, stack):
+        try:
+            return self.client.get_parameter(Name = parameter(stack))['Parameter']['Value']
+        except self.client.exceptions.ParameterNotFound:
+            return None
+
+    def put(self, stack, value):
+        self.client.put_parameter(
+            Name = parameter(stack),
+            Description = stack,
+            Value = value,
+            Type = 'String',
+            Tier = 'Standard',
+            Overwrite = True
+        )
+
+def plan(hashes, store, force = False):
+    return [stack for stack, value in hashes.items() if force or store.get(stack) != value]
+
+def record(hashes, store, stacks):
+    for stack in stacks:
+        store.put(stack, hashes[stack])
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Deploy only stacks whose templates changed')
+    parser.add_argument('action', choices = ['plan', 'record'])
+    parser.add_argument('stacks', nargs = '*')
+    parser.add_argument('--output', default = 'cdk.out')
+    parser.add_argument('--store', help = 'local JSON file instead of SSM')
+    parser.add_argument('--force', action = 'store_true')
+    args = parser.parse_args()
+
+    hashes = templates(args.output)
+    store = FileStore(args.store) if args.store else SsmStore()
+
+    if args.action == 'plan':
+        print(' '.join(plan(hashes, store, args.force)))
+        return 0
+
+    unknown = [stack for stack in args.stacks if stack not in hashes]
+    if unknown:
+        print('Unknown stacks: '+', '.join(unknown), file = sys.stderr)
+        return 1
+
+    record(hashes, store, args.stacks)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
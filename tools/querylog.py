@@ -0,0 +1,78 @@
+import gzip
+import json
+import os
+
+from collections import namedtuple
+from datetime import datetime
+
+Query = namedtuple(
+    'Query',
+    [
+        'timestamp',
+        'zone_id',
+        'qname',
+        'qtype',
+        'rcode',
+        'protocol',
+        'edge',
+        'resolver',
+        'subnet'
+    ]
+)
+
+def epoch(value):
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+
+def parse(line):
+    line = line.strip()
+    if not line:
+        return None
+    if line.startswith('{'):
+        try:
+            line = json.loads(line).get('message', '')
+        except ValueError:
+            return None
+    fields = line.split()
+    for start in range(min(len(fields), 3)):
+        if fields[start] == '1.0' and len(fields) - start >= 9:
+            fields = fields[start+1:]
+            break
+    else:
+        return None
+    try:
+        timestamp = epoch(fields[0])
+    except ValueError:
+        return None
+    return Query(
+        timestamp,
+        fields[1],
+        fields[2].lower().rstrip('.'),
+        fields[3],
+        fields[4],
+        fields[5],
+        fields[6],
+        fields[7],
+        fields[8] if len(fields) > 8 else '-'
+    )
+
+def files(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                for name in sorted(names):
+                    yield os.path.join(root, name)
+        else:
+            yield path
+
+def lines(path):
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding = 'utf-8', errors = 'replace') as f:
+        yield from f
+
+def read(paths):
+    for path in files(paths):
+        for line in lines(path):
+            query = parse(line)
+            if query is not None:
+                yield query
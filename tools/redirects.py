@@ -0,0 +1,83 @@
+import argparse
+import sys
+
+from domains.domains_config import SPECS
+from domains.domains_redirect import entries, rules
+from domains.domains_redirects import PARAMETER
+
+MAX_CHANGES = 50
+
+def targets(specs = SPECS):
+    shared = {}
+    for spec in specs:
+        for distribution in spec.distributions:
+            if distribution.redirect is None or distribution.redirect.rules is None:
+                continue
+            table = entries(rules(distribution.redirect.rules), distribution.domain_names)
+            if distribution in spec.shared:
+                shared.update(table)
+            if distribution in spec.consolidated:
+                continue
+            if table:
+                yield spec.parameter_name+'/'+distribution.prefix+'redirects', table
+    if shared:
+        yield PARAMETER, shared
+
+def current(client, arn):
+    found = {}
+    token = None
+    while True:
+        options = {'KvsARN': arn, 'MaxResults': 50}
+        if token:
+            options['NextToken'] = token
+        response = client.list_keys(**options)
+        for item in response.get('Items', []):
+            found[item['Key']] = item['Value']
+        token = response.get('NextToken')
+        if not token:
+            return found
+
+def changes(live, desired):
+    puts = [{'Key': key, 'Value': value} for key, value in sorted(desired.items()) if live.get(key) != value]
+    deletes = [{'Key': key} for key in sorted(live) if key not in desired]
+    return puts, deletes
+
+def update(client, arn, puts, deletes):
+    etag = client.describe_key_value_store(KvsARN = arn)['ETag']
+    pending = [('put', item) for item in puts] + [('delete', item) for item in deletes]
+    for start in range(0, len(pending), MAX_CHANGES):
+        batch = pending[start:start+MAX_CHANGES]
+        etag = client.update_keys(
+            KvsARN = arn,
+            IfMatch = etag,
+            Puts = [item for action, item in batch if action == 'put'],
+            Deletes = [item for action, item in batch if action == 'delete']
+        )['ETag']
+
+def sync(dry_run = False):
+    import boto3
+    ssm = boto3.client('ssm')
+    client = boto3.client('cloudfront-keyvaluestore')
+    for parameter, desired in targets():
+        arn = ssm.get_parameter(Name = parameter)['Parameter']['Value']
+        puts, deletes = changes(current(client, arn), desired)
+        print(format(parameter, '<40')+format(len(desired), '>8')+' rules'+format(len(puts), '>6')+' puts'+format(len(deletes), '>6')+' deletes')
+        if not dry_run and (puts or deletes):
+            update(client, arn, puts, deletes)
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Sync redirect rules into CloudFront KeyValueStores')
+    parser.add_argument('action', choices = ['check', 'sync'])
+    parser.add_argument('--dry-run', action = 'store_true', help = 'report changes without applying them')
+    args = parser.parse_args()
+
+    if args.action == 'check':
+        for parameter, desired in targets():
+            print(format(parameter, '<40')+format(len(desired), '>8')+' rules')
+        return 0
+
+    sync(args.dry_run)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
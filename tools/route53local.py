@@ -0,0 +1,80 @@
+import copy
+import itertools
+
+OPERATIONS = ('change_resource_record_sets', 'get_change', 'get_paginator')
+
+PAGINATORS = ('list_resource_record_sets',)
+
+class InvalidChangeBatch(Exception):
+    pass
+
+class UnsupportedOperation(Exception):
+    pass
+
+class Paginator:
+
+    def __init__(self, route53, page_size):
+        self.route53 = route53
+        self.page_size = page_size
+
+    def paginate(self, HostedZoneId):
+        rrsets = [copy.deepcopy(rrset) for _, rrset in sorted(self.route53.zones[HostedZoneId].items())]
+        for start in range(0, max(len(rrsets), 1), self.page_size):
+            yield {'ResourceRecordSets': rrsets[start:start+self.page_size]}
+
+class LocalRoute53:
+
+    def __init__(self, zones = None, page_size = 300):
+        self.zones = {zone_id: {} for zone_id in zones or []}
+        self.page_size = page_size
+        self.calls = []
+        self.changes = {}
+        self.polls = []
+        self.counter = itertools.count(1)
+
+    def add(self, zone_id, rrset):
+        self.zones.setdefault(zone_id, {})[(rrset['Name'], rrset['Type'])] = copy.deepcopy(rrset)
+
+    def __getattr__(self, operation):
+        if operation.startswith('_'):
+            raise AttributeError(operation)
+        raise UnsupportedOperation('LocalRoute53 supports only '+', '.join(OPERATIONS)+', not '+operation)
+
+    def get_paginator(self, operation):
+        if operation not in PAGINATORS:
+            raise UnsupportedOperation('LocalRoute53 paginates only '+', '.join(PAGINATORS)+', not '+operation)
+        return Paginator(self, self.page_size)
+
+    def get_change(self, Id):
+        self.polls.append(Id)
+        status = self.changes[Id]
+        self.changes[Id] = 'INSYNC'
+        return {'ChangeInfo': {'Id': Id, 'Status': status}}
+
+    def change_resource_record_sets(self, HostedZoneId, ChangeBatch):
+        changes = ChangeBatch['Changes']
+        values = sum(
+            (2 if change['Action'] == 'UPSERT' else 1) * max(len(change['ResourceRecordSet'].get('ResourceRecords', [])), 1)
+            for change in changes
+        )
+        if values > 1000:
+            raise InvalidChangeBatch('Too many ResourceRecord elements: '+str(values))
+        zone = copy.deepcopy(self.zones[HostedZoneId])
+        for change in changes:
+            rrset = change['ResourceRecordSet']
+            key = (rrset['Name'], rrset['Type'])
+            if change['Action'] == 'DELETE':
+                if zone.get(key) != rrset:
+                    raise InvalidChangeBatch('Tried to delete resource record set '+rrset['Name']+' but it was not found')
+                del zone[key]
+            elif change['Action'] == 'CREATE':
+                if key in zone:
+                    raise InvalidChangeBatch('Tried to create resource record set '+rrset['Name']+' but it already exists')
+                zone[key] = copy.deepcopy(rrset)
+            else:
+                zone[key] = copy.deepcopy(rrset)
+        self.zones[HostedZoneId] = zone
+        self.calls.append(changes)
+        change_id = '/change/C'+str(next(self.counter))
+        self.changes[change_id] = 'PENDING'
+        return {'ChangeInfo': {'Id': change_id, 'Status': 'PENDING'}}
@@ -0,0 +1,166 @@
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+
+from importlib import metadata
+
+INPUTS = [
+    'app.py',
+    'cdk.json',
+    'requirements.txt',
+    'domains',
+    'redirect',
+    'whoami',
+    'negotiate',
+    'records',
+    'archive',
+    'sketches',
+    'upload',
+    'cache'
+]
+
+ENVIRONMENT = [
+    'CDK_DEFAULT_ACCOUNT',
+    'CDK_DEFAULT_REGION',
+    'DOMAINS_STACKS'
+]
+
+def files(path):
+    if os.path.isfile(path):
+        yield path
+        return
+    for root, dirs, names in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+        for name in sorted(names):
+            yield os.path.join(root, name)
+
+def digest(path):
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1048576), b''):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+def version(package):
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return None
+
+def context(root):
+    values = {}
+    if os.path.exists(os.path.join(root, 'cdk.context.json')):
+        with open(os.path.join(root, 'cdk.context.json')) as f:
+            values.update(json.load(f))
+    if os.getenv('CDK_CONTEXT_JSON'):
+        values.update(json.loads(os.getenv('CDK_CONTEXT_JSON')))
+    return values
+
+def key(root = '.'):
+    sha256 = hashlib.sha256()
+    for item in INPUTS:
+        path = os.path.join(root, item)
+        if not os.path.exists(path):
+            continue
+        for name in files(path):
+            sha256.update(os.path.relpath(name, root).encode())
+            sha256.update(b'\0')
+            sha256.update(digest(name).encode())
+            sha256.update(b'\0')
+    sha256.update(
+        json.dumps(
+            {
+                'aws-cdk-lib': version('aws-cdk-lib'),
+                'constructs': version('constructs'),
+                'context': context(root),
+                'environment': {name: os.getenv(name) for name in ENVIRONMENT}
+            },
+            sort_keys = True
+        ).encode()
+    )
+    return sha256.hexdigest()
+
+def templates(outdir):
+    with open(os.path.join(outdir, 'manifest.json')) as f:
+        manifest = json.load(f)
+    hashes = {}
+    for name, artifact in manifest.get('artifacts', {}).items():
+        if artifact.get('type') != 'aws:cloudformation:stack':
+            continue
+        template = artifact['properties']['templateFile']
+        hashes[name] = digest(os.path.join(outdir, template))
+    return hashes
+
+def load(outdir):
+    path = os.path.join(outdir, 'synth.json')
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def valid(state, outdir):
+    if not state.get('templates'):
+        return False
+    try:
+        return templates(outdir) == state['templates']
+    except (OSError, KeyError, ValueError):
+        return False
+
+def save(outdir, state):
+    with open(os.path.join(outdir, 'synth.json'), 'w') as f:
+        json.dump(state, f, indent = 2)
+
+def synth(outdir, command):
+    subprocess.run(command + ['--output', outdir], check = True)
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Content-addressed cloud assembly cache')
+    parser.add_argument('action', nargs = '?', choices = ['synth', 'key'], default = 'synth')
+    parser.add_argument('--output', default = 'cdk.out')
+    parser.add_argument('--check', action = 'store_true', help = 'exit 1 on a cache miss without synthesizing')
+    parser.add_argument('--command', default = 'cdk synth --quiet')
+    args = parser.parse_args()
+
+    current = key()
+
+    if args.action == 'key':
+        print(current)
+        return 0
+
+    state = load(args.output)
+
+    if state.get('key') == current and valid(state, args.output):
+        print('synth cache hit '+current)
+        save(args.output, {**state, 'changed': []})
+        return 0
+
+    if args.check:
+        print('synth cache miss '+current)
+        return 1
+
+    print('synth cache miss '+current)
+    synth(args.output, args.command.split())
+
+    hashes = templates(args.output)
+    previous = state.get('templates', {})
+    changed = sorted(name for name, value in hashes.items() if previous.get(name) != value)
+
+    save(
+        args.output,
+        {
+            'key': current,
+            'templates': hashes,
+            'changed': changed
+        }
+    )
+
+    for name in changed:
+        print('changed '+name)
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,158 @@
+import argparse
+import gzip
+import json
+import statistics
+import sys
+
+from collections import Counter, defaultdict
+
+from domains.domains_config import SPECS
+from domains.domains_ttl import OVERRIDES, key, overrides
+from domains.domains_zonefile import DEFAULT_TTL, qualify
+from tools.querylog import epoch, files, read
+
+LADDER = (60, 300, 900, 3600, 14400, 43200, 86400)
+
+MINIMUM_RATE = 1 / 3600
+
+PRICE = 0.40 / 1000000
+
+def managed(specs):
+    records = {}
+    for spec in specs:
+        for record in spec.records:
+            name = qualify(record.name, spec.zone)
+            records[(name, record.type)] = {
+                'zone': spec.zone,
+                'ttl': record.ttl if record.ttl is not None else DEFAULT_TTL
+            }
+    return records
+
+def changes(paths):
+    found = defaultdict(list)
+    for path in files(paths):
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rt') as f:
+            document = json.load(f)
+        for event in document.get('Records', document if isinstance(document, list) else []):
+            if event.get('eventName') != 'ChangeResourceRecordSets' or event.get('errorCode'):
+                continue
+            batch = (event.get('requestParameters') or {}).get('changeBatch') or {}
+            for change in batch.get('changes', []):
+                rrset = change.get('resourceRecordSet', {})
+                name = rrset.get('name', '').lower().rstrip('.')
+                found[(name, rrset.get('type'))].append(epoch(event['eventTime']))
+    return found
+
+def usage(queries, records):
+    stats = {}
+    first = None
+    last = None
+    for query in queries:
+        first = query.timestamp if first is None else min(first, query.timestamp)
+        last = query.timestamp if last is None else max(last, query.timestamp)
+        name = (query.qname, query.qtype)
+        if name not in records:
+            name = (query.qname, 'CNAME')
+        if name not in records:
+            continue
+        if name not in stats:
+            stats[name] = Counter()
+        stats[name][query.resolver] += 1
+    window = max((last or 0) - (first or 0), 1)
+    return stats, window
+
+def cap(times):
+    times = sorted(times)
+    if len(times) < 2:
+        return LADDER[-1]
+    return statistics.median(b - a for a, b in zip(times, times[1:])) / 4
+
+def propose(current, rate, limit):
+    candidate = max([ttl for ttl in LADDER if ttl <= limit] or [LADDER[0]])
+    if candidate > current and rate < MINIMUM_RATE:
+        return current
+    return candidate
+
+def project(resolvers, current, proposed):
+    return sum(max(1.0, count * current / proposed) if count else 0.0 for count in resolvers.values())
+
+def analyze(queries, history, specs = SPECS):
+    records = managed(specs)
+    stats, window = usage(queries, records)
+    results = []
+    for (name, record_type), record in sorted(records.items()):
+        resolvers = stats.get((name, record_type), Counter())
+        count = sum(resolvers.values())
+        rate = count / window
+        limit = cap(history.get((name, record_type), []))
+        proposed = propose(record['ttl'], rate, limit)
+        projected = project(resolvers, record['ttl'], proposed)
+        results.append(
+            {
+                'zone': record['zone'],
+                'name': name,
+                'type': record_type,
+                'queries': count,
+                'resolvers': len(resolvers),
+                'qps': rate,
+                'changes': len(history.get((name, record_type), [])),
+                'current': record['ttl'],
+                'proposed': proposed,
+                'projected': projected,
+                'savings': (count - projected) * PRICE
+            }
+        )
+    return results
+
+def write(results, path):
+    values = overrides(path)
+    names = defaultdict(set)
+    for result in results:
+        zone = values.setdefault(result['zone'], {})
+        name = key(result['name'], result['type'])
+        names[result['zone']].add(name)
+        if result['proposed'] != result['current']:
+            zone[name] = result['proposed']
+    values = {
+        zone: {name: ttl for name, ttl in items.items() if name in names[zone]}
+        for zone, items in values.items()
+    }
+    values = {zone: items for zone, items in values.items() if items}
+    with open(path, 'w') as f:
+        json.dump(values, f, indent = 2, sort_keys = True)
+        f.write('\n')
+
+def main():
+    parser = argparse.ArgumentParser(description = 'Propose record TTLs from Route 53 query logs')
+    parser.add_argument('logs', nargs = '+', help = 'query log files or directories, plain or gzip')
+    parser.add_argument('--changes', nargs = '*', default = [], help = 'CloudTrail log files with ChangeResourceRecordSets events')
+    parser.add_argument('--json', help = 'write the analysis as JSON')
+    parser.add_argument('--write', action = 'store_true', help = 'store proposals in '+OVERRIDES)
+    args = parser.parse_args()
+
+    results = analyze(read(args.logs), changes(args.changes))
+
+    print(format('name', '<40')+format('type', '<7')+format('queries', '>10')+format('qps', '>10')+format('ttl', '>8')+format('proposed', '>10')+format('savings', '>10'))
+    for result in results:
+        print(
+            format(result['name'], '<40') +
+            format(result['type'], '<7') +
+            format(result['queries'], '>10') +
+            format(result['qps'], '>10.4f') +
+            format(result['current'], '>8') +
+            format(result['proposed'], '>10') +
+            format(result['savings'], '>10.4f')
+        )
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent = 2)
+
+    if args.write:
+        write(results, OVERRIDES)
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
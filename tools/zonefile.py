@@ -0,0 +1,52 @@
+import argparse
+import collections
+import sys
+
+from domains.domains_config import SPECS
+from domains.domains_zonefile import dump, load, verify
+
+def lookup(name):
+    for spec in SPECS:
+        if name in (spec.stack, spec.zone):
+            return spec
+    raise SystemExit('Unknown domain: '+name)
+
+def main():
+    parser = argparse.ArgumentParser(description = 'BIND zone file import and export')
+    commands = parser.add_subparsers(dest = 'command', required = True)
+
+    command = commands.add_parser('import', help = 'parse a zone file and print the record specs')
+    command.add_argument('path')
+    command.add_argument('--zone', required = True)
+
+    command = commands.add_parser('export', help = 'write a domain spec as a zone file')
+    command.add_argument('domain')
+
+    command = commands.add_parser('verify', help = 'round trip every domain spec through a zone file')
+
+    args = parser.parse_args()
+
+    if args.command == 'import':
+        counts = collections.Counter()
+        print('records = (')
+        with open(args.path) as f:
+            for record in load(f, args.zone):
+                print('    '+repr(record)+',')
+                counts[record.type] += 1
+        print(')')
+        for record_type, count in sorted(counts.items()):
+            print(format(record_type, '<8')+str(count), file = sys.stderr)
+        print(format('total', '<8')+str(sum(counts.values())), file = sys.stderr)
+        return 0
+
+    if args.command == 'export':
+        sys.stdout.writelines(dump(lookup(args.domain)))
+        return 0
+
+    failures = [spec.zone for spec in SPECS if not verify(spec)]
+    for spec in SPECS:
+        print(format(spec.zone, '<16')+('failed' if spec.zone in failures else 'ok'))
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,178 @@
+import json
+import os
+import threading
+import time
+import zipfile
+
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+
+MANIFEST = 'manifest.json'
+
+LEGACY = '.deployment.json'
+
+MAX_DELETES = 1000
+MAX_PATHS = 1000
+
+def load(client, bucket, key):
+    try:
+        body = client.get_object(Bucket = bucket, Key = key)['Body'].read()
+    except client.exceptions.NoSuchKey:
+        return None
+    return json.loads(body)
+
+def state_key(bucket):
+    return bucket+'.json'
+
+def state(entries):
+    return {
+        entry['key']: {
+            'digest': entry['digest'],
+            'content_type': entry['content_type'],
+            'cache_control': entry['cache_control']
+        }
+        for entry in entries
+    }
+
+def diff(previous, current):
+    changed = [key for key, value in current.items() if previous.get(key) != value]
+    stale = [key for key in previous if key not in current]
+    return changed, stale
+
+def put(client, archive, bucket, entry):
+    options = {
+        'Bucket': bucket,
+        'Key': entry['key'],
+        'Body': archive.read(entry['digest']),
+        'ContentType': entry['content_type'],
+        'Metadata': {'digest': entry['digest']}
+    }
+    if entry['cache_control']:
+        options['CacheControl'] = entry['cache_control']
+    client.put_object(**options)
+    return entry['key']
+
+def upload(client, path, bucket, entries, concurrency):
+    local = threading.local()
+    opened = []
+    lock = threading.Lock()
+    def archive():
+        if not hasattr(local, 'archive'):
+            local.archive = zipfile.ZipFile(path)
+            with lock:
+                opened.append(local.archive)
+        return local.archive
+    try:
+        with ThreadPoolExecutor(max_workers = concurrency) as executor:
+            return list(executor.map(lambda entry: put(client, archive(), bucket, entry), entries))
+    finally:
+        for item in opened:
+            item.close()
+
+def delete(client, bucket, keys):
+    for start in range(0, len(keys), MAX_DELETES):
+        client.delete_objects(
+            Bucket = bucket,
+            Delete = {
+                'Objects': [{'Key': key} for key in keys[start:start+MAX_DELETES]],
+                'Quiet': True
+            }
+        )
+
+def paths(keys):
+    items = sorted('/'+key for key in keys)
+    if len(items) > MAX_PATHS:
+        return ['/*']
+    return items
+
+def invalidate(client, distribution_id, keys):
+    items = paths(keys)
+    if not items:
+        return 0
+    client.create_invalidation(
+        DistributionId = distribution_id,
+        InvalidationBatch = {
+            'Paths': {'Quantity': len(items), 'Items': items},
+            'CallerReference': str(time.time_ns())
+        }
+    )
+    return len(items)
+
+def sync(client, store, state_bucket, path, bucket, entries, prune, concurrency):
+
+    previous = load(store, state_bucket, state_key(bucket)) or {}
+    current = state(entries)
+
+    changed, stale = diff(previous, current)
+    wanted = set(changed)
+
+    uploaded = upload(
+        client,
+        path,
+        bucket,
+        [entry for entry in entries if entry['key'] in wanted],
+        concurrency
+    )
+
+    deleted = []
+    if prune:
+        delete(client, bucket, stale)
+        deleted = stale
+    else:
+        for key in stale:
+            current[key] = previous[key]
+
+    store.put_object(
+        Bucket = state_bucket,
+        Key = state_key(bucket),
+        Body = json.dumps(current, indent = 2, sort_keys = True).encode(),
+        ContentType = 'application/json'
+    )
+
+    if LEGACY not in current:
+        client.delete_object(Bucket = bucket, Key = LEGACY)
+
+    print('Uploaded '+str(len(uploaded))+', deleted '+str(len(deleted))+' in '+bucket)
+
+    return [key for key in uploaded if key in previous] + deleted, len(uploaded), len(deleted)
+
+def handler(event, context):
+
+    properties = event['ResourceProperties']
+    bucket = properties['Bucket']
+    physical = bucket+'-'+event['LogicalResourceId']
+
+    if event['RequestType'] == 'Delete':
+        return {'PhysicalResourceId': physical}
+
+    client = boto3.client('s3')
+
+    path = os.path.join('/tmp', os.path.basename(properties['Archive']))
+    client.download_file(properties['SourceBucket'], properties['Archive'], path)
+
+    with zipfile.ZipFile(path) as archive:
+        entries = json.loads(archive.read(MANIFEST))
+
+    prune = properties.get('Prune') == 'true'
+    concurrency = int(properties.get('Concurrency', '16'))
+
+    try:
+        replaced, uploaded, deleted = sync(client, client, properties['StateBucket'], path, bucket, entries, prune, concurrency)
+    finally:
+        os.remove(path)
+
+    invalidated = 0
+    if properties.get('DistributionId'):
+        invalidated = invalidate(boto3.client('cloudfront'), properties['DistributionId'], replaced)
+
+    print('Invalidated '+str(invalidated)+' paths')
+
+    return {
+        'PhysicalResourceId': physical,
+        'Data': {
+            'Uploaded': uploaded,
+            'Deleted': deleted,
+            'Invalidated': invalidated
+        }
+    }
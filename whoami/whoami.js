@@ -1,11 +1,51 @@
+const fields = {
+  'country': 'cloudfront-viewer-country',
+  'region': 'cloudfront-viewer-country-region',
+  'city': 'cloudfront-viewer-city',
+  'timeZone': 'cloudfront-viewer-time-zone',
+  'asn': 'cloudfront-viewer-asn',
+  'tls': 'cloudfront-viewer-tls',
+  'http': 'cloudfront-viewer-http-version'
+};
+
+function header(headers, name) {
+  return headers[name] ? headers[name].value : null;
+}
+
+function wantsJson(request) {
+  if (request.uri === '/json') {
+    return true;
+  }
+  if (request.querystring['format'] && request.querystring['format'].value === 'json') {
+    return true;
+  }
+  const accept = header(request.headers, 'accept');
+  return accept !== null && accept.indexOf('application/json') !== -1;
+}
+
 function handler(event) {
+  const request = event.request;
+  let body = event.viewer.ip;
+  let type = 'text/plain';
+  if (wantsJson(request)) {
+    const found = {ip: event.viewer.ip};
+    for (const key in fields) {
+      const value = header(request.headers, fields[key]);
+      if (value !== null) {
+        found[key] = key === 'asn' ? parseInt(value, 10) : value;
+      }
+    }
+    body = JSON.stringify(found);
+    type = 'application/json';
+  }
   const response = {
     statusCode: 200,
     statusDescription: 'OK',
-    body: event.viewer.ip,
+    body: body,
     headers: {
-      'content-type': {value: 'text/html'},
+      'content-type': {value: type},
+      'cache-control': {value: 'no-store'}
     }
   };
   return response;
-}
\ No newline at end of file
+}